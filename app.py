@@ -1,14 +1,20 @@
 import importlib
 
 from flask import Flask, jsonify
-from flask.json.provider import DefaultJSONProvider
 from werkzeug.exceptions import HTTPException
 
 from src.blueprints.routes import register_routes
+from src.configs.cache_config import init_cache
+from src.configs.compression_config import init_compression
+from src.configs.json_config import init_json
 from src.configs.logger_config import setup_logger
+from src.configs.metrics_config import init_metrics
 from src.configs.mongo_config import init_mongo
 from src.constants.codes import CODE_ERROR_INTERNAL_SERVER, CODE_NOT_FOUND_ROUTE
 from src.constants.messages import MESSAGE_ERROR_INTERNAL_SERVER, MESSAGE_NOT_FOUND_ROUTE
+from src.services.note_watcher import init_note_watcher, note_watcher
+from src.services.readiness_probe import init_readiness_probe
+from src.startup.init_indexes import create_indexes
 from src.startup.init_notes import add_default_notes
 from src.utils.exceptions import BaseAPIError
 
@@ -22,12 +28,14 @@ def create_app(config_name="development") -> Flask:
         raise ValueError(f"Invalid config_name: {config_name!r}. Allowed values are: {sorted(ALLOWED_CONFIGS)}")
 
     app = Flask(__name__)
-    if isinstance(app.json, DefaultJSONProvider):
-        app.json.ensure_ascii = False
 
     config_module = importlib.import_module(f"src.configs.{config_name}_config")
     app.config.from_object(config_module.__dict__[f"{config_name.capitalize()}Config"])
 
+    init_json(app)
+    init_compression(app)
+    init_metrics(app)
+
     @app.errorhandler(BaseAPIError)
     def handle_api_error(error: BaseAPIError):
         return error.flask_response()
@@ -57,6 +65,18 @@ def create_app(config_name="development") -> Flask:
     init_mongo(app)
     logger.info("MongoDB initialized successfully.")
 
+    init_cache(app)
+    logger.info("Notes cache initialized successfully.")
+
+    init_note_watcher(app)
+    logger.info("Notes watcher initialized successfully.")
+
+    init_readiness_probe(app)
+    logger.info("Readiness probe initialized successfully.")
+
+    if create_indexes():
+        logger.info("MongoDB indexes initialized successfully.")
+
     register_routes(app)
     logger.info("Routes initialized successfully.")
 
@@ -69,6 +89,7 @@ def create_app(config_name="development") -> Flask:
 
 if __name__ == "__main__":
     app = create_app("development")
+    note_watcher.start()
 
     logger.info("Starting Flask application.")
     app.run(host=app.config["HOST"], port=app.config["PORT"], debug=app.config["DEBUG"])
@@ -0,0 +1,238 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+from flask import Flask
+from flask.testing import FlaskClient
+from werkzeug.test import TestResponse
+
+BACKENDS = ("mongomock", "mongod")
+
+Request = Callable[[], TestResponse]
+
+
+def build_app(backend: str, db_name: str, cache: bool) -> Flask:
+    # DefaultConfig reads the environment when it is imported, so these must be set before create_app is imported.
+    os.environ["MONGO_DB_NAME"] = db_name
+    os.environ["NOTES_CACHE_ENABLED"] = "true" if cache else "false"
+    os.environ["NOTES_CACHE_WATCH_ENABLED"] = "false"
+
+    from app import create_app
+
+    if backend == "mongod":
+        return create_app("production")
+
+    import mongomock
+
+    with patch("src.configs.mongo_config.MongoClient", mongomock.MongoClient):
+        return create_app("production")
+
+
+def notes_collection() -> Any:
+    from src.configs.mongo_config import mongo
+
+    return mongo.db.notes
+
+
+def seed_notes(count: int, prefix: str) -> list[str]:
+    if count == 0:
+        return []
+    result = notes_collection().insert_many([{"name": f"{prefix}-{index}"} for index in range(count)])
+    return [str(_id) for _id in result.inserted_ids]
+
+
+def reset_notes() -> None:
+    notes_collection().delete_many({})
+
+
+def drop_database(db_name: str) -> None:
+    from src.configs.mongo_config import mongo
+
+    mongo.client.drop_database(db_name)  # type: ignore[union-attr]
+
+
+def create_note_request(client: FlaskClient) -> Request:
+    names = itertools.count()
+    return lambda: client.post("/api/v1/notes/", json={"name": f"benchmark-{next(names)}"})
+
+
+def get_notes_request(client: FlaskClient, limit: int) -> Request:
+    return lambda: client.get(f"/api/v1/notes/?limit={limit}")
+
+
+def delete_note_request(client: FlaskClient, ids: list[str]) -> Request:
+    remaining = iter(ids)
+    return lambda: client.delete(f"/api/v1/notes/{next(remaining)}")
+
+
+def percentile(quantiles: list[float], q: int) -> float:
+    return round(quantiles[q - 1] * 1000, 3)
+
+
+def measure(request: Request, requests: int, warmup: int, allocation_samples: int) -> dict[str, Any]:
+    for _ in range(warmup):
+        request()
+
+    latencies: list[float] = []
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(requests):
+        request_started = time.perf_counter()
+        response = request()
+        latencies.append(time.perf_counter() - request_started)
+        errors += response.status_code >= 400
+    elapsed = time.perf_counter() - started
+
+    # Allocations are traced in a separate pass because tracemalloc slows every allocation down.
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    peaks: list[int] = []
+    for _ in range(allocation_samples):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        request()
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": requests,
+        "errors": errors,
+        "requests_per_second": round(requests / elapsed, 1),
+        "p50_ms": percentile(quantiles, 50),
+        "p95_ms": percentile(quantiles, 95),
+        "p99_ms": percentile(quantiles, 99),
+        "peak_alloc_kib_per_request": round(statistics.median(peaks) / 1024, 1) if peaks else None,
+        "retained_kib_per_request": round(retained / max(allocation_samples, 1) / 1024, 2),
+    }
+
+
+def run(app: Flask, args: argparse.Namespace) -> list[dict[str, Any]]:
+    client = app.test_client()
+    calls = args.warmup + args.requests + args.allocation_samples
+    results: list[dict[str, Any]] = []
+
+    reset_notes()
+    results.append(
+        {
+            "operation": "create_note",
+            "collection_size": 0,
+            **measure(create_note_request(client), args.requests, args.warmup, args.allocation_samples),
+        }
+    )
+
+    for size in args.sizes:
+        reset_notes()
+        seed_notes(size, f"seed-{size}")
+        results.append(
+            {
+                "operation": "get_notes",
+                "collection_size": size,
+                "limit": args.limit,
+                **measure(get_notes_request(client, args.limit), args.requests, args.warmup, args.allocation_samples),
+            }
+        )
+
+    reset_notes()
+    ids = seed_notes(calls, "delete")
+    results.append(
+        {
+            "operation": "delete_note",
+            "collection_size": calls,
+            **measure(delete_note_request(client, ids), args.requests, args.warmup, args.allocation_samples),
+        }
+    )
+    return results
+
+
+def result_key(result: dict[str, Any]) -> tuple[str, int]:
+    return result["operation"], result["collection_size"]
+
+
+def compare(current: list[dict[str, Any]], baseline_path: str, max_regression: float) -> bool:
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = {result_key(result): result for result in json.load(file)["results"]}
+
+    ok = True
+    for result in current:
+        previous = baseline.get(result_key(result))
+        if previous is None:
+            continue
+        change = (result["p50_ms"] - previous["p50_ms"]) / previous["p50_ms"] if previous["p50_ms"] else 0.0
+        regressed = change > max_regression
+        ok = ok and not regressed
+        print(
+            f"{result['operation']:<12} size={result['collection_size']:<7} "
+            f"p50 {previous['p50_ms']:.3f} -> {result['p50_ms']:.3f} ms ({change:+.1%})"
+            f"{'  REGRESSION' if regressed else ''}",
+            file=sys.stderr,
+        )
+    return ok
+
+
+def git_commit() -> str | None:
+    try:
+        completed = subprocess.run(  # noqa: S603
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Drive create_note, get_notes and delete_note through the WSGI app and report latency as JSON."
+    )
+    parser.add_argument("--backend", choices=BACKENDS, default="mongomock")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1_000, 10_000])
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--allocation-samples", type=int, default=50)
+    parser.add_argument("--cache", action="store_true", help="Keep the in-process notes cache enabled.")
+    parser.add_argument("--db-name", default="notes_benchmark")
+    parser.add_argument("--output", help="Also write the JSON report to this file.")
+    parser.add_argument("--compare", help="Baseline JSON report to compare p50 latencies against.")
+    parser.add_argument("--max-regression", type=float, default=0.10)
+    args = parser.parse_args()
+
+    app = build_app(args.backend, args.db_name, args.cache)
+    try:
+        results = run(app, args)
+    finally:
+        drop_database(args.db_name)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "backend": args.backend,
+        "cache": args.cache,
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    if args.compare and not compare(report["results"], args.compare, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
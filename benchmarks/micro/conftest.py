@@ -0,0 +1,22 @@
+from collections.abc import Generator
+
+import bson
+import pytest
+from bson import ObjectId
+from flask import Flask
+
+from src.configs.json_config import init_json
+
+
+@pytest.fixture(scope="session", params=["orjson", "stdlib"])
+def app(request: pytest.FixtureRequest) -> Generator[Flask, None, None]:
+    flask_app = Flask(__name__)
+    flask_app.config["JSON_PROVIDER"] = request.param
+    init_json(flask_app)
+
+    with flask_app.app_context():
+        yield flask_app
+
+
+def make_batch(size: int) -> bytes:
+    return b"".join(bson.encode({"_id": ObjectId(), "name": f"benchmark note {index}"}) for index in range(size))
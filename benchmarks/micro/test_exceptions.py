@@ -0,0 +1,28 @@
+from flask import Flask
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from src.constants.codes import CODE_NOT_FOUND_NOTE, CODE_NOT_VALID_FIELDS
+from src.constants.messages import MESSAGE_NOT_FOUND_NOTE, MESSAGE_NOT_VALID_FIELDS
+from src.utils.exceptions import NotFoundAPIError, ValidationAPIError
+
+
+def test_to_dict(benchmark: BenchmarkFixture) -> None:
+    error = NotFoundAPIError(code=CODE_NOT_FOUND_NOTE, message=MESSAGE_NOT_FOUND_NOTE)
+
+    assert benchmark(error.to_dict) == {"code": CODE_NOT_FOUND_NOTE, "message": MESSAGE_NOT_FOUND_NOTE}
+
+
+def test_to_dict_with_payload(benchmark: BenchmarkFixture) -> None:
+    error = ValidationAPIError(
+        code=CODE_NOT_VALID_FIELDS, message=MESSAGE_NOT_VALID_FIELDS, payload={"allowed": ["_id", "name"]}
+    )
+
+    assert benchmark(error.to_dict)["payload"] == {"allowed": ["_id", "name"]}
+
+
+def test_flask_response(benchmark: BenchmarkFixture, app: Flask) -> None:
+    error = NotFoundAPIError(code=CODE_NOT_FOUND_NOTE, message=MESSAGE_NOT_FOUND_NOTE)
+
+    response, status_code = benchmark(error.flask_response)
+
+    assert status_code == 404
@@ -0,0 +1,80 @@
+import contextlib
+import logging
+import os
+from collections.abc import Callable, Generator
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from src.constants.codes import CODE_NOT_FOUND_NOTE
+from src.constants.messages import MESSAGE_NOT_FOUND_NOTE
+from src.models.note_model import NoteModel
+from src.utils.exceptions import BaseAPIError, NotFoundAPIError, ValidationAPIError
+from src.utils.exceptions_decorator import exceptions_decorator, logger
+
+
+@pytest.fixture(autouse=True)
+def devnull_logs(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    # Records are still built and formatted, but written to os.devnull so the terminal does not skew the timings.
+    monkeypatch.setattr(logger, "propagate", False)
+    handlers = [handler for handler in logger.handlers if isinstance(handler, logging.StreamHandler)]
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        streams = [handler.stream for handler in handlers]
+        for handler in handlers:
+            handler.setStream(devnull)
+        yield
+        for handler, stream in zip(handlers, streams, strict=True):
+            handler.setStream(stream)
+
+
+def succeed() -> dict[str, str]:
+    return {"name": "benchmark note"}
+
+
+def raise_not_found() -> None:
+    raise NotFoundAPIError(code=CODE_NOT_FOUND_NOTE, message=MESSAGE_NOT_FOUND_NOTE)
+
+
+def raise_validation_error() -> None:
+    NoteModel(name="")
+
+
+def raise_value_error() -> None:
+    raise ValueError("benchmark")
+
+
+def call_and_catch(fn: Callable[[], Any], error: type[BaseAPIError]) -> Callable[[], None]:
+    def call() -> None:
+        with contextlib.suppress(error):
+            fn()
+
+    return call
+
+
+def test_undecorated(benchmark: BenchmarkFixture) -> None:
+    assert benchmark(succeed) == {"name": "benchmark note"}
+
+
+def test_decorated_success(benchmark: BenchmarkFixture) -> None:
+    assert benchmark(exceptions_decorator(succeed)) == {"name": "benchmark note"}
+
+
+def test_undecorated_api_error(benchmark: BenchmarkFixture) -> None:
+    benchmark(call_and_catch(raise_not_found, NotFoundAPIError))
+
+
+def test_decorated_api_error(benchmark: BenchmarkFixture) -> None:
+    benchmark(call_and_catch(exceptions_decorator(raise_not_found), NotFoundAPIError))
+
+
+def test_decorated_validation_error(benchmark: BenchmarkFixture) -> None:
+    with pytest.raises(ValidationError):
+        raise_validation_error()
+
+    benchmark(call_and_catch(exceptions_decorator(raise_validation_error), ValidationAPIError))
+
+
+def test_decorated_unexpected_error(benchmark: BenchmarkFixture) -> None:
+    benchmark(call_and_catch(exceptions_decorator(raise_value_error), BaseAPIError))
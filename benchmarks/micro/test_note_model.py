@@ -0,0 +1,39 @@
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from src.models.note_model import NoteBulkModel, NoteModel
+
+
+def test_note_model(benchmark: BenchmarkFixture) -> None:
+    data = {"name": "  benchmark note  "}
+
+    note = benchmark(lambda: NoteModel(**data))
+
+    assert note.name == "benchmark note"
+
+
+def test_note_model_invalid(benchmark: BenchmarkFixture) -> None:
+    data: dict[str, Any] = {"name": "", "extra": True}
+
+    def validate() -> None:
+        with pytest.raises(ValidationError):
+            NoteModel(**data)
+
+    benchmark(validate)
+
+
+def test_note_model_dump(benchmark: BenchmarkFixture) -> None:
+    note = NoteModel(name="benchmark note")
+
+    assert benchmark(note.model_dump) == {"name": "benchmark note"}
+
+
+def test_note_bulk_model(benchmark: BenchmarkFixture) -> None:
+    data = [{"name": f"benchmark note {index}"} for index in range(1_000)]
+
+    notes = benchmark(NoteBulkModel.model_validate, data)
+
+    assert len(notes.root) == 1_000
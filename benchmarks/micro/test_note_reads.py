@@ -0,0 +1,40 @@
+from typing import Any
+
+import bson
+import pytest
+from flask import Flask, jsonify
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.micro.conftest import make_batch
+from src.constants.codes import CODE_SUCCESS_GET_NOTES
+from src.constants.messages import MESSAGE_SUCCESS_GET_NOTES
+
+SIZES = [100, 10_000]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_decode_notes_batch(benchmark: BenchmarkFixture, size: int) -> None:
+    batch = make_batch(size)
+
+    notes = benchmark(bson.decode_all, batch)
+
+    assert len(notes) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_notes_page_response(benchmark: BenchmarkFixture, app: Flask, size: int) -> None:
+    notes = bson.decode_all(make_batch(size))
+
+    def respond() -> Any:
+        return jsonify(
+            {
+                "code": CODE_SUCCESS_GET_NOTES,
+                "message": MESSAGE_SUCCESS_GET_NOTES,
+                "data": notes,
+                "next_cursor": None,
+            }
+        )
+
+    response = benchmark(respond)
+
+    assert response.status_code == 200
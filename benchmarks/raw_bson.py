@@ -0,0 +1,71 @@
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+import bson
+from bson import ObjectId, json_util
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from flask import Flask
+
+from src.configs.json_config import JSON_PROVIDERS, init_json
+
+RAW_CODEC_OPTIONS: CodecOptions[RawBSONDocument] = CodecOptions(document_class=RawBSONDocument)
+
+
+def make_batch(size: int) -> bytes:
+    return b"".join(bson.encode({"_id": ObjectId(), "name": f"benchmark note {index}"}) for index in range(size))
+
+
+def best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run_size(app: Flask, size: int, repeat: int) -> dict[str, Any]:
+    batch = make_batch(size)
+
+    paths: dict[str, Callable[[], Any]] = {
+        "dict": lambda: app.json.dumps(bson.decode_all(batch)),
+        # A response needs every field, so each RawBSONDocument is fully decoded before encoding.
+        "raw": lambda: app.json.dumps(
+            [bson.decode(document.raw) for document in bson.decode_all(batch, RAW_CODEC_OPTIONS)]
+        ),
+        "raw_json_util_relaxed": lambda: "\n".join(
+            json_util.dumps(document, json_options=json_util.RELAXED_JSON_OPTIONS)
+            for document in bson.decode_all(batch, RAW_CODEC_OPTIONS)
+        ),
+    }
+
+    results: dict[str, Any] = {"documents": size}
+    for name, fn in paths.items():
+        seconds = best_of(repeat, fn)
+        results[name] = {"seconds": round(seconds, 4), "documents_per_second": round(size / seconds)}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare decoding a notes batch into dicts against RawBSONDocument, both encoded to JSON."
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--provider", default="orjson", choices=sorted(JSON_PROVIDERS))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    app.config["JSON_PROVIDER"] = args.provider
+    init_json(app)
+
+    results = [run_size(app, size, args.repeat) for size in args.sizes]
+    print(json.dumps({"provider": type(app.json).__name__, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
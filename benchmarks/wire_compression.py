@@ -0,0 +1,117 @@
+import argparse
+import json
+import socket
+import statistics
+import threading
+import time
+from typing import Any
+
+from flask import Flask
+
+from src.configs.default_config import DefaultConfig
+from src.configs.mongo_config import mongo, wire_compressors
+from src.data_access.note_dao import NoteDAO
+
+HOST = "127.0.0.1"
+BUFFER_SIZE = 64 * 1024
+
+
+class CountingProxy:
+    def __init__(self, upstream: tuple[str, int]) -> None:
+        self.upstream = upstream
+        self.received = 0
+        self._lock = threading.Lock()
+        self._server = socket.create_server((HOST, 0))
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.received = 0
+
+    def _accept(self) -> None:
+        while True:
+            downstream, _ = self._server.accept()
+            upstream = socket.create_connection(self.upstream)
+            threading.Thread(target=self._pipe, args=(downstream, upstream, False), daemon=True).start()
+            threading.Thread(target=self._pipe, args=(upstream, downstream, True), daemon=True).start()
+
+    def _pipe(self, source: socket.socket, target: socket.socket, count: bool) -> None:
+        try:
+            while data := source.recv(BUFFER_SIZE):
+                if count:
+                    with self._lock:
+                        self.received += len(data)
+                target.sendall(data)
+        except OSError:
+            pass
+        finally:
+            target.close()
+
+
+def run_compressor(proxy: CountingProxy, db_name: str, compressors: str, repeat: int) -> dict[str, Any]:
+    app = Flask(__name__)
+    app.config.update(
+        MONGO_URI=(
+            f"mongodb://{DefaultConfig.MONGO_USER}:{DefaultConfig.MONGO_PASS}@{HOST}:{proxy.port}/{db_name}"
+            f"?authSource={DefaultConfig.MONGO_AUTH_SOURCE}&directConnection=true"
+        ),
+        MONGO_DB_NAME=db_name,
+        MONGO_COMPRESSORS=compressors,
+        MONGO_ZLIB_COMPRESSION_LEVEL=DefaultConfig.MONGO_ZLIB_COMPRESSION_LEVEL,
+    )
+    mongo.init_app(app)
+    NoteDAO.find()
+
+    timings: list[float] = []
+    received: list[int] = []
+    for _ in range(repeat):
+        proxy.reset()
+        started = time.perf_counter()
+        NoteDAO.find()
+        timings.append(time.perf_counter() - started)
+        received.append(proxy.received)
+    mongo.close()
+
+    return {
+        "compressors": compressors or "none",
+        "bytes_received": statistics.median(received),
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "min_ms": round(min(timings) * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare bytes received from MongoDB and NoteDAO.find latency with and without wire compression."
+    )
+    parser.add_argument("--documents", type=int, default=50_000)
+    parser.add_argument("--compressors", nargs="+", default=["", "zlib", "zstd", "snappy"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--db-name", default="notes_wire_benchmark")
+    args = parser.parse_args()
+
+    proxy = CountingProxy((DefaultConfig.MONGO_HOST, DefaultConfig.MONGO_PORT))
+    compressors = [name for name in args.compressors if name == "" or wire_compressors(name)]
+
+    seed = Flask(__name__)
+    seed.config.update(MONGO_URI=DefaultConfig.MONGO_URI, MONGO_DB_NAME=args.db_name)
+    mongo.init_app(seed)
+    mongo.db.notes.drop()
+    mongo.db.notes.insert_many(
+        [{"name": f"benchmark note {index:08d} {'lorem ipsum ' * 4}"} for index in range(args.documents)]
+    )
+    mongo.close()
+
+    try:
+        results = [run_compressor(proxy, args.db_name, name, args.repeat) for name in compressors]
+    finally:
+        mongo.init_app(seed)
+        mongo.client.drop_database(args.db_name)  # type: ignore[union-attr]
+        mongo.close()
+
+    print(json.dumps({"documents": args.documents, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
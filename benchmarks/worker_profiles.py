@@ -0,0 +1,107 @@
+import argparse
+import http.client
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from src.configs.worker_profiles import WORKER_PROFILES
+
+HOST = "127.0.0.1"
+STARTUP_TIMEOUT_SECONDS = 30
+
+
+def wait_until_ready(port: int, path: str) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        connection = http.client.HTTPConnection(HOST, port, timeout=1)
+        try:
+            connection.request("GET", path)
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        finally:
+            connection.close()
+        time.sleep(0.2)
+    raise RuntimeError(f"Gunicorn did not become ready on port {port}")
+
+
+def drive_load(port: int, path: str, concurrency: int, duration: float) -> dict[str, float]:
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def client() -> None:
+        nonlocal errors
+        connection = http.client.HTTPConnection(HOST, port, timeout=10)
+        local_latencies: list[float] = []
+        local_errors = 0
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            try:
+                connection.request("GET", path)
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    local_errors += 1
+            except OSError:
+                local_errors += 1
+                connection.close()
+                connection = http.client.HTTPConnection(HOST, port, timeout=10)
+                continue
+            local_latencies.append(time.perf_counter() - started)
+        connection.close()
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_second": round(len(latencies) / duration, 1),
+        "p50_ms": round(quantiles[49] * 1000, 2),
+        "p99_ms": round(quantiles[98] * 1000, 2),
+    }
+
+
+def run_profile(worker_class: str, args: argparse.Namespace) -> dict[str, object]:
+    env = {**os.environ, "GUNICORN_WORKER_CLASS": worker_class, "PORT": str(args.port), "HOST": HOST}
+    command = [sys.executable, "-m", "gunicorn", "-c", "src/configs/gunicorn_config.py", "wsgi:app"]
+    server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)  # noqa: S603
+    try:
+        wait_until_ready(args.port, args.path)
+        drive_load(args.port, args.path, args.concurrency, min(args.duration, 2.0))
+        result = drive_load(args.port, args.path, args.concurrency, args.duration)
+    finally:
+        server.terminate()
+        server.wait(timeout=STARTUP_TIMEOUT_SECONDS)
+    return {"worker_class": worker_class, **result}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare Gunicorn worker profiles under the same HTTP load.")
+    parser.add_argument("--profiles", nargs="+", default=list(WORKER_PROFILES), choices=list(WORKER_PROFILES))
+    parser.add_argument("--path", default="/api/v1/notes/?limit=50")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--port", type=int, default=5099)
+    args = parser.parse_args()
+
+    results = [run_profile(worker_class, args) for worker_class in args.profiles]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
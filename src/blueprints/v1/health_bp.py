@@ -1,7 +1,10 @@
 from flask import Blueprint
 
-from src.controllers.health_controller import health
+from src.controllers.health_controller import health, metrics, pool, ready
 
 health_bp = Blueprint("health", __name__)
 
 health_bp.route("/", methods=["GET"])(health)
+health_bp.route("/ready", methods=["GET"])(ready)
+health_bp.route("/metrics", methods=["GET"])(metrics)
+health_bp.route("/pool", methods=["GET"])(pool)
@@ -1,11 +1,23 @@
 from flask import Blueprint
 
-from src.controllers.note_controller import alive, create_note, delete_note, get_notes, test_error
+from src.controllers.note_controller import (
+    alive,
+    create_note,
+    create_notes_bulk,
+    delete_note,
+    delete_notes_bulk,
+    export_notes,
+    get_notes,
+    test_error,
+)
 
 note_bp = Blueprint("note", __name__)
 
 note_bp.route("/alive", methods=["GET"])(alive)
 note_bp.route("/test_error", methods=["GET"])(test_error)
 note_bp.route("/", methods=["POST"])(create_note)
+note_bp.route("/bulk", methods=["POST"])(create_notes_bulk)
+note_bp.route("/bulk-delete", methods=["POST"])(delete_notes_bulk)
 note_bp.route("/", methods=["GET"])(get_notes)
+note_bp.route("/export", methods=["GET"])(export_notes)
 note_bp.route("/<id>", methods=["DELETE"])(delete_note)
@@ -0,0 +1,27 @@
+from typing import Any
+
+import bson
+from flask import Flask
+
+from src.configs.metrics_config import metrics
+from src.utils.cache import TTLCache
+
+NOTES_CACHE_EVENTS = metrics.counter(
+    "notes_cache_events_total", "Notes cache hits, misses and evictions in this worker.", ("event",)
+)
+
+
+def bson_size(value: Any) -> int:
+    return len(bson.encode({"value": value}))
+
+
+notes_cache = TTLCache(sizeof=bson_size, events=NOTES_CACHE_EVENTS)
+
+
+def init_cache(app: Flask) -> None:
+    notes_cache.configure(
+        enabled=app.config["NOTES_CACHE_ENABLED"],
+        ttl_seconds=app.config["NOTES_CACHE_TTL_SECONDS"],
+        max_entries=app.config["NOTES_CACHE_MAX_ENTRIES"],
+        max_bytes=app.config["NOTES_CACHE_MAX_BYTES"],
+    )
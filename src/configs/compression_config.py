@@ -0,0 +1,117 @@
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+
+from flask import Flask, Response, current_app, request
+
+from src.constants.defaults import COMPRESSIBLE_MIMETYPES
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+# compress, flush what has been compressed so far so the client can decode it, finish the stream.
+StreamCompressor = tuple[Callable[[bytes], bytes], Callable[[], bytes], Callable[[], bytes]]
+
+
+def gzip_compressor(level: int) -> StreamCompressor:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+def brotli_compressor(level: int) -> StreamCompressor:
+    compressor = brotli.Compressor(quality=level)
+    return compressor.process, compressor.flush, compressor.finish
+
+
+def zstd_compressor(level: int) -> StreamCompressor:
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    return compressor.compress, lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK), compressor.flush
+
+
+COMPRESSORS: dict[str, Callable[[int], StreamCompressor]] = {
+    "zstd": zstd_compressor,
+    "br": brotli_compressor,
+    "gzip": gzip_compressor,
+}
+
+
+def available_encodings(algorithms: str) -> list[str]:
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    preferred = [algorithm.strip().lower() for algorithm in algorithms.split(",")]
+    return [encoding for encoding in preferred if installed.get(encoding, False)]
+
+
+def compress_stream(
+    chunks: Iterable[str | bytes], encoding: str, level: int, flush_bytes: int | None = None
+) -> Iterator[bytes]:
+    compress, flush, finish = COMPRESSORS[encoding](level)
+    pending = 0
+    for chunk in chunks:
+        data = chunk.encode() if isinstance(chunk, str) else chunk
+        output = compress(data)
+        pending += len(data)
+        if flush_bytes is not None and pending >= flush_bytes:
+            output += flush()
+            pending = 0
+        if output:
+            yield output
+    yield finish()
+
+
+def compress_response(response: Response) -> Response:
+    config = current_app.config
+
+    if (
+        response.status_code < 200
+        or response.status_code in (204, 304)
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+
+    if not response.is_streamed and (response.content_length or 0) < config["COMPRESSION_MIN_SIZE"]:
+        return response
+
+    encoding = request.accept_encodings.best_match(config["COMPRESSION_ENCODINGS"])
+    if encoding is None:
+        return response
+
+    level = config["COMPRESSION_LEVELS"][encoding]
+    if response.is_streamed:
+        response.response = compress_stream(
+            response.response, encoding, level, config["COMPRESSION_STREAM_FLUSH_BYTES"]
+        )
+        response.headers.pop("Content-Length", None)
+    else:
+        response.set_data(b"".join(compress_stream([response.get_data()], encoding, level)))
+
+    response.headers["Content-Encoding"] = encoding
+
+    # The compressed bytes differ from the identity representation, so the validator can only be weak.
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+    return response
+
+
+def init_compression(app: Flask) -> None:
+    if not app.config["COMPRESSION_ENABLED"]:
+        return
+
+    app.config["COMPRESSION_ENCODINGS"] = available_encodings(app.config["COMPRESSION_ALGORITHMS"])
+    app.config["COMPRESSION_LEVELS"] = {
+        "gzip": app.config["COMPRESSION_GZIP_LEVEL"],
+        "br": app.config["COMPRESSION_BROTLI_LEVEL"],
+        "zstd": app.config["COMPRESSION_ZSTD_LEVEL"],
+    }
+    app.after_request(compress_response)
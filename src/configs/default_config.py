@@ -1,5 +1,7 @@
 import os
 
+from src.configs.worker_profiles import worker_profile
+
 
 class DefaultConfig:
     # General
@@ -15,13 +17,66 @@ class DefaultConfig:
     MONGO_URI = (
         f"mongodb://{MONGO_USER}:{MONGO_PASS}@{MONGO_HOST}:{MONGO_PORT}/{MONGO_DB_NAME}?authSource={MONGO_AUTH_SOURCE}"
     )
+
+    # Mongo client pool (sized per gunicorn worker process: one connection per concurrent request plus headroom)
+    GUNICORN_WORKER_CLASS = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+    GUNICORN_THREADS = int(os.getenv("GUNICORN_THREADS", str(worker_profile(GUNICORN_WORKER_CLASS)["threads"])))
+    GUNICORN_WORKER_CONNECTIONS = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+    GUNICORN_WORKER_CONCURRENCY = GUNICORN_WORKER_CONNECTIONS if GUNICORN_WORKER_CLASS == "gevent" else GUNICORN_THREADS
+    MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", str(min(GUNICORN_WORKER_CONCURRENCY + 2, 100))))
+    MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+    MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "60000"))
+    MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000"))
+    MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+    MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "60000"))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+    MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "zstd,zlib")
+    MONGO_ZLIB_COMPRESSION_LEVEL = int(os.getenv("MONGO_ZLIB_COMPRESSION_LEVEL", "-1"))
+    MONGO_SLOW_COMMAND_MS = int(os.getenv("MONGO_SLOW_COMMAND_MS", "100"))
+
     JSON_AS_ASCII = False
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "orjson")
 
     # Flask
     HOST = os.getenv("HOST", "0.0.0.0")
     PORT = int(os.getenv("PORT", "5000"))
     MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH", str(1 * 1024 * 1024)))
 
+    # Response compression (encodings in preference order; unavailable ones are skipped)
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_ALGORITHMS = os.getenv("COMPRESSION_ALGORITHMS", "zstd,br,gzip")
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_STREAM_FLUSH_BYTES = int(os.getenv("COMPRESSION_STREAM_FLUSH_BYTES", "65536"))
+    COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_LEVEL = int(os.getenv("COMPRESSION_BROTLI_LEVEL", "4"))
+    COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+    # Request metrics (gunicorn workers share snapshot files in this directory; empty keeps them per process)
+    METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR", "")
+    METRICS_FLUSH_SECONDS = float(os.getenv("METRICS_FLUSH_SECONDS", "1"))
+
+    # Readiness probe (one MongoDB ping per worker per cache window, however many probes arrive)
+    READINESS_CACHE_SECONDS = float(os.getenv("READINESS_CACHE_SECONDS", "2"))
+    READINESS_PING_TIMEOUT_MS = int(os.getenv("READINESS_PING_TIMEOUT_MS", "1000"))
+
+    # Pagination
+    NOTES_PAGE_DEFAULT_LIMIT = int(os.getenv("NOTES_PAGE_DEFAULT_LIMIT", "100"))
+    NOTES_PAGE_MAX_LIMIT = int(os.getenv("NOTES_PAGE_MAX_LIMIT", "1000"))
+
+    # Bulk
+    NOTES_BULK_DELETE_CHUNK_SIZE = int(os.getenv("NOTES_BULK_DELETE_CHUNK_SIZE", "1000"))
+
+    # Cache (per worker process; other workers' writes become visible after the TTL)
+    NOTES_CACHE_ENABLED = os.getenv("NOTES_CACHE_ENABLED", "true").lower() == "true"
+    NOTES_CACHE_TTL_SECONDS = float(os.getenv("NOTES_CACHE_TTL_SECONDS", "5"))
+    NOTES_CACHE_MAX_ENTRIES = int(os.getenv("NOTES_CACHE_MAX_ENTRIES", "256"))
+    NOTES_CACHE_MAX_BYTES = int(os.getenv("NOTES_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    NOTES_CACHE_WATCH_ENABLED = os.getenv("NOTES_CACHE_WATCH_ENABLED", "true").lower() == "true"
+    NOTES_CACHE_WATCH_RETRY_SECONDS = float(os.getenv("NOTES_CACHE_WATCH_RETRY_SECONDS", "5"))
+
+    # Export
+    NOTES_EXPORT_BATCH_SIZE = int(os.getenv("NOTES_EXPORT_BATCH_SIZE", "1000"))
+
     # Flask general
     DEBUG = False
     TESTING = False
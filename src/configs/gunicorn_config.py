@@ -1,18 +1,85 @@
-import multiprocessing
 import os
 
+from src.configs.worker_profiles import available_cpus, worker_profile
+
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+profile = worker_profile(worker_class)
+
+if worker_class == "gevent":
+    from gevent import monkey
+
+    monkey.patch_all()
+
+# Workers share metrics through snapshot files in this directory.
+metrics_dir = os.getenv("METRICS_MULTIPROC_DIR")
+
 bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '5050')}"
 
-workers = multiprocessing.cpu_count() * 2 + 1
+workers = int(os.getenv("GUNICORN_WORKERS", str(available_cpus() * profile["workers_per_cpu"] + 1)))
+
+threads = int(os.getenv("GUNICORN_THREADS", str(profile["threads"])))
+
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
 
-threads = 2
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
 
 timeout = 120
 
 graceful_timeout = 30
 
+preload_app = os.getenv("GUNICORN_PRELOAD_APP", "true").lower() == "true"
+
 accesslog = "-"
 errorlog = "-"
 loglevel = "info"
 
 proc_name = "boilerplate-server"
+
+
+def on_starting(server) -> None:
+    # Runs once in the master, not on a HUP reload, so live workers' snapshots and the archive survive reloads.
+    if metrics_dir:
+        from src.utils.metrics import remove_snapshots
+
+        remove_snapshots(metrics_dir)
+
+
+def when_ready(server) -> None:
+    from src.configs.mongo_config import mongo
+
+    mongo.close()
+
+
+def post_fork(server, worker) -> None:
+    from src.configs.cache_config import notes_cache
+    from src.configs.metrics_config import metrics
+    from src.configs.mongo_config import mongo
+
+    mongo.reset()
+    notes_cache.clear()
+    metrics.clear()
+
+
+def post_worker_init(worker) -> None:
+    from src.configs.metrics_config import metrics_exporter
+    from src.services.note_watcher import note_watcher
+
+    note_watcher.start()
+    metrics_exporter.start()
+
+
+def worker_exit(server, worker) -> None:
+    from src.configs.metrics_config import metrics_exporter
+    from src.services.note_watcher import note_watcher
+
+    note_watcher.stop(timeout=5)
+    metrics_exporter.stop(timeout=5)
+
+
+def child_exit(server, worker) -> None:
+    if metrics_dir:
+        from src.configs.metrics_config import metrics
+
+        metrics.archive(metrics_dir, worker.pid)
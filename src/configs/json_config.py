@@ -0,0 +1,63 @@
+from datetime import date
+from typing import Any
+
+from bson import ObjectId
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from src.configs.logger_config import setup_logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+logger = setup_logger(__name__)
+
+
+def json_default(o: Any) -> Any:
+    if isinstance(o, ObjectId):
+        return str(o)
+    if isinstance(o, date):
+        return o.isoformat()
+    return DefaultJSONProvider.default(o)
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    ensure_ascii = False
+    default = staticmethod(json_default)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs.get("indent") is None:
+            kwargs.setdefault("separators", (",", ":"))
+        return super().dumps(obj, **kwargs)
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent") is not None:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=json_default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+JSON_PROVIDERS: dict[str, type[DefaultJSONProvider]] = {
+    "orjson": OrjsonJSONProvider,
+    "stdlib": StdlibJSONProvider,
+}
+
+
+def init_json(app: Flask) -> None:
+    name = app.config.get("JSON_PROVIDER", "stdlib")
+
+    if name not in JSON_PROVIDERS:
+        raise ValueError(f"Invalid JSON_PROVIDER: {name!r}. Allowed values are: {sorted(JSON_PROVIDERS)}")
+
+    if name == "orjson" and orjson is None:
+        logger.warning("orjson is not installed, falling back to the stdlib JSON provider.")
+        name = "stdlib"
+
+    app.json = JSON_PROVIDERS[name](app)
@@ -0,0 +1,157 @@
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from flask import Flask
+
+from src.configs.logger_config import setup_logger
+from src.utils.metrics import MetricsRegistry, Snapshot, read_snapshots, snapshot_path, write_snapshot
+
+if TYPE_CHECKING:
+    from _typeshed.wsgi import StartResponse, WSGIApplication, WSGIEnvironment
+
+logger = setup_logger(__name__)
+
+CONTENT_TYPE_METRICS = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Any other method a client sends shares one label, so it cannot mint new series.
+HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+SIZE_BUCKETS = (128, 512, 2_048, 8_192, 32_768, 131_072, 524_288, 2_097_152, 8_388_608)
+
+metrics = MetricsRegistry()
+
+REQUEST_LATENCY = metrics.histogram(
+    "http_request_duration_seconds",
+    "Time spent handling a request, by endpoint.",
+    ("method", "endpoint", "status"),
+    LATENCY_BUCKETS,
+)
+RESPONSE_SIZE = metrics.histogram(
+    "http_response_size_bytes",
+    "Size of the response body sent to the client, by endpoint.",
+    ("method", "endpoint"),
+    SIZE_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = metrics.gauge("http_requests_in_flight", "Requests currently being handled.")
+
+
+class MetricsExporter:
+    def __init__(self) -> None:
+        self.directory: str | None = None
+        self.flush_seconds = 1.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def init_app(self, app: Flask) -> None:
+        self.directory = app.config["METRICS_MULTIPROC_DIR"] or None
+        self.flush_seconds = app.config["METRICS_FLUSH_SECONDS"]
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.directory is None or self.running:
+            return
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self.run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+        self.flush()
+
+    def run(self) -> None:
+        while not self._stop.wait(self.flush_seconds):
+            self.flush()
+
+    def flush(self) -> None:
+        if self.directory is None:
+            return
+
+        try:
+            write_snapshot(snapshot_path(self.directory, os.getpid()), metrics.snapshot())
+        except OSError as e:
+            logger.warning("Could not write metrics snapshot to %s: %s", self.directory, e)
+
+    def collect(self) -> Snapshot:
+        if self.directory is None:
+            return metrics.snapshot()
+
+        # This worker's numbers are read live; the others come from their last flushed snapshot.
+        others = read_snapshots(self.directory, exclude_pid=os.getpid())
+        return metrics.merge([*others, metrics.snapshot()])
+
+    def render(self) -> str:
+        return metrics.render(self.collect())
+
+
+metrics_exporter = MetricsExporter()
+
+
+class MetricsMiddleware:
+    def __init__(self, wsgi_app: "WSGIApplication") -> None:
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ: "WSGIEnvironment", start_response: "StartResponse") -> Iterable[bytes]:
+        method = environ["REQUEST_METHOD"]
+        body = MeteredBody(method if method in HTTP_METHODS else "other")
+
+        def capture(status: str, headers: list[tuple[str, str]], exc_info: Any = None) -> Any:
+            # Read straight from the WSGI environ: Flask's request proxy costs microseconds per attribute, and Flask
+            # drops the request from the environ when its context is popped, before the body is closed.
+            flask_request = environ.get("werkzeug.request")
+            body.endpoint = (flask_request.endpoint if flask_request is not None else None) or "unmatched"
+            body.status = status
+            return start_response(status, headers, exc_info)
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            body.body = self.wsgi_app(environ, capture)
+        except BaseException:
+            body.close()
+            raise
+        return body
+
+
+class MeteredBody:
+    # The server closes the body once the last byte is sent, so streamed responses are timed and sized in full.
+    def __init__(self, method: str) -> None:
+        self.method = method
+        self.started = time.perf_counter()
+        self.endpoint = "unmatched"
+        self.status = "500"
+        self.size = 0
+        self.body: Iterable[bytes] = ()
+        self._closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.body:
+            self.size += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        try:
+            close = getattr(self.body, "close", None)
+            if close is not None:
+                close()
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            REQUEST_LATENCY.observe((self.method, self.endpoint, self.status[:3]), time.perf_counter() - self.started)
+            RESPONSE_SIZE.observe((self.method, self.endpoint), self.size)
+
+
+def init_metrics(app: Flask) -> None:
+    metrics_exporter.init_app(app)
+    app.wsgi_app = MetricsMiddleware(app.wsgi_app)  # type: ignore[method-assign]
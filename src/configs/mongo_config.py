@@ -1,32 +1,127 @@
+import os
+import threading
+from collections.abc import Callable
+from typing import Any
+
 from flask import Flask
-from pymongo import MongoClient
+from pymongo import MongoClient, compression_support
 from pymongo.database import Database
 
 from src.configs.logger_config import setup_logger
+from src.configs.mongo_listeners import CommandMonitor, HeartbeatMonitor, PoolMonitor, ServerMonitor
 
 logger = setup_logger(__name__)
 
+CLIENT_OPTIONS = {
+    "MONGO_SERVER_SELECTION_TIMEOUT_MS": "serverSelectionTimeoutMS",
+    "MONGO_MAX_POOL_SIZE": "maxPoolSize",
+    "MONGO_MIN_POOL_SIZE": "minPoolSize",
+    "MONGO_MAX_IDLE_TIME_MS": "maxIdleTimeMS",
+    "MONGO_WAIT_QUEUE_TIMEOUT_MS": "waitQueueTimeoutMS",
+    "MONGO_CONNECT_TIMEOUT_MS": "connectTimeoutMS",
+    "MONGO_SOCKET_TIMEOUT_MS": "socketTimeoutMS",
+    "MONGO_COMPRESSORS": "compressors",
+    "MONGO_ZLIB_COMPRESSION_LEVEL": "zlibCompressionLevel",
+}
+
+# The driver's own checks, so a compressor is only offered when pymongo will actually use it.
+WIRE_COMPRESSORS: dict[str, tuple[Callable[[], bool], str]] = {
+    "zstd": (compression_support._have_zstd, "backports.zstd (pymongo[zstd])"),
+    "snappy": (compression_support._have_snappy, "python-snappy"),
+    "zlib": (compression_support._have_zlib, "zlib"),
+}
+
+
+def wire_compressors(value: str) -> str:
+    offered: list[str] = []
+    for name in (part.strip().lower() for part in value.split(",")):
+        if not name:
+            continue
+        if name not in WIRE_COMPRESSORS:
+            logger.warning("Ignoring unknown MongoDB wire compressor %r.", name)
+        elif not WIRE_COMPRESSORS[name][0]():
+            logger.warning("Skipping MongoDB wire compressor %r: %s is not installed.", name, WIRE_COMPRESSORS[name][1])
+        else:
+            offered.append(name)
+    return ",".join(offered)
+
 
 class Mongo:
     def __init__(self) -> None:
-        self.client: MongoClient | None = None
+        self._client: MongoClient | None = None
         self._db: Database | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+        self._uri: str | None = None
+        self._db_name: str = ""
+        self._options: dict[str, Any] = {}
+
+    @property
+    def client(self) -> MongoClient | None:
+        if self._uri is None:
+            return None
+        return self._connection()[0]
 
     @property
     def db(self) -> Database:
-        if self._db is None:
+        if self._uri is None:
             raise RuntimeError("MongoDB not initialized. Call init_app() first.")
-        return self._db
+        return self._connection()[1]
 
-    def init_app(self, app: Flask) -> None:
-        mongo_uri = app.config["MONGO_URI"]
-        db_name = app.config["MONGO_DB_NAME"]
+    def _connection(self) -> tuple[MongoClient, Database]:
+        client, db = self._client, self._db
+        if client is not None and db is not None and self._pid == os.getpid():
+            return client, db
+
+        with self._lock:
+            if self._client is not None and self._db is not None and self._pid == os.getpid():
+                return self._client, self._db
+
+            client = MongoClient(self._uri, **self._options)
+            db = client[self._db_name]
+            self._client, self._db, self._pid = client, db, os.getpid()
+            logger.info("MongoDB client created for process %s.", self._pid)
+            return client, db
+
+    def reset(self) -> None:
+        self._client = None
+        self._db = None
+        self._pid = None
+        self._lock = threading.Lock()
 
-        self.client = MongoClient(mongo_uri, serverSelectionTimeoutMS=5000)
-        self._db = self.client[db_name]
+    def close(self) -> None:
+        if self._client is not None and self._pid == os.getpid():
+            self._client.close()
+        self.reset()
+
+    @staticmethod
+    def client_options(config: dict[str, Any]) -> dict[str, Any]:
+        options: dict[str, Any] = {"serverSelectionTimeoutMS": 5000}
+        for key, option in CLIENT_OPTIONS.items():
+            value = config.get(key)
+            if option == "compressors" and value:
+                value = wire_compressors(value)
+            if value is not None and value != "":
+                options[option] = value
+        return options
+
+    def init_app(self, app: Flask) -> None:
+        self.close()
+        self._uri = app.config["MONGO_URI"]
+        self._db_name = app.config["MONGO_DB_NAME"]
+        self._options = Mongo.client_options(app.config)
+        self._options["event_listeners"] = [
+            CommandMonitor(app.config.get("MONGO_SLOW_COMMAND_MS", 100)),
+            PoolMonitor(),
+            ServerMonitor(),
+            HeartbeatMonitor(),
+        ]
 
-        self.client.admin.command("ping")
+        client, _ = self._connection()
+        client.admin.command("ping")
         logger.info("MongoDB connection verified.")
+        if "compressors" in self._options:
+            logger.info("MongoDB wire compressors offered: %s.", self._options["compressors"])
 
 
 mongo = Mongo()
@@ -0,0 +1,274 @@
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from pymongo import monitoring
+
+from src.configs.logger_config import setup_logger
+from src.configs.metrics_config import metrics
+from src.utils.metrics import Snapshot
+
+logger = setup_logger(__name__)
+
+COMMAND_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Where each command keeps the part of its document that decides which documents are scanned.
+FILTER_FIELDS = {
+    "find": "filter",
+    "count": "query",
+    "distinct": "query",
+    "findAndModify": "query",
+    "aggregate": "pipeline",
+}
+STATEMENT_FIELDS = {"update": "updates", "delete": "deletes"}
+
+MONGO_COMMAND_DURATION = metrics.histogram(
+    "mongodb_command_duration_seconds",
+    "Time MongoDB commands took, by command and collection (awaited change stream getMores are not included).",
+    ("command", "collection"),
+    COMMAND_BUCKETS,
+)
+MONGO_COMMAND_FAILURES = metrics.counter(
+    "mongodb_command_failures_total",
+    "MongoDB commands that failed, by command and collection.",
+    ("command", "collection"),
+)
+
+POOL_CHECKED_OUT = metrics.gauge(
+    "mongodb_pool_checked_out_connections", "Connections currently checked out of the pool.", ("address",)
+)
+POOL_OPEN = metrics.gauge("mongodb_pool_open_connections", "Connections currently open in the pool.", ("address",))
+POOL_CREATED = metrics.counter(
+    "mongodb_pool_connections_created_total", "Connections the pool has opened.", ("address",)
+)
+POOL_CHECKOUT_WAIT = metrics.histogram(
+    "mongodb_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the pool, including connecting.",
+    ("address",),
+    WAIT_BUCKETS,
+)
+POOL_CHECKOUT_FAILURES = metrics.counter(
+    "mongodb_pool_checkout_failures_total", "Connection check-outs that failed, by reason.", ("address", "reason")
+)
+POOL_CLEARED = metrics.counter("mongodb_pool_cleared_total", "Times the pool was cleared after an error.", ("address",))
+HEARTBEAT_DURATION = metrics.histogram(
+    "mongodb_heartbeat_duration_seconds",
+    "Round trip of server monitoring heartbeats (awaited streaming heartbeats are not included).",
+    ("address",),
+    COMMAND_BUCKETS,
+)
+HEARTBEAT_FAILURES = metrics.counter(
+    "mongodb_heartbeat_failures_total", "Server monitoring heartbeats that failed.", ("address",)
+)
+SERVER_AVAILABLE = metrics.gauge(
+    "mongodb_server_available_workers",
+    "Workers that currently see the server as known and selectable. Each worker reports 1 or 0 and the values add up.",
+    ("address",),
+)
+
+
+def format_address(address: tuple[str, int | None]) -> str:
+    host, port = address
+    return f"{host}:{port}" if port is not None else host
+
+
+def command_collection(command_name: str, command: Mapping[str, Any]) -> str:
+    if command_name == "getMore":
+        return str(command.get("collection", ""))
+    target = command.get(command_name)
+    return target if isinstance(target, str) else ""
+
+
+def command_filter(command_name: str, command: Mapping[str, Any]) -> Any:
+    if command_name in FILTER_FIELDS:
+        return command.get(FILTER_FIELDS[command_name])
+    if command_name in STATEMENT_FIELDS:
+        return [statement.get("q") for statement in command.get(STATEMENT_FIELDS[command_name], [])]
+    return None
+
+
+def redact(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, list | tuple) and any(isinstance(item, Mapping) for item in value):
+        return [redact(item) for item in value]
+    return "?"
+
+
+class CommandMonitor(monitoring.CommandListener):
+    def __init__(self, slow_command_ms: float) -> None:
+        self.slow_command_seconds = slow_command_ms / 1000
+        # Dict set and pop are atomic under the GIL, so concurrent commands need no lock here.
+        self._started: dict[tuple[Any, int], tuple[str, str, Mapping[str, Any]]] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        collection = command_collection(event.command_name, event.command)
+        self._started[(event.connection_id, event.request_id)] = (event.database_name, collection, event.command)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, failed=True)
+
+    def _finish(self, event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent, failed: bool) -> None:
+        started = self._started.pop((event.connection_id, event.request_id), None)
+        if started is None:
+            return
+
+        database, collection, command = started
+        seconds = event.duration_micros / 1_000_000
+        labels = (event.command_name, collection)
+        if failed:
+            MONGO_COMMAND_FAILURES.inc(labels)
+        # An awaited getMore (a tailing change stream) waits up to maxTimeMS for new events, so it is not slow work.
+        if event.command_name == "getMore" and "maxTimeMS" in command:
+            return
+
+        MONGO_COMMAND_DURATION.observe(labels, seconds)
+        if seconds >= self.slow_command_seconds:
+            logger.warning(
+                "Slow MongoDB command %s on %s.%s took %.1f ms%s: %s",
+                event.command_name,
+                database,
+                collection,
+                seconds * 1000,
+                " and failed" if failed else "",
+                json.dumps(redact(command_filter(event.command_name, command))),
+            )
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        POOL_CLEARED.inc((format_address(event.address),))
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        address = (format_address(event.address),)
+        POOL_CREATED.inc(address)
+        POOL_OPEN.inc(address)
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        POOL_OPEN.dec((format_address(event.address),))
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        pass
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        address = format_address(event.address)
+        POOL_CHECKOUT_FAILURES.inc((address, event.reason))
+        POOL_CHECKOUT_WAIT.observe((address,), event.duration or 0.0)
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        address = (format_address(event.address),)
+        POOL_CHECKED_OUT.inc(address)
+        POOL_CHECKOUT_WAIT.observe(address, event.duration or 0.0)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        POOL_CHECKED_OUT.dec((format_address(event.address),))
+
+
+class HeartbeatMonitor(monitoring.ServerHeartbeatListener):
+    def started(self, event: monitoring.ServerHeartbeatStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.ServerHeartbeatSucceededEvent) -> None:
+        # Awaited heartbeats block on the server until its state changes, so their duration is not a round trip.
+        if not event.awaited:
+            HEARTBEAT_DURATION.observe((format_address(event.connection_id),), event.duration)
+
+    def failed(self, event: monitoring.ServerHeartbeatFailedEvent) -> None:
+        HEARTBEAT_FAILURES.inc((format_address(event.connection_id),))
+
+
+class ServerMonitor(monitoring.ServerListener):
+    def opened(self, event: monitoring.ServerOpeningEvent) -> None:
+        pass
+
+    def description_changed(self, event: monitoring.ServerDescriptionChangedEvent) -> None:
+        previous, new = event.previous_description, event.new_description
+        SERVER_AVAILABLE.set((format_address(event.server_address),), 1.0 if new.is_server_type_known else 0.0)
+        if previous.server_type != new.server_type:
+            logger.info(
+                "MongoDB server %s changed from %s to %s.",
+                format_address(event.server_address),
+                previous.server_type_name,
+                new.server_type_name,
+            )
+
+    def closed(self, event: monitoring.ServerClosedEvent) -> None:
+        SERVER_AVAILABLE.set((format_address(event.server_address),), 0.0)
+
+
+def histogram_summary(histogram_series: list[float] | None, buckets: tuple[float, ...]) -> dict[str, Any]:
+    if not histogram_series:
+        return {"count": 0, "avg_ms": None, "p99_ms": None}
+
+    count = sum(histogram_series[:-1])
+    target, seen, p99 = count * 0.99, 0.0, None
+    for bound, bucket_count in zip((*buckets, None), histogram_series[:-1], strict=True):
+        seen += bucket_count
+        if seen >= target:
+            p99 = bound
+            break
+    return {
+        "count": int(count),
+        "avg_ms": round(histogram_series[-1] / count * 1000, 3) if count else None,
+        # Upper bound of the bucket holding the 99th percentile; None when it lies past the last bucket.
+        "p99_ms": round(p99 * 1000, 3) if p99 is not None else None,
+    }
+
+
+def pool_summary(snapshot: Snapshot) -> dict[str, dict[str, Any]]:
+    servers: dict[str, dict[str, Any]] = {}
+
+    def server(address: str) -> dict[str, Any]:
+        return servers.setdefault(
+            address,
+            {
+                "available_workers": 0,
+                "checked_out": 0,
+                "open": 0,
+                "created": 0,
+                "cleared": 0,
+                "checkout_failures": {},
+                "checkout_wait": histogram_summary(None, WAIT_BUCKETS),
+                "heartbeat": histogram_summary(None, COMMAND_BUCKETS),
+                "heartbeat_failures": 0,
+            },
+        )
+
+    def values(metric: Any) -> dict[tuple[str, ...], Any]:
+        return snapshot.get(metric.name, {})
+
+    for (address,), value in values(SERVER_AVAILABLE).items():
+        server(address)["available_workers"] = int(value)
+    for (address,), value in values(POOL_CHECKED_OUT).items():
+        server(address)["checked_out"] = int(value)
+    for (address,), value in values(POOL_OPEN).items():
+        server(address)["open"] = int(value)
+    for (address,), value in values(POOL_CREATED).items():
+        server(address)["created"] = int(value)
+    for (address,), value in values(POOL_CLEARED).items():
+        server(address)["cleared"] = int(value)
+    for (address, reason), value in values(POOL_CHECKOUT_FAILURES).items():
+        server(address)["checkout_failures"][reason] = int(value)
+    for (address,), value in values(POOL_CHECKOUT_WAIT).items():
+        server(address)["checkout_wait"] = histogram_summary(value, WAIT_BUCKETS)
+    for (address,), value in values(HEARTBEAT_DURATION).items():
+        server(address)["heartbeat"] = histogram_summary(value, COMMAND_BUCKETS)
+    for (address,), value in values(HEARTBEAT_FAILURES).items():
+        server(address)["heartbeat_failures"] = int(value)
+    return servers
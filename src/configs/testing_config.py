@@ -7,6 +7,9 @@ class TestingConfig(DefaultConfig):
     MONGO_DB_NAME = os.getenv("MONGO_DB_NAME", "boilerplate_db")
     MONGO_URI = os.environ["MONGO_URI"]
 
+    NOTES_CACHE_ENABLED = False
+    NOTES_CACHE_WATCH_ENABLED = False
+
     TESTING = True
     DEBUG = True
     ENV = "testing"
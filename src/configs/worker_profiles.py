@@ -0,0 +1,54 @@
+import math
+import os
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+WORKER_PROFILES: dict[str, dict[str, int]] = {
+    "sync": {"workers_per_cpu": 2, "threads": 1},
+    "gthread": {"workers_per_cpu": 2, "threads": 2},
+    "gevent": {"workers_per_cpu": 1, "threads": 1},
+}
+
+
+def _read(path: str) -> str | None:
+    try:
+        with open(path) as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(root: str = CGROUP_ROOT) -> float | None:
+    cpu_max = _read(f"{root}/cpu.max")
+    if cpu_max is not None:
+        quota, _, period = cpu_max.partition(" ")
+        if quota == "max" or not period:
+            return None
+        return int(quota) / int(period)
+
+    for controller in ("cpu", "cpu,cpuacct"):
+        quota_us = _read(f"{root}/{controller}/cpu.cfs_quota_us")
+        period_us = _read(f"{root}/{controller}/cpu.cfs_period_us")
+        if quota_us is None or period_us is None:
+            continue
+        if int(quota_us) <= 0:
+            return None
+        return int(quota_us) / int(period_us)
+
+    return None
+
+
+def available_cpus(root: str = CGROUP_ROOT) -> int:
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+    limit = cgroup_cpu_limit(root)
+    if limit is not None:
+        cpus = min(cpus, max(1, math.ceil(limit)))
+
+    return cpus
+
+
+def worker_profile(worker_class: str) -> dict[str, int]:
+    if worker_class not in WORKER_PROFILES:
+        raise ValueError(f"Invalid worker class: {worker_class!r}. Allowed values are: {sorted(WORKER_PROFILES)}")
+    return WORKER_PROFILES[worker_class]
@@ -1,9 +1,12 @@
 # ##### SUCCESS #####
 CODE_SUCCESS_HEALTH = "SUCCESS_HEALTH"
 CODE_SUCCESS_READY = "SUCCESS_READY"
+CODE_SUCCESS_POOL = "SUCCESS_POOL"
 CODE_SUCCESS_ADD_NOTE = "SUCCESS_ADD_NOTE"
+CODE_SUCCESS_ADD_NOTES = "SUCCESS_ADD_NOTES"
 CODE_SUCCESS_GET_NOTES = "SUCCESS_GET_NOTES"
 CODE_SUCCESS_DELETE_NOTE = "SUCCESS_DELETE_NOTE"
+CODE_SUCCESS_DELETE_NOTES = "SUCCESS_DELETE_NOTES"
 
 # ##### ERROR #####
 CODE_ERROR_INTERNAL_SERVER = "ERROR_INTERNAL_SERVER"
@@ -13,10 +16,14 @@ CODE_ERROR_GENERIC = "ERROR_GENERIC"
 CODE_ERROR_AUTHENTICATION = "ERROR_AUTHENTICATION"
 
 # ##### NOT #####
+CODE_NOT_READY = "NOT_READY"
 
 # ##### NOT_VALID #####
 CODE_NOT_VALID_INTEGER = "NOT_VALID_INTEGER"
 CODE_NOT_VALID_OBJECT_ID = "NOT_VALID_OBJECT_ID"
+CODE_NOT_VALID_CURSOR = "NOT_VALID_CURSOR"
+CODE_NOT_VALID_EXPORT_FORMAT = "NOT_VALID_EXPORT_FORMAT"
+CODE_NOT_VALID_FIELDS = "NOT_VALID_FIELDS"
 
 # ##### NOT_EXISTS #####
 
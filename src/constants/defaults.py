@@ -1,3 +1,7 @@
 DEFAULT_VALUE = 0
 
 DEFAULT_NOTES = [{"name": "hi"}, {"name": "im Die"}]
+
+EXPORT_FORMATS = {"ndjson": "application/x-ndjson"}
+
+COMPRESSIBLE_MIMETYPES = {"application/json", "application/x-ndjson", "text/plain", "text/html", "text/csv"}
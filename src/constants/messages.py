@@ -1,9 +1,12 @@
 # ##### SUCCESS #####
 MESSAGE_SUCCESS_HEALTH = "The application is healthy."
 MESSAGE_SUCCESS_READY = "The application is ready to serve requests."
+MESSAGE_SUCCESS_POOL = "MongoDB connection pool statistics retrieved successfully."
 MESSAGE_SUCCESS_ADD_NOTE = "The note was successfully added."
+MESSAGE_SUCCESS_ADD_NOTES = "The notes were processed successfully."
 MESSAGE_SUCCESS_GET_NOTES = "Notes retrieved successfully."
 MESSAGE_SUCCESS_DELETE_NOTE = "The note was successfully deleted."
+MESSAGE_SUCCESS_DELETE_NOTES = "The notes were successfully deleted."
 
 # ##### ERROR #####
 MESSAGE_ERROR_INTERNAL_SERVER = "Internal server error."
@@ -13,10 +16,14 @@ MESSAGE_ERROR_GENERIC = "Error: {e}"
 MESSAGE_ERROR_AUTHENTICATION = "Unable to authenticate."
 
 # ##### NOT #####
+MESSAGE_NOT_READY = "The application cannot reach the database."
 
 # ##### NOT_VALID #####
 MESSAGE_NOT_VALID_INTEGER = "The value entered is not a valid integer."
 MESSAGE_NOT_VALID_OBJECT_ID = "The value entered is not a valid ObjectId."
+MESSAGE_NOT_VALID_CURSOR = "The value entered is not a valid pagination cursor."
+MESSAGE_NOT_VALID_EXPORT_FORMAT = "The export format entered is not supported."
+MESSAGE_NOT_VALID_FIELDS = "The fields entered are not valid note fields."
 
 # ##### NOT_EXISTS #####
 
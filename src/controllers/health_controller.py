@@ -1,8 +1,17 @@
-from flask import jsonify
+from flask import Response, current_app, jsonify
 from flask.typing import ResponseReturnValue
 
-from src.constants.codes import CODE_SUCCESS_HEALTH, CODE_SUCCESS_READY
-from src.constants.messages import MESSAGE_SUCCESS_HEALTH, MESSAGE_SUCCESS_READY
+from src.configs.metrics_config import CONTENT_TYPE_METRICS, metrics_exporter
+from src.configs.mongo_listeners import pool_summary
+from src.constants.codes import CODE_NOT_READY, CODE_SUCCESS_HEALTH, CODE_SUCCESS_POOL, CODE_SUCCESS_READY
+from src.constants.messages import (
+    MESSAGE_NOT_READY,
+    MESSAGE_SUCCESS_HEALTH,
+    MESSAGE_SUCCESS_POOL,
+    MESSAGE_SUCCESS_READY,
+)
+from src.services.readiness_probe import readiness_probe
+from src.utils.exceptions import ServiceUnavailableAPIError
 
 
 def health() -> ResponseReturnValue:
@@ -10,4 +19,30 @@ def health() -> ResponseReturnValue:
 
 
 def ready() -> ResponseReturnValue:
+    if not readiness_probe.check():
+        raise ServiceUnavailableAPIError(code=CODE_NOT_READY, message=MESSAGE_NOT_READY)
     return jsonify({"code": CODE_SUCCESS_READY, "message": MESSAGE_SUCCESS_READY}), 200
+
+
+def metrics() -> ResponseReturnValue:
+    return Response(metrics_exporter.render(), content_type=CONTENT_TYPE_METRICS), 200
+
+
+def pool() -> ResponseReturnValue:
+    config = current_app.config
+    return jsonify(
+        {
+            "code": CODE_SUCCESS_POOL,
+            "message": MESSAGE_SUCCESS_POOL,
+            "data": {
+                "settings": {
+                    "worker_class": config["GUNICORN_WORKER_CLASS"],
+                    "worker_concurrency": config["GUNICORN_WORKER_CONCURRENCY"],
+                    "max_pool_size_per_worker": config["MONGO_MAX_POOL_SIZE"],
+                    "min_pool_size_per_worker": config["MONGO_MIN_POOL_SIZE"],
+                    "wait_queue_timeout_ms": config["MONGO_WAIT_QUEUE_TIMEOUT_MS"],
+                },
+                "servers": pool_summary(metrics_exporter.collect()),
+            },
+        }
+    ), 200
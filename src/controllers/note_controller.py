@@ -1,23 +1,70 @@
 from bson import ObjectId
-from flask import jsonify, request
+from flask import Response, current_app, jsonify, request, stream_with_context
 from flask.typing import ResponseReturnValue
 
 from src.constants.codes import (
+    CODE_NOT_VALID_CURSOR,
+    CODE_NOT_VALID_EXPORT_FORMAT,
+    CODE_NOT_VALID_FIELDS,
+    CODE_NOT_VALID_INTEGER,
     CODE_NOT_VALID_OBJECT_ID,
     CODE_SUCCESS_ADD_NOTE,
+    CODE_SUCCESS_ADD_NOTES,
     CODE_SUCCESS_DELETE_NOTE,
+    CODE_SUCCESS_DELETE_NOTES,
     CODE_SUCCESS_GET_NOTES,
 )
+from src.constants.defaults import EXPORT_FORMATS
 from src.constants.messages import (
+    MESSAGE_NOT_VALID_CURSOR,
+    MESSAGE_NOT_VALID_EXPORT_FORMAT,
+    MESSAGE_NOT_VALID_FIELDS,
+    MESSAGE_NOT_VALID_INTEGER,
     MESSAGE_NOT_VALID_OBJECT_ID,
     MESSAGE_SUCCESS_ADD_NOTE,
+    MESSAGE_SUCCESS_ADD_NOTES,
     MESSAGE_SUCCESS_DELETE_NOTE,
+    MESSAGE_SUCCESS_DELETE_NOTES,
     MESSAGE_SUCCESS_GET_NOTES,
 )
-from src.models.note_model import NoteModel
+from src.models.note_model import NoteBulkDeleteModel, NoteBulkModel, NoteModel
 from src.services.note_service import NoteService
 from src.utils.exceptions import InternalAPIError, ValidationAPIError
 from src.utils.exceptions_decorator import exceptions_decorator
+from src.utils.helpers import decode_cursor, encode_cursor, is_positive_integer
+
+NOTE_FIELDS = frozenset(("_id", *NoteModel.model_fields))
+
+
+def _parse_fields(value: str | None) -> list[str] | None:
+    if value is None:
+        return None
+
+    fields = list(dict.fromkeys(field.strip() for field in value.split(",") if field.strip()))
+    if not fields or not NOTE_FIELDS.issuperset(fields):
+        raise ValidationAPIError(
+            code=CODE_NOT_VALID_FIELDS,
+            message=MESSAGE_NOT_VALID_FIELDS,
+            payload={"allowed": sorted(NOTE_FIELDS)},
+        )
+
+    return fields
+
+
+def _with_etag(response: Response, etag: str) -> Response:
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+
+def _parse_object_id(id: str) -> ObjectId:
+    try:
+        return ObjectId(id)
+    except Exception:
+        raise ValidationAPIError(
+            code=CODE_NOT_VALID_OBJECT_ID,
+            message=MESSAGE_NOT_VALID_OBJECT_ID,
+        ) from None
 
 
 @exceptions_decorator
@@ -55,21 +102,82 @@ def create_note() -> ResponseReturnValue:
 
 
 @exceptions_decorator
-def get_notes() -> ResponseReturnValue:
-    notes = NoteService.get_all_notes()
-    return jsonify({"code": CODE_SUCCESS_GET_NOTES, "message": MESSAGE_SUCCESS_GET_NOTES, "data": notes}), 200
+def create_notes_bulk() -> ResponseReturnValue:
+    data = request.get_json()
+    notes = NoteBulkModel.model_validate(data)
+    result = NoteService.add_notes(notes.root)
+    return jsonify(
+        {
+            "message": MESSAGE_SUCCESS_ADD_NOTES,
+            "code": CODE_SUCCESS_ADD_NOTES,
+            "data": result,
+        }
+    ), 201
 
 
 @exceptions_decorator
-def delete_note(id: str) -> ResponseReturnValue:
+def get_notes() -> ResponseReturnValue:
+    limit = request.args.get("limit", current_app.config["NOTES_PAGE_DEFAULT_LIMIT"])
+    if not is_positive_integer(limit):
+        raise ValidationAPIError(
+            code=CODE_NOT_VALID_INTEGER,
+            message=MESSAGE_NOT_VALID_INTEGER,
+        )
+
+    after = request.args.get("after")
     try:
-        _id = ObjectId(id)
+        after_id = decode_cursor(after) if after else None
     except Exception:
         raise ValidationAPIError(
-            code=CODE_NOT_VALID_OBJECT_ID,
-            message=MESSAGE_NOT_VALID_OBJECT_ID,
+            code=CODE_NOT_VALID_CURSOR,
+            message=MESSAGE_NOT_VALID_CURSOR,
         ) from None
 
+    fields = _parse_fields(request.args.get("fields"))
+    page_size = min(int(limit), current_app.config["NOTES_PAGE_MAX_LIMIT"])
+
+    version = NoteService.get_notes_version()
+    etag = NoteService.get_notes_etag(version, page_size, after_id, fields)
+    if request.if_none_match.contains_weak(etag):
+        return _with_etag(Response(status=304), etag), 304
+
+    notes, last_id, version = NoteService.get_notes_page(page_size, after_id, fields, version)
+    response = jsonify(
+        {
+            "code": CODE_SUCCESS_GET_NOTES,
+            "message": MESSAGE_SUCCESS_GET_NOTES,
+            "data": notes,
+            "next_cursor": encode_cursor(last_id) if last_id is not None else None,
+        }
+    )
+    return _with_etag(response, NoteService.get_notes_etag(version, page_size, after_id, fields)), 200
+
+
+@exceptions_decorator
+def export_notes() -> ResponseReturnValue:
+    export_format = request.args.get("format", "ndjson")
+    if export_format not in EXPORT_FORMATS:
+        raise ValidationAPIError(
+            code=CODE_NOT_VALID_EXPORT_FORMAT,
+            message=MESSAGE_NOT_VALID_EXPORT_FORMAT,
+        )
+
+    batch_size = request.args.get("batch_size", current_app.config["NOTES_EXPORT_BATCH_SIZE"])
+    if not is_positive_integer(batch_size):
+        raise ValidationAPIError(
+            code=CODE_NOT_VALID_INTEGER,
+            message=MESSAGE_NOT_VALID_INTEGER,
+        )
+
+    notes = NoteService.export_notes(int(batch_size))
+    lines = (current_app.json.dumps(note) + "\n" for note in notes)
+    return Response(stream_with_context(lines), status=200, mimetype=EXPORT_FORMATS[export_format])
+
+
+@exceptions_decorator
+def delete_note(id: str) -> ResponseReturnValue:
+    _id = _parse_object_id(id)
+
     NoteService.delete_note_by_id(_id)
     return jsonify(
         {
@@ -77,3 +185,19 @@ def delete_note(id: str) -> ResponseReturnValue:
             "code": CODE_SUCCESS_DELETE_NOTE,
         }
     ), 200
+
+
+@exceptions_decorator
+def delete_notes_bulk() -> ResponseReturnValue:
+    data = request.get_json()
+    payload = NoteBulkDeleteModel.model_validate(data)
+    ids = [_parse_object_id(value) for value in payload.ids]
+
+    result = NoteService.delete_notes_by_ids(ids, current_app.config["NOTES_BULK_DELETE_CHUNK_SIZE"])
+    return jsonify(
+        {
+            "message": MESSAGE_SUCCESS_DELETE_NOTES,
+            "code": CODE_SUCCESS_DELETE_NOTES,
+            "data": result,
+        }
+    ), 200
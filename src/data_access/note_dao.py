@@ -1,42 +1,76 @@
+from collections.abc import Iterator, Mapping
 from typing import Any
 
 from bson import ObjectId
-from pymongo.results import DeleteResult, InsertOneResult
+from pymongo import ASCENDING, DESCENDING
+from pymongo.change_stream import CollectionChangeStream
+from pymongo.collation import Collation, CollationStrength
+from pymongo.results import DeleteResult, InsertManyResult, InsertOneResult
 
 from src.configs.mongo_config import mongo
 
+NAME_COLLATION = Collation(locale="en", strength=CollationStrength.SECONDARY)
+
+WATCHED_OPERATIONS = ["insert", "update", "replace", "delete", "drop", "rename", "invalidate"]
+
 
 class NoteDAO:
+    @staticmethod
+    def create_indexes() -> None:
+        mongo.db.notes.create_index([("name", ASCENDING)], name="name_ci_unique", unique=True, collation=NAME_COLLATION)
+
+    @staticmethod
+    def find_duplicate_names() -> list[list[str]]:
+        pipeline: list[dict[str, Any]] = [
+            {"$group": {"_id": {"$toLower": "$name"}, "names": {"$push": "$name"}}},
+            {"$match": {"names.1": {"$exists": True}}},
+        ]
+        return [group["names"] for group in mongo.db.notes.aggregate(pipeline, collation=NAME_COLLATION)]
+
     @staticmethod
     def insert_one(note: dict[str, Any]) -> InsertOneResult:
         return mongo.db.notes.insert_one(note)
 
     @staticmethod
-    def find() -> list[dict[str, Any]]:
-        return NoteDAO.parse_notes(list(mongo.db.notes.find()))
+    def insert_many(notes: list[dict[str, Any]]) -> InsertManyResult:
+        return mongo.db.notes.insert_many(notes, ordered=False)
 
     @staticmethod
-    def find_one_by_id(_id: ObjectId) -> dict[str, Any] | None:
-        return NoteDAO.parse_note(mongo.db.notes.find_one({"_id": ObjectId(_id)}))
+    def projection(fields: list[str] | None) -> dict[str, int] | None:
+        return dict.fromkeys(fields, 1) if fields else None
 
     @staticmethod
-    def find_one_by_name(name: str) -> dict[str, Any] | None:
-        return NoteDAO.parse_note(mongo.db.notes.find_one({"name": {"$regex": f"^{name}$", "$options": "i"}}))
+    def find(fields: list[str] | None = None) -> list[dict[str, Any]]:
+        return list(mongo.db.notes.find({}, NoteDAO.projection(fields)))
+
+    @staticmethod
+    def find_page(limit: int, after: ObjectId | None = None, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        query: dict[str, Any] = {"_id": {"$gt": after}} if after is not None else {}
+        return list(mongo.db.notes.find(query, NoteDAO.projection(fields)).sort("_id", ASCENDING).limit(limit))
+
+    @staticmethod
+    def iter_all(batch_size: int) -> Iterator[dict[str, Any]]:
+        with mongo.db.notes.find().batch_size(batch_size) as cursor:
+            yield from cursor
+
+    @staticmethod
+    def version() -> str:
+        latest = mongo.db.notes.find_one({}, {"_id": 1}, sort=[("_id", DESCENDING)])
+        latest_id = latest["_id"] if latest else ""
+        return f"{latest_id}:{mongo.db.notes.estimated_document_count()}"
 
     @staticmethod
     def delete_one_by_id(_id: ObjectId) -> DeleteResult:
         return mongo.db.notes.delete_one({"_id": ObjectId(_id)})
 
     @staticmethod
-    def parse_notes(notes: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        return [parsed for note in notes if (parsed := NoteDAO.parse_note(note)) is not None]
+    def delete_many_by_ids(ids: list[ObjectId]) -> DeleteResult:
+        return mongo.db.notes.delete_many({"_id": {"$in": ids}})
 
     @staticmethod
-    def parse_note(note: dict[str, Any] | None) -> dict[str, Any] | None:
-        if not note:
-            return None
-
-        return {
-            **{k: v for k, v in note.items() if k != "_id"},
-            "_id": str(note["_id"]),
-        }
+    def watch(resume_after: Mapping[str, Any] | None, max_await_time_ms: int) -> CollectionChangeStream:
+        return mongo.db.notes.watch(
+            [{"$match": {"operationType": {"$in": WATCHED_OPERATIONS}}}],
+            resume_after=resume_after,
+            max_await_time_ms=max_await_time_ms,
+        )
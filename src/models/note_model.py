@@ -1,7 +1,17 @@
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, RootModel
 
 
 class NoteModel(BaseModel):
     model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
 
     name: str = Field(..., min_length=1, description="Note name")
+
+
+class NoteBulkDeleteModel(BaseModel):
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
+    ids: list[str] = Field(..., min_length=1, description="Ids of the notes to delete")
+
+
+class NoteBulkModel(RootModel[list[NoteModel]]):
+    root: list[NoteModel] = Field(..., min_length=1, description="Notes to create")
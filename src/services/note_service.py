@@ -1,8 +1,12 @@
+import hashlib
+from collections.abc import Iterator
 from typing import Any
 
 from bson import ObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from pymongo.results import DeleteResult, InsertOneResult
 
+from src.configs.cache_config import notes_cache
 from src.constants.codes import (
     CODE_ALREADY_EXISTS_NOTE,
     CODE_NOT_FOUND_NOTE,
@@ -15,27 +19,120 @@ from src.data_access.note_dao import NoteDAO
 from src.models.note_model import NoteModel
 from src.utils.exceptions import ConflictAPIError, NotFoundAPIError
 
+DUPLICATE_KEY_ERROR_CODE = 11000
+
 
 class NoteService:
     @staticmethod
     def add_note(note: NoteModel) -> InsertOneResult:
-        existing = NoteDAO.find_one_by_name(note.name)
-        if existing:
+        try:
+            result = NoteDAO.insert_one(note.model_dump())
+        except DuplicateKeyError:
             raise ConflictAPIError(
                 code=CODE_ALREADY_EXISTS_NOTE,
                 message=MESSAGE_ALREADY_EXISTS_NOTE,
-            )
-        return NoteDAO.insert_one(note.model_dump())
+            ) from None
+
+        notes_cache.clear()
+        return result
 
     @staticmethod
-    def get_all_notes() -> list[dict[str, Any]]:
-        return NoteDAO.find()
+    def add_notes(notes: list[NoteModel]) -> dict[str, list[dict[str, Any]]]:
+        documents: list[dict[str, Any]] = []
+        positions: list[int] = []
+        conflicts: list[dict[str, Any]] = []
+        seen: set[str] = set()
+
+        for index, note in enumerate(notes):
+            key = note.name.casefold()
+            if key in seen:
+                conflicts.append({"index": index, "name": note.name})
+                continue
+            seen.add(key)
+            documents.append(note.model_dump())
+            positions.append(index)
+
+        failed: set[int] = set()
+        if documents:
+            try:
+                NoteDAO.insert_many(documents)
+            except BulkWriteError as e:
+                for error in e.details.get("writeErrors", []):
+                    if error.get("code") != DUPLICATE_KEY_ERROR_CODE:
+                        raise
+                    failed.add(error["index"])
+            finally:
+                notes_cache.clear()
+
+        inserted: list[dict[str, Any]] = []
+        for position, (index, document) in enumerate(zip(positions, documents, strict=True)):
+            if position in failed:
+                conflicts.append({"index": index, "name": document["name"]})
+            else:
+                inserted.append({"index": index, "_id": str(document["_id"])})
+
+        conflicts.sort(key=lambda conflict: conflict["index"])
+        return {"inserted": inserted, "conflicts": conflicts}
+
+    @staticmethod
+    def get_all_notes(fields: list[str] | None = None) -> list[dict[str, Any]]:
+        key = ("all", tuple(fields or ()))
+        return notes_cache.get_or_load(key, lambda: NoteDAO.find(fields))
+
+    @staticmethod
+    def get_notes_version() -> str:
+        return notes_cache.get_or_load(("version",), NoteDAO.version)
+
+    @staticmethod
+    def get_notes_etag(version: str, limit: int, after: ObjectId | None, fields: list[str] | None) -> str:
+        key = f"{version}|{limit}|{after or ''}|{','.join(fields or ())}"
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def get_notes_page(
+        limit: int, after: ObjectId | None = None, fields: list[str] | None = None, version: str | None = None
+    ) -> tuple[list[dict[str, Any]], ObjectId | None, str]:
+        key = ("page", limit, after, tuple(fields or ()))
+        return notes_cache.get_or_load(key, lambda: NoteService._load_notes_page(limit, after, fields, version))
+
+    @staticmethod
+    def _load_notes_page(
+        limit: int, after: ObjectId | None, fields: list[str] | None, version: str | None
+    ) -> tuple[list[dict[str, Any]], ObjectId | None, str]:
+        # Read the version first so a page is never labelled newer than its contents.
+        if version is None:
+            version = NoteService.get_notes_version()
+        notes = NoteDAO.find_page(limit + 1, after, fields)
+
+        if len(notes) <= limit:
+            return notes, None, version
+
+        notes = notes[:limit]
+        return notes, ObjectId(notes[-1]["_id"]), version
+
+    @staticmethod
+    def export_notes(batch_size: int) -> Iterator[dict[str, Any]]:
+        return NoteDAO.iter_all(batch_size)
 
     @staticmethod
     def delete_note_by_id(_id: ObjectId) -> DeleteResult:
-        existing = NoteDAO.find_one_by_id(_id)
+        result = NoteDAO.delete_one_by_id(_id)
 
-        if not existing:
+        if result.deleted_count == 0:
             raise NotFoundAPIError(code=CODE_NOT_FOUND_NOTE, message=MESSAGE_NOT_FOUND_NOTE)
 
-        return NoteDAO.delete_one_by_id(_id)
+        notes_cache.clear()
+        return result
+
+    @staticmethod
+    def delete_notes_by_ids(ids: list[ObjectId], chunk_size: int) -> dict[str, int]:
+        unique_ids = list(dict.fromkeys(ids))
+        deleted = 0
+
+        for start in range(0, len(unique_ids), chunk_size):
+            deleted += NoteDAO.delete_many_by_ids(unique_ids[start : start + chunk_size]).deleted_count
+
+        if deleted:
+            notes_cache.clear()
+
+        return {"deleted": deleted, "missing": len(unique_ids) - deleted}
@@ -0,0 +1,85 @@
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+from flask import Flask
+from pymongo.errors import OperationFailure, PyMongoError
+
+from src.configs.cache_config import notes_cache
+from src.configs.logger_config import setup_logger
+from src.data_access.note_dao import NoteDAO
+
+logger = setup_logger(__name__)
+
+CHANGE_STREAM_NOT_SUPPORTED_CODE = 40573
+CHANGE_STREAM_HISTORY_LOST_CODE = 286
+
+
+class NoteWatcher:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.retry_seconds = 5.0
+        self.max_await_time_ms = 1000
+        self.resume_token: Mapping[str, Any] | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def init_app(self, app: Flask) -> None:
+        self.enabled = app.config["NOTES_CACHE_WATCH_ENABLED"] and app.config["NOTES_CACHE_ENABLED"]
+        self.retry_seconds = app.config["NOTES_CACHE_WATCH_RETRY_SECONDS"]
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if not self.enabled or self.running:
+            return
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self.run, name="note-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.consume()
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAM_NOT_SUPPORTED_CODE:
+                    logger.warning("Change streams need a replica set, notes cache relies on its TTL only.")
+                    return
+                if e.code == CHANGE_STREAM_HISTORY_LOST_CODE:
+                    self.resume_token = None
+                logger.warning("Notes change stream failed, retrying in %ss: %s", self.retry_seconds, e)
+                self._stop.wait(self.retry_seconds)
+            except PyMongoError as e:
+                logger.warning("Notes change stream failed, retrying in %ss: %s", self.retry_seconds, e)
+                self._stop.wait(self.retry_seconds)
+
+    def consume(self) -> None:
+        with NoteDAO.watch(self.resume_token, self.max_await_time_ms) as stream:
+            # Writes may have been missed while the stream was down.
+            notes_cache.clear()
+            while stream.alive and not self._stop.is_set():
+                change = stream.try_next()
+                self.resume_token = stream.resume_token
+                if change is not None:
+                    self.apply(change)
+
+    def apply(self, change: dict[str, Any]) -> None:
+        notes_cache.clear()
+        if change["operationType"] == "invalidate":
+            self.resume_token = None
+
+
+note_watcher = NoteWatcher()
+
+
+def init_note_watcher(app: Flask) -> None:
+    note_watcher.init_app(app)
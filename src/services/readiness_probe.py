@@ -0,0 +1,68 @@
+import math
+import threading
+import time
+from collections.abc import Callable
+
+import pymongo
+from flask import Flask
+from pymongo.errors import PyMongoError
+
+from src.configs.logger_config import setup_logger
+from src.configs.mongo_config import mongo
+
+logger = setup_logger(__name__)
+
+
+class ReadinessProbe:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.cache_seconds = 1.0
+        self.timeout_seconds = 1.0
+        self.ready: bool | None = None
+        self.checked_at = -math.inf
+
+    def init_app(self, app: Flask) -> None:
+        self.cache_seconds = app.config["READINESS_CACHE_SECONDS"]
+        self.timeout_seconds = app.config["READINESS_PING_TIMEOUT_MS"] / 1000
+        self.ready = None
+        self.checked_at = -math.inf
+
+    def _fresh(self) -> bool:
+        return self.ready is not None and self._clock() - self.checked_at < self.cache_seconds
+
+    def check(self) -> bool:
+        ready = self.ready
+        if ready is not None and self._fresh():
+            return ready
+
+        # Single flight: one caller pings while the others keep answering with the last result.
+        # Only the very first check, which has no result to fall back on, waits for the ping.
+        if ready is not None and not self._lock.acquire(blocking=False):
+            return ready
+        if ready is None:
+            self._lock.acquire()
+
+        try:
+            if not self._fresh():
+                self.ready = self.ping()
+                self.checked_at = self._clock()
+            return bool(self.ready)
+        finally:
+            self._lock.release()
+
+    def ping(self) -> bool:
+        try:
+            with pymongo.timeout(self.timeout_seconds):
+                mongo.db.command("ping")
+        except PyMongoError as e:
+            logger.warning("Readiness ping to MongoDB failed: %s", e)
+            return False
+        return True
+
+
+readiness_probe = ReadinessProbe()
+
+
+def init_readiness_probe(app: Flask) -> None:
+    readiness_probe.init_app(app)
@@ -0,0 +1,23 @@
+from pymongo.errors import OperationFailure
+
+from src.configs.logger_config import setup_logger
+from src.data_access.note_dao import NoteDAO
+from src.services.note_service import DUPLICATE_KEY_ERROR_CODE
+
+logger = setup_logger(__name__)
+
+
+def create_indexes() -> bool:
+    try:
+        NoteDAO.create_indexes()
+    except OperationFailure as e:
+        if e.code != DUPLICATE_KEY_ERROR_CODE:
+            raise
+        # Failing here would crash-loop every worker, so keep serving and leave the clean-up to an operator.
+        logger.error(
+            "Cannot build the unique name index, these notes differ only by case: %s. "
+            "Rename or delete all but one of each group and restart to enforce unique names.",
+            NoteDAO.find_duplicate_names(),
+        )
+        return False
+    return True
@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from src.utils.metrics import Counter
+
+MISSING = object()
+
+HIT = ("hit",)
+MISS = ("miss",)
+EVICTION = ("eviction",)
+
+
+class TTLCache:
+    def __init__(
+        self,
+        sizeof: Callable[[Any], int],
+        clock: Callable[[], float] = time.monotonic,
+        events: Counter | None = None,
+    ) -> None:
+        self._sizeof = sizeof
+        self._clock = clock
+        self._events = events or Counter("cache_events_total", "Cache lookups and evictions.", ("event",))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+        # Bumped on every clear so a load that started before a write cannot store its stale result afterwards.
+        self._generation = 0
+        self.enabled = False
+        self.ttl_seconds = 0.0
+        self.max_entries = 0
+        self.max_bytes = 0
+
+    def configure(self, enabled: bool, ttl_seconds: float, max_entries: int, max_bytes: int) -> None:
+        with self._lock:
+            self.enabled = enabled
+            self.ttl_seconds = ttl_seconds
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._entries.clear()
+            self._bytes = 0
+            self._generation += 1
+
+    def get(self, key: Hashable) -> Any:
+        if not self.enabled:
+            return MISSING
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self._bytes -= entry[1]
+                entry = None
+            elif entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            self._events.inc(MISS)
+            return MISSING
+
+        self._events.inc(HIT)
+        return entry[2]
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        if not self.enabled:
+            return
+
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        evicted = 0
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (self._clock() + self.ttl_seconds, size, value)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                evicted += 1
+
+        if evicted:
+            self._events.inc(EVICTION, evicted)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is MISSING:
+            generation = self._generation
+            value = loader()
+            self.set(key, value, generation)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._generation += 1
+
+    def stats(self) -> dict[str, Any]:
+        events = self._events.snapshot()
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": events.get(HIT, 0),
+                "misses": events.get(MISS, 0),
+                "evictions": events.get(EVICTION, 0),
+            }
@@ -69,6 +69,11 @@ class BusinessAPIError(BaseAPIError):
     message = "Business rule violated"
 
 
+class ServiceUnavailableAPIError(BaseAPIError):
+    status_code = 503
+    message = "Service unavailable"
+
+
 class InternalAPIError(BaseAPIError):
     status_code = 500
     message = "Internal error"
@@ -1,5 +1,8 @@
+import base64
 from typing import Any
 
+from bson import ObjectId
+
 
 def is_positive_integer(value: Any) -> bool:
     try:
@@ -12,3 +15,12 @@ def is_positive_integer(value: Any) -> bool:
         return False
     except Exception:
         return False
+
+
+def encode_cursor(_id: ObjectId) -> str:
+    return base64.urlsafe_b64encode(_id.binary).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> ObjectId:
+    padding = "=" * (-len(cursor) % 4)
+    return ObjectId(base64.urlsafe_b64decode(cursor + padding))
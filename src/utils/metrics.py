@@ -0,0 +1,235 @@
+import bisect
+import json
+import math
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Any, TypeVar
+
+LabelValues = tuple[str, ...]
+Snapshot = dict[str, dict[LabelValues, Any]]
+
+SNAPSHOT_PREFIX = "metrics_"
+ARCHIVE_FILE = "metrics_archive.json"
+
+M = TypeVar("M", bound="Metric")
+
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series: dict[LabelValues, Any] = {}
+
+    def snapshot(self) -> dict[LabelValues, Any]:
+        with self._lock:
+            return {labels: self._copy(value) for labels, value in self._series.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        return value
+
+    @staticmethod
+    def merge(left: Any, right: Any) -> Any:
+        return left + right
+
+    def samples(self, value: Any) -> Iterable[tuple[str, tuple[tuple[str, str], ...], float]]:
+        yield self.name, (), value
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0.0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0.0) + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0.0) - amount
+
+    def set(self, labels: LabelValues, value: float) -> None:
+        with self._lock:
+            self._series[labels] = value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float]) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # One non-cumulative count per bucket, one for +Inf, then the sum of observed values.
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        return list(value)
+
+    @staticmethod
+    def merge(left: Any, right: Any) -> Any:
+        return [a + b for a, b in zip(left, right, strict=True)]
+
+    def samples(self, value: Any) -> Iterable[tuple[str, tuple[tuple[str, str], ...], float]]:
+        cumulative = 0.0
+        for bound, count in zip((*self.buckets, math.inf), value[:-1], strict=True):
+            cumulative += count
+            yield f"{self.name}_bucket", (("le", format_value(bound)),), cumulative
+        yield f"{self.name}_sum", (), value[-1]
+        yield f"{self.name}_count", (), cumulative
+
+
+def format_value(value: float) -> str:
+    return "+Inf" if value == math.inf else repr(float(value))
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float]
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name!r} is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Metric:
+        return self._metrics[name]
+
+    def clear(self) -> None:
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def snapshot(self) -> Snapshot:
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def merge(self, snapshots: Iterable[Snapshot]) -> Snapshot:
+        merged: Snapshot = {name: {} for name in self._metrics}
+        for snapshot in snapshots:
+            for name, series in snapshot.items():
+                metric = self._metrics.get(name)
+                if metric is None:
+                    continue
+                target = merged[name]
+                for labels, value in series.items():
+                    target[labels] = metric.merge(target[labels], value) if labels in target else value
+        return merged
+
+    def archive(self, directory: str, pid: int) -> None:
+        path = snapshot_path(directory, pid)
+        if not os.path.exists(path):
+            return
+
+        # Gauges describe live processes only; counters and histograms must survive worker restarts.
+        finished = {
+            name: series
+            for name, series in read_snapshot(path).items()
+            if name in self._metrics and self._metrics[name].kind != "gauge"
+        }
+        archive_path = os.path.join(directory, ARCHIVE_FILE)
+        write_snapshot(archive_path, self.merge([read_snapshot(archive_path), finished]))
+        os.remove(path)
+
+    def render(self, snapshot: Snapshot) -> str:
+        lines: list[str] = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for labels, value in sorted(snapshot.get(name, {}).items()):
+                pairs = tuple(zip(metric.labelnames, labels, strict=True))
+                for sample, extra, number in metric.samples(value):
+                    rendered = ",".join(f'{key}="{escape_label(item)}"' for key, item in (*pairs, *extra))
+                    lines.append(
+                        f"{sample}{{{rendered}}} {format_value(number)}"
+                        if rendered
+                        else f"{sample} {format_value(number)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+
+def encode_snapshot(snapshot: Snapshot) -> str:
+    return json.dumps(
+        {name: [[list(labels), value] for labels, value in series.items()] for name, series in snapshot.items()}
+    )
+
+
+def decode_snapshot(data: str) -> Snapshot:
+    return {name: {tuple(labels): value for labels, value in series} for name, series in json.loads(data).items()}
+
+
+def snapshot_path(directory: str, pid: int) -> str:
+    return os.path.join(directory, f"{SNAPSHOT_PREFIX}{pid}.json")
+
+
+def write_snapshot(path: str, snapshot: Snapshot) -> None:
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as file:
+        file.write(encode_snapshot(snapshot))
+    os.replace(temporary, path)
+
+
+def read_snapshot(path: str) -> Snapshot:
+    try:
+        with open(path, encoding="utf-8") as file:
+            return decode_snapshot(file.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def remove_snapshots(directory: str) -> None:
+    # Only this module's files are removed, so a shared or mistyped directory keeps everything else.
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.startswith(SNAPSHOT_PREFIX) and name.endswith((".json", ".json.tmp")):
+            os.remove(os.path.join(directory, name))
+
+
+def read_snapshots(directory: str, exclude_pid: int | None = None) -> list[Snapshot]:
+    if not os.path.isdir(directory):
+        return []
+
+    excluded = os.path.basename(snapshot_path(directory, exclude_pid)) if exclude_pid is not None else None
+    return [
+        read_snapshot(os.path.join(directory, name))
+        for name in sorted(os.listdir(directory))
+        if name.startswith(SNAPSHOT_PREFIX) and name.endswith(".json") and name != excluded
+    ]
@@ -10,6 +10,7 @@ from flask.testing import FlaskClient
 from pymongo.database import Database
 
 from app import create_app
+from src.startup.init_indexes import create_indexes
 
 
 def start_test_database() -> None:
@@ -62,11 +63,12 @@ def client(app: Flask) -> FlaskClient:
 
 
 @pytest.fixture(scope="function")
-def mongo_db(database_container: None) -> Generator[Database, None, None]:
+def mongo_db(app: Flask) -> Generator[Database, None, None]:
     uri: str = os.environ.get("MONGO_URI", "")
     db_name: str = os.environ.get("MONGO_DB_NAME", "test_db")
     mongo_client = pymongo.MongoClient(uri)
     db = mongo_client[db_name]
+    create_indexes()
     yield db
     db.client.drop_database(db_name)
     mongo_client.close()
@@ -3,7 +3,7 @@ from typing import Any
 import pytest
 from flask.testing import FlaskClient
 
-from src.constants.codes import CODE_SUCCESS_HEALTH
+from src.constants.codes import CODE_SUCCESS_HEALTH, CODE_SUCCESS_READY
 from src.constants.messages import MESSAGE_SUCCESS_HEALTH
 
 
@@ -39,3 +39,34 @@ class TestHealthRoute:
         response = client.get("/api/v1/health/status")
 
         assert response.status_code == 404
+
+
+class TestMetricsRoute:
+    @pytest.mark.integration
+    def test_exposes_request_metrics(self, client: FlaskClient) -> None:
+        client.get("/api/v1/health/", buffered=True)
+        response = client.get("/api/v1/health/metrics")
+
+        assert response.status_code == 200
+        assert response.content_type == "text/plain; version=0.0.4; charset=utf-8"
+        assert (
+            'http_request_duration_seconds_count{method="GET",endpoint="health.health",status="200"}' in response.text
+        )
+
+
+class TestPoolRoute:
+    @pytest.mark.integration
+    def test_returns_pool_statistics(self, client: FlaskClient) -> None:
+        response = client.get("/api/v1/health/pool")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"]["settings"]["worker_class"] in {"sync", "gthread", "gevent"}
+
+
+class TestReadyRoute:
+    @pytest.mark.integration
+    def test_returns_200_when_database_answers(self, client: FlaskClient) -> None:
+        response = client.get("/api/v1/health/ready")
+
+        assert response.status_code == 200
+        assert response.get_json()["code"] == CODE_SUCCESS_READY
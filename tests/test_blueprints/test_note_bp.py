@@ -1,3 +1,4 @@
+import json
 from typing import Any
 
 import pytest
@@ -114,6 +115,39 @@ class TestCreateNoteRoute:
         assert response.content_type == "application/json"
 
 
+class TestCreateNotesBulkRoute:
+    @pytest.mark.integration
+    def test_returns_201(self, client: FlaskClient, mongo_db: Database) -> None:
+        response = client.post("/api/v1/notes/bulk", json=[{"name": "bulk_a"}, {"name": "bulk_b"}])
+        assert response.status_code == 201
+
+    @pytest.mark.integration
+    def test_reports_inserted_and_conflicts(self, client: FlaskClient, mongo_db: Database) -> None:
+        client.post("/api/v1/notes/", json={"name": "bulk_taken"})
+        response = client.post(
+            "/api/v1/notes/bulk", json=[{"name": "bulk_taken"}, {"name": "bulk_new"}, {"name": "bulk_new"}]
+        )
+        data: dict[str, Any] = response.get_json()["data"]
+        assert [item["index"] for item in data["inserted"]] == [1]
+        assert [item["index"] for item in data["conflicts"]] == [0, 2]
+
+    @pytest.mark.integration
+    def test_inserted_notes_are_listed(self, client: FlaskClient, mongo_db: Database) -> None:
+        client.post("/api/v1/notes/bulk", json=[{"name": "bulk_listed"}])
+        names: list[str] = [n["name"] for n in client.get("/api/v1/notes/").get_json()["data"]]
+        assert "bulk_listed" in names
+
+    @pytest.mark.integration
+    def test_returns_400_when_any_item_is_invalid(self, client: FlaskClient, mongo_db: Database) -> None:
+        response = client.post("/api/v1/notes/bulk", json=[{"name": "bulk_ok"}, {"name": ""}])
+        assert response.status_code == 400
+
+    @pytest.mark.integration
+    def test_returns_400_with_empty_list(self, client: FlaskClient) -> None:
+        response = client.post("/api/v1/notes/bulk", json=[])
+        assert response.status_code == 400
+
+
 class TestGetNotesRoute:
     @pytest.mark.integration
     def test_returns_200(self, client: FlaskClient) -> None:
@@ -159,6 +193,79 @@ class TestGetNotesRoute:
         data: dict[str, Any] = response.get_json()
         assert data["data"] == []
 
+    @pytest.mark.integration
+    def test_paginates_with_next_cursor(self, client: FlaskClient, mongo_db: Database) -> None:
+        for name in ("page_a", "page_b", "page_c"):
+            client.post("/api/v1/notes/", json={"name": name})
+        first: dict[str, Any] = client.get("/api/v1/notes/?limit=2").get_json()
+        second: dict[str, Any] = client.get(f"/api/v1/notes/?limit=2&after={first['next_cursor']}").get_json()
+        assert [n["name"] for n in first["data"]] == ["page_a", "page_b"]
+        assert [n["name"] for n in second["data"]] == ["page_c"]
+        assert second["next_cursor"] is None
+
+    @pytest.mark.integration
+    def test_returns_400_with_invalid_limit(self, client: FlaskClient) -> None:
+        response = client.get("/api/v1/notes/?limit=0")
+        assert response.status_code == 400
+
+    @pytest.mark.integration
+    def test_returns_400_with_invalid_cursor(self, client: FlaskClient) -> None:
+        response = client.get("/api/v1/notes/?after=not_a_cursor")
+        assert response.status_code == 400
+
+    @pytest.mark.integration
+    def test_returns_only_requested_fields(self, client: FlaskClient, mongo_db: Database) -> None:
+        client.post("/api/v1/notes/", json={"name": "fields_note"})
+        notes: list[dict[str, Any]] = client.get("/api/v1/notes/?fields=_id").get_json()["data"]
+        assert [set(note) for note in notes] == [{"_id"}]
+
+    @pytest.mark.integration
+    def test_returns_304_for_unchanged_listing(self, client: FlaskClient, mongo_db: Database) -> None:
+        client.post("/api/v1/notes/", json={"name": "etag_note"})
+        first = client.get("/api/v1/notes/")
+        second = client.get("/api/v1/notes/", headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 304
+        assert second.headers["ETag"] == first.headers["ETag"]
+
+    @pytest.mark.integration
+    def test_returns_200_after_listing_changes(self, client: FlaskClient, mongo_db: Database) -> None:
+        client.post("/api/v1/notes/", json={"name": "etag_before"})
+        first = client.get("/api/v1/notes/")
+        client.post("/api/v1/notes/", json={"name": "etag_after"})
+        second = client.get("/api/v1/notes/", headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 200
+        assert second.headers["ETag"] != first.headers["ETag"]
+
+    @pytest.mark.integration
+    def test_returns_400_with_unknown_field(self, client: FlaskClient) -> None:
+        response = client.get("/api/v1/notes/?fields=unknown")
+        assert response.status_code == 400
+
+
+class TestExportNotesRoute:
+    @pytest.mark.integration
+    def test_returns_200(self, client: FlaskClient, mongo_db: Database) -> None:
+        response = client.get("/api/v1/notes/export?format=ndjson")
+        assert response.status_code == 200
+
+    @pytest.mark.integration
+    def test_response_is_ndjson(self, client: FlaskClient, mongo_db: Database) -> None:
+        response = client.get("/api/v1/notes/export?format=ndjson")
+        assert response.content_type == "application/x-ndjson"
+
+    @pytest.mark.integration
+    def test_streams_one_line_per_note(self, client: FlaskClient, mongo_db: Database) -> None:
+        client.post("/api/v1/notes/", json={"name": "export_a"})
+        client.post("/api/v1/notes/", json={"name": "export_b"})
+        response = client.get("/api/v1/notes/export?format=ndjson&batch_size=1")
+        lines: list[dict[str, Any]] = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert sorted(line["name"] for line in lines) == ["export_a", "export_b"]
+
+    @pytest.mark.integration
+    def test_returns_400_with_unknown_format(self, client: FlaskClient) -> None:
+        response = client.get("/api/v1/notes/export?format=xml")
+        assert response.status_code == 400
+
 
 class TestDeleteNoteRoute:
     @pytest.mark.integration
@@ -200,3 +307,27 @@ class TestDeleteNoteRoute:
         _id: str = post_data["data"]
         response = client.delete(f"/api/v1/notes/{_id}")
         assert response.content_type == "application/json"
+
+
+class TestDeleteNotesBulkRoute:
+    @pytest.mark.integration
+    def test_returns_deleted_and_missing_counts(self, client: FlaskClient, mongo_db: Database) -> None:
+        ids: list[str] = [
+            client.post("/api/v1/notes/", json={"name": name}).get_json()["data"]
+            for name in ("bulk_del_a", "bulk_del_b")
+        ]
+        response = client.post("/api/v1/notes/bulk-delete", json={"ids": [*ids, str(ObjectId())]})
+        assert response.status_code == 200
+        assert response.get_json()["data"] == {"deleted": 2, "missing": 1}
+
+    @pytest.mark.integration
+    def test_notes_are_gone_after_bulk_delete(self, client: FlaskClient, mongo_db: Database) -> None:
+        _id: str = client.post("/api/v1/notes/", json={"name": "bulk_del_gone"}).get_json()["data"]
+        client.post("/api/v1/notes/bulk-delete", json={"ids": [_id]})
+        response = client.delete(f"/api/v1/notes/{_id}")
+        assert response.status_code == 404
+
+    @pytest.mark.integration
+    def test_returns_400_with_invalid_id(self, client: FlaskClient) -> None:
+        response = client.post("/api/v1/notes/bulk-delete", json={"ids": ["not_a_valid_id"]})
+        assert response.status_code == 400
@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock
+
+import bson
+import pytest
+from bson import ObjectId
+from flask import Flask
+
+from src.configs.cache_config import NOTES_CACHE_EVENTS, bson_size, init_cache, notes_cache
+from src.configs.metrics_config import metrics
+
+
+class TestBsonSize:
+    @pytest.mark.unit
+    def test_matches_encoded_size(self) -> None:
+        notes = [{"_id": ObjectId(), "name": "a"}]
+        assert bson_size(notes) == len(bson.encode({"value": notes}))
+
+    @pytest.mark.unit
+    def test_supports_page_tuples(self) -> None:
+        assert bson_size(([], ObjectId())) > 0
+
+
+class TestInitCache:
+    @pytest.mark.unit
+    def test_configures_notes_cache_from_app_config(self) -> None:
+        mock_app: MagicMock = MagicMock(spec=Flask)
+        mock_app.config = {
+            "NOTES_CACHE_ENABLED": True,
+            "NOTES_CACHE_TTL_SECONDS": 3.0,
+            "NOTES_CACHE_MAX_ENTRIES": 7,
+            "NOTES_CACHE_MAX_BYTES": 1024,
+        }
+        try:
+            init_cache(mock_app)
+            assert notes_cache.enabled is True
+            assert notes_cache.ttl_seconds == 3.0
+            assert notes_cache.max_entries == 7
+            assert notes_cache.max_bytes == 1024
+        finally:
+            notes_cache.configure(enabled=False, ttl_seconds=0, max_entries=0, max_bytes=0)
+
+
+class TestNotesCacheEvents:
+    @pytest.mark.unit
+    def test_notes_cache_counts_into_metrics_registry(self) -> None:
+        notes_cache.configure(enabled=True, ttl_seconds=10, max_entries=10, max_bytes=1024)
+        try:
+            notes_cache.get("missing")
+            assert metrics.get("notes_cache_events_total").snapshot()[("miss",)] >= 1
+        finally:
+            notes_cache.configure(enabled=False, ttl_seconds=0, max_entries=0, max_bytes=0)
+            NOTES_CACHE_EVENTS.clear()
@@ -0,0 +1,157 @@
+import gzip
+import zlib
+from collections.abc import Callable, Iterator
+from unittest.mock import patch
+
+import brotli
+import pytest
+import zstandard
+from flask import Flask, Response, jsonify
+
+from src.configs.compression_config import available_encodings, compress_stream, init_compression
+
+PAYLOAD = {"data": [{"_id": f"{index:024x}", "name": f"note {index}"} for index in range(100)]}
+
+
+def make_app(**config: object) -> Flask:
+    app = Flask(__name__)
+    app.config.update(
+        COMPRESSION_ENABLED=True,
+        COMPRESSION_ALGORITHMS="zstd,br,gzip",
+        COMPRESSION_MIN_SIZE=500,
+        COMPRESSION_STREAM_FLUSH_BYTES=1024,
+        COMPRESSION_GZIP_LEVEL=6,
+        COMPRESSION_BROTLI_LEVEL=4,
+        COMPRESSION_ZSTD_LEVEL=3,
+    )
+    app.config.update(config)
+    init_compression(app)
+
+    @app.get("/large")
+    def large() -> tuple[Response, int]:
+        response = jsonify(PAYLOAD)
+        response.set_etag("abc")
+        return response, 200
+
+    @app.get("/small")
+    def small() -> tuple[Response, int]:
+        return jsonify({"ok": True}), 200
+
+    @app.get("/stream")
+    def stream() -> Response:
+        def generate() -> Iterator[str]:
+            for note in PAYLOAD["data"]:
+                yield f'{{"name": "{note["name"]}"}}\n'
+
+        return Response(generate(), mimetype="application/x-ndjson")
+
+    @app.get("/binary")
+    def binary() -> Response:
+        return Response(b"\x00" * 2048, mimetype="application/octet-stream")
+
+    @app.get("/not-modified")
+    def not_modified() -> Response:
+        return Response(status=304)
+
+    return app
+
+
+class TestAvailableEncodings:
+    @pytest.mark.unit
+    def test_keeps_preference_order(self) -> None:
+        assert available_encodings(" GZIP ,br") == ["gzip", "br"]
+
+    @pytest.mark.unit
+    def test_skips_unknown_and_uninstalled(self) -> None:
+        with patch("src.configs.compression_config.zstandard", None):
+            assert available_encodings("zstd,deflate,gzip") == ["gzip"]
+
+
+class TestCompressStream:
+    @pytest.mark.unit
+    def test_gzip_round_trip(self) -> None:
+        body = b"".join(compress_stream(["a" * 100, b"b" * 100], "gzip", 6))
+        assert gzip.decompress(body) == b"a" * 100 + b"b" * 100
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+    def test_flushes_every_flush_bytes(self, encoding: str) -> None:
+        decompress: Callable[[bytes], bytes] = {
+            "gzip": zlib.decompressobj(16 + zlib.MAX_WBITS).decompress,
+            "br": brotli.Decompressor().process,
+            "zstd": zstandard.ZstdDecompressor().decompressobj().decompress,
+        }[encoding]
+        rows = [f"row {index}\n" for index in range(1_000)]
+        chunks = list(compress_stream(rows, encoding, 3, flush_bytes=100))
+        # Everything but the final chunk must already decode to all rows except the last unflushed ones.
+        flushed = decompress(b"".join(chunks[:-1]))
+        assert "".join(rows).encode().startswith(flushed)
+        assert len(flushed) > len("".join(rows)) - 100
+
+    @pytest.mark.unit
+    def test_does_not_flush_without_flush_bytes(self) -> None:
+        stream = compress_stream((f"row {index}\n" for index in range(1_000)), "gzip", 6)
+        assert len(list(stream)) <= 2
+
+
+class TestCompressResponse:
+    @pytest.mark.unit
+    def test_gzip_compresses_large_json(self) -> None:
+        response = make_app().test_client().get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert int(response.headers["Content-Length"]) == len(response.data)
+        assert gzip.decompress(response.data) == make_app().test_client().get("/large").data
+
+    @pytest.mark.unit
+    def test_prefers_zstd(self) -> None:
+        zstandard = pytest.importorskip("zstandard")
+        response = make_app().test_client().get("/large", headers={"Accept-Encoding": "gzip, br, zstd"})
+        assert response.headers["Content-Encoding"] == "zstd"
+        assert b"note 99" in zstandard.ZstdDecompressor().decompressobj().decompress(response.data)
+
+    @pytest.mark.unit
+    def test_brotli(self) -> None:
+        brotli = pytest.importorskip("brotli")
+        response = make_app().test_client().get("/large", headers={"Accept-Encoding": "br"})
+        assert response.headers["Content-Encoding"] == "br"
+        assert b"note 99" in brotli.decompress(response.data)
+
+    @pytest.mark.unit
+    def test_weakens_etag_when_compressed(self) -> None:
+        response = make_app().test_client().get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["ETag"] == 'W/"abc"'
+
+    @pytest.mark.unit
+    def test_identity_without_accept_encoding(self) -> None:
+        response = make_app().test_client().get("/large")
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["ETag"] == '"abc"'
+
+    @pytest.mark.unit
+    def test_skips_small_bodies(self) -> None:
+        response = make_app().test_client().get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+    @pytest.mark.unit
+    def test_skips_non_compressible_mimetypes(self) -> None:
+        response = make_app().test_client().get("/binary", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+    @pytest.mark.unit
+    def test_skips_not_modified(self) -> None:
+        response = make_app().test_client().get("/not-modified", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 304
+        assert "Content-Encoding" not in response.headers
+
+    @pytest.mark.unit
+    def test_compresses_streamed_responses_incrementally(self) -> None:
+        response = make_app().test_client().get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.is_streamed
+        assert gzip.decompress(response.data).splitlines()[-1] == b'{"name": "note 99"}'
+
+    @pytest.mark.unit
+    def test_disabled(self) -> None:
+        response = make_app(COMPRESSION_ENABLED=False).test_client().get("/large", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
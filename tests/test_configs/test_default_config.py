@@ -16,6 +16,10 @@ class TestDefaultConfig:
     def test_json_as_ascii_is_false(self) -> None:
         assert DefaultConfig.JSON_AS_ASCII is False
 
+    @pytest.mark.unit
+    def test_json_provider_defaults_to_orjson(self) -> None:
+        assert DefaultConfig.JSON_PROVIDER == "orjson"
+
     @pytest.mark.unit
     def test_mongo_uri_starts_with_mongodb(self) -> None:
         assert DefaultConfig.MONGO_URI.startswith("mongodb://")
@@ -36,3 +40,88 @@ class TestDefaultConfig:
     @pytest.mark.unit
     def test_mongo_user_is_string(self) -> None:
         assert isinstance(DefaultConfig.MONGO_USER, str)
+
+    @pytest.mark.unit
+    def test_notes_page_default_limit_is_positive(self) -> None:
+        assert DefaultConfig.NOTES_PAGE_DEFAULT_LIMIT > 0
+
+    @pytest.mark.unit
+    def test_notes_page_default_limit_does_not_exceed_max(self) -> None:
+        assert DefaultConfig.NOTES_PAGE_DEFAULT_LIMIT <= DefaultConfig.NOTES_PAGE_MAX_LIMIT
+
+    @pytest.mark.unit
+    def test_notes_export_batch_size_is_positive(self) -> None:
+        assert DefaultConfig.NOTES_EXPORT_BATCH_SIZE > 0
+
+    @pytest.mark.unit
+    def test_notes_bulk_delete_chunk_size_is_positive(self) -> None:
+        assert DefaultConfig.NOTES_BULK_DELETE_CHUNK_SIZE > 0
+
+    @pytest.mark.unit
+    def test_mongo_max_pool_size_covers_gunicorn_threads(self) -> None:
+        assert DefaultConfig.MONGO_MAX_POOL_SIZE >= DefaultConfig.GUNICORN_THREADS
+
+    @pytest.mark.unit
+    def test_gunicorn_worker_concurrency_matches_worker_class(self) -> None:
+        expected: int = (
+            DefaultConfig.GUNICORN_WORKER_CONNECTIONS
+            if DefaultConfig.GUNICORN_WORKER_CLASS == "gevent"
+            else DefaultConfig.GUNICORN_THREADS
+        )
+        assert expected == DefaultConfig.GUNICORN_WORKER_CONCURRENCY
+
+    @pytest.mark.unit
+    def test_mongo_min_pool_size_does_not_exceed_max(self) -> None:
+        assert 0 <= DefaultConfig.MONGO_MIN_POOL_SIZE <= DefaultConfig.MONGO_MAX_POOL_SIZE
+
+    @pytest.mark.unit
+    def test_mongo_timeouts_are_positive(self) -> None:
+        assert DefaultConfig.MONGO_MAX_IDLE_TIME_MS > 0
+        assert DefaultConfig.MONGO_WAIT_QUEUE_TIMEOUT_MS > 0
+        assert DefaultConfig.MONGO_CONNECT_TIMEOUT_MS > 0
+        assert DefaultConfig.MONGO_SOCKET_TIMEOUT_MS > 0
+        assert DefaultConfig.MONGO_SERVER_SELECTION_TIMEOUT_MS > 0
+
+    @pytest.mark.unit
+    def test_compression_defaults(self) -> None:
+        assert DefaultConfig.COMPRESSION_ENABLED is True
+        assert DefaultConfig.COMPRESSION_ALGORITHMS == "zstd,br,gzip"
+        assert DefaultConfig.COMPRESSION_MIN_SIZE > 0
+        assert DefaultConfig.COMPRESSION_STREAM_FLUSH_BYTES > 0
+
+    @pytest.mark.unit
+    def test_metrics_are_per_process_by_default(self) -> None:
+        assert DefaultConfig.METRICS_MULTIPROC_DIR == ""
+        assert DefaultConfig.METRICS_FLUSH_SECONDS > 0
+
+    @pytest.mark.unit
+    def test_readiness_probe_defaults_are_positive(self) -> None:
+        assert DefaultConfig.READINESS_CACHE_SECONDS > 0
+        assert DefaultConfig.READINESS_PING_TIMEOUT_MS > 0
+
+    @pytest.mark.unit
+    def test_notes_cache_is_enabled_by_default(self) -> None:
+        assert DefaultConfig.NOTES_CACHE_ENABLED is True
+
+    @pytest.mark.unit
+    def test_notes_cache_limits_are_positive(self) -> None:
+        assert DefaultConfig.NOTES_CACHE_TTL_SECONDS > 0
+        assert DefaultConfig.NOTES_CACHE_MAX_ENTRIES > 0
+        assert DefaultConfig.NOTES_CACHE_MAX_BYTES > 0
+
+    @pytest.mark.unit
+    def test_notes_cache_watcher_is_enabled_by_default(self) -> None:
+        assert DefaultConfig.NOTES_CACHE_WATCH_ENABLED is True
+        assert DefaultConfig.NOTES_CACHE_WATCH_RETRY_SECONDS > 0
+
+    @pytest.mark.unit
+    def test_mongo_compressors_is_string(self) -> None:
+        assert isinstance(DefaultConfig.MONGO_COMPRESSORS, str)
+
+    @pytest.mark.unit
+    def test_mongo_slow_command_threshold_is_positive(self) -> None:
+        assert DefaultConfig.MONGO_SLOW_COMMAND_MS > 0
+
+    @pytest.mark.unit
+    def test_mongo_zlib_compression_level_is_in_range(self) -> None:
+        assert -1 <= DefaultConfig.MONGO_ZLIB_COMPRESSION_LEVEL <= 9
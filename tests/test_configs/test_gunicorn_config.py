@@ -1,8 +1,9 @@
-import multiprocessing
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 import src.configs.gunicorn_config as gunicorn_config
+from src.configs.worker_profiles import WORKER_PROFILES, available_cpus
 
 
 class TestGunicornConfig:
@@ -17,8 +18,8 @@ class TestGunicornConfig:
         assert gunicorn_config.workers > 0
 
     @pytest.mark.unit
-    def test_workers_formula_matches_cpu_count(self) -> None:
-        expected: int = multiprocessing.cpu_count() * 2 + 1
+    def test_workers_formula_matches_available_cpus(self) -> None:
+        expected: int = available_cpus() * WORKER_PROFILES[gunicorn_config.worker_class]["workers_per_cpu"] + 1
         assert gunicorn_config.workers == expected
 
     @pytest.mark.unit
@@ -48,3 +49,135 @@ class TestGunicornConfig:
     @pytest.mark.unit
     def test_errorlog_is_stdout(self) -> None:
         assert gunicorn_config.errorlog == "-"
+
+    @pytest.mark.unit
+    def test_preload_app_is_bool(self) -> None:
+        assert isinstance(gunicorn_config.preload_app, bool)
+
+    @pytest.mark.unit
+    def test_when_ready_closes_master_mongo_client(self) -> None:
+        with patch("src.configs.mongo_config.mongo") as mock_mongo:
+            gunicorn_config.when_ready(MagicMock())
+        mock_mongo.close.assert_called_once()
+
+    @pytest.mark.unit
+    def test_post_fork_resets_mongo_client(self) -> None:
+        with patch("src.configs.mongo_config.mongo") as mock_mongo:
+            gunicorn_config.post_fork(MagicMock(), MagicMock())
+        mock_mongo.reset.assert_called_once()
+        mock_mongo.close.assert_not_called()
+
+    @pytest.mark.unit
+    def test_post_fork_clears_notes_cache(self) -> None:
+        with patch("src.configs.mongo_config.mongo"), patch("src.configs.cache_config.notes_cache") as mock_cache:
+            gunicorn_config.post_fork(MagicMock(), MagicMock())
+        mock_cache.clear.assert_called_once()
+
+    @pytest.mark.unit
+    def test_worker_class_defaults_to_gthread(self) -> None:
+        assert gunicorn_config.worker_class == "gthread"
+
+    @pytest.mark.unit
+    def test_worker_connections_is_positive_integer(self) -> None:
+        assert isinstance(gunicorn_config.worker_connections, int)
+        assert gunicorn_config.worker_connections > 0
+
+    @pytest.mark.unit
+    def test_threads_default_to_worker_profile(self) -> None:
+        assert gunicorn_config.threads == WORKER_PROFILES[gunicorn_config.worker_class]["threads"]
+
+    @pytest.mark.unit
+    def test_max_requests_is_positive_integer(self) -> None:
+        assert isinstance(gunicorn_config.max_requests, int)
+        assert gunicorn_config.max_requests > 0
+
+    @pytest.mark.unit
+    def test_max_requests_jitter_is_below_max_requests(self) -> None:
+        assert isinstance(gunicorn_config.max_requests_jitter, int)
+        assert 0 <= gunicorn_config.max_requests_jitter < gunicorn_config.max_requests
+
+    @pytest.mark.unit
+    def test_post_worker_init_starts_note_watcher(self) -> None:
+        with patch("src.services.note_watcher.note_watcher") as mock_watcher:
+            gunicorn_config.post_worker_init(MagicMock())
+        mock_watcher.start.assert_called_once()
+
+    @pytest.mark.unit
+    def test_worker_exit_stops_note_watcher(self) -> None:
+        with patch("src.services.note_watcher.note_watcher") as mock_watcher:
+            gunicorn_config.worker_exit(MagicMock(), MagicMock())
+        mock_watcher.stop.assert_called_once_with(timeout=5)
+
+    @pytest.mark.unit
+    def test_post_fork_clears_metrics(self) -> None:
+        with (
+            patch("src.configs.mongo_config.mongo"),
+            patch("src.configs.cache_config.notes_cache"),
+            patch("src.configs.metrics_config.metrics") as mock_metrics,
+        ):
+            gunicorn_config.post_fork(MagicMock(), MagicMock())
+        mock_metrics.clear.assert_called_once()
+
+    @pytest.mark.unit
+    def test_post_fork_resets_notes_cache_stats(self) -> None:
+        from src.configs.cache_config import NOTES_CACHE_EVENTS, notes_cache
+
+        NOTES_CACHE_EVENTS.inc(("hit",))
+        with patch("src.configs.mongo_config.mongo"):
+            gunicorn_config.post_fork(MagicMock(), MagicMock())
+        assert notes_cache.stats()["hits"] == 0
+
+    @pytest.mark.unit
+    def test_post_worker_init_starts_metrics_exporter(self) -> None:
+        with (
+            patch("src.services.note_watcher.note_watcher"),
+            patch("src.configs.metrics_config.metrics_exporter") as mock_exporter,
+        ):
+            gunicorn_config.post_worker_init(MagicMock())
+        mock_exporter.start.assert_called_once()
+
+    @pytest.mark.unit
+    def test_worker_exit_stops_metrics_exporter(self) -> None:
+        with (
+            patch("src.services.note_watcher.note_watcher"),
+            patch("src.configs.metrics_config.metrics_exporter") as mock_exporter,
+        ):
+            gunicorn_config.worker_exit(MagicMock(), MagicMock())
+        mock_exporter.stop.assert_called_once_with(timeout=5)
+
+    @pytest.mark.unit
+    def test_on_starting_removes_metrics_snapshots(self) -> None:
+        with (
+            patch.object(gunicorn_config, "metrics_dir", "metrics-dir"),
+            patch("src.utils.metrics.remove_snapshots") as mock_remove,
+        ):
+            gunicorn_config.on_starting(MagicMock())
+        mock_remove.assert_called_once_with("metrics-dir")
+
+    @pytest.mark.unit
+    def test_on_starting_without_metrics_dir_is_a_no_op(self) -> None:
+        with (
+            patch.object(gunicorn_config, "metrics_dir", None),
+            patch("src.utils.metrics.remove_snapshots") as mock_remove,
+        ):
+            gunicorn_config.on_starting(MagicMock())
+        mock_remove.assert_not_called()
+
+    @pytest.mark.unit
+    def test_child_exit_archives_worker_metrics(self) -> None:
+        worker = MagicMock(pid=1234)
+        with (
+            patch.object(gunicorn_config, "metrics_dir", "metrics-dir"),
+            patch("src.configs.metrics_config.metrics") as mock_metrics,
+        ):
+            gunicorn_config.child_exit(MagicMock(), worker)
+        mock_metrics.archive.assert_called_once_with("metrics-dir", 1234)
+
+    @pytest.mark.unit
+    def test_child_exit_without_metrics_dir_is_a_no_op(self) -> None:
+        with (
+            patch.object(gunicorn_config, "metrics_dir", None),
+            patch("src.configs.metrics_config.metrics") as mock_metrics,
+        ):
+            gunicorn_config.child_exit(MagicMock(), MagicMock())
+        mock_metrics.archive.assert_not_called()
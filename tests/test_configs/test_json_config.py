@@ -0,0 +1,108 @@
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from bson import ObjectId
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from src.configs.json_config import JSON_PROVIDERS, OrjsonJSONProvider, StdlibJSONProvider, init_json
+
+RESPONSE_SHAPES: list[Any] = [
+    {"code": "SUCCESS_GET_ALL_NOTES", "data": [], "next_cursor": None},
+    {
+        "code": "SUCCESS_GET_ALL_NOTES",
+        "data": [
+            {"_id": "65a1b2c3d4e5f6a7b8c9d0e1", "name": "ñandú 📝"},
+            {"_id": "65a1b2c3d4e5f6a7b8c9d0e2", "name": "b"},
+        ],
+        "next_cursor": "ZaGyw9Tl9qe4ydDi",
+    },
+    {"code": "SUCCESS_ADD_NOTES", "data": {"inserted": [{"index": 0, "_id": "x"}], "conflicts": []}},
+    {"code": "NOT_VALID_FIELDS", "message": 'Invalid "name"\n\ttab', "payload": {"errors": [{"loc": ["name"]}]}},
+]
+
+
+def make_app(provider: str, debug: bool = False) -> Flask:
+    app = Flask(__name__)
+    app.config["JSON_PROVIDER"] = provider
+    app.debug = debug
+    init_json(app)
+    return app
+
+
+def flask_default_body(payload: Any, debug: bool) -> bytes:
+    app = Flask(__name__)
+    app.debug = debug
+    app.json.ensure_ascii = False  # type: ignore[attr-defined]
+    with app.app_context():
+        return app.json.response(payload).get_data()
+
+
+class TestInitJson:
+    @pytest.mark.unit
+    def test_installs_orjson_provider(self) -> None:
+        pytest.importorskip("orjson")
+        assert isinstance(make_app("orjson").json, OrjsonJSONProvider)
+
+    @pytest.mark.unit
+    def test_installs_stdlib_provider(self) -> None:
+        assert isinstance(make_app("stdlib").json, StdlibJSONProvider)
+
+    @pytest.mark.unit
+    def test_falls_back_to_stdlib_without_orjson(self) -> None:
+        with patch("src.configs.json_config.orjson", None):
+            app = make_app("orjson")
+        assert isinstance(app.json, StdlibJSONProvider)
+
+    @pytest.mark.unit
+    def test_invalid_provider_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid JSON_PROVIDER"):
+            make_app("ujson")
+
+
+@pytest.mark.parametrize("provider", sorted(JSON_PROVIDERS))
+class TestJsonProviders:
+    @pytest.fixture(autouse=True)
+    def require_backend(self, provider: str) -> None:
+        if provider == "orjson":
+            pytest.importorskip("orjson")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("debug", [False, True])
+    @pytest.mark.parametrize("payload", RESPONSE_SHAPES)
+    def test_response_is_byte_compatible_with_flask_default(self, provider: str, debug: bool, payload: Any) -> None:
+        app = make_app(provider, debug=debug)
+        with app.app_context():
+            body: bytes = app.json.response(payload).get_data()
+        assert body == flask_default_body(payload, debug)
+
+    @pytest.mark.unit
+    def test_serializes_objectid_as_string(self, provider: str) -> None:
+        _id: ObjectId = ObjectId()
+        assert make_app(provider).json.dumps({"_id": _id}) == f'{{"_id":"{_id}"}}'
+
+    @pytest.mark.unit
+    def test_serializes_datetime_as_iso_8601(self, provider: str) -> None:
+        moment = datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=UTC)
+        assert make_app(provider).json.dumps({"at": moment}) == '{"at":"2024-01-02T03:04:05.678000+00:00"}'
+
+    @pytest.mark.unit
+    def test_dumps_sorts_keys(self, provider: str) -> None:
+        assert make_app(provider).json.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+
+    @pytest.mark.unit
+    def test_loads_round_trips(self, provider: str) -> None:
+        payload: dict[str, Any] = {"name": "ñ", "items": [1, 2]}
+        app = make_app(provider)
+        assert app.json.loads(app.json.dumps(payload).encode()) == payload
+
+    @pytest.mark.unit
+    def test_loads_invalid_json_raises_value_error(self, provider: str) -> None:
+        with pytest.raises(ValueError):
+            make_app(provider).json.loads(b"{invalid")
+
+    @pytest.mark.unit
+    def test_is_flask_default_provider_subclass(self, provider: str) -> None:
+        assert isinstance(make_app(provider).json, DefaultJSONProvider)
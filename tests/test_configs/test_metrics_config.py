@@ -0,0 +1,161 @@
+import os
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask, Response, jsonify
+
+from src.configs.metrics_config import (
+    REQUEST_LATENCY,
+    REQUESTS_IN_FLIGHT,
+    RESPONSE_SIZE,
+    MetricsExporter,
+    MetricsMiddleware,
+    init_metrics,
+    metrics,
+)
+from src.utils.metrics import snapshot_path, write_snapshot
+
+
+@pytest.fixture
+def metrics_app() -> Flask:
+    metrics.clear()
+    app = Flask(__name__)
+    app.config.update(METRICS_MULTIPROC_DIR="", METRICS_FLUSH_SECONDS=1.0)
+    init_metrics(app)
+
+    @app.get("/items")
+    def list_items() -> tuple[Response, int]:
+        return jsonify({"items": [1, 2, 3]}), 200
+
+    @app.get("/boom")
+    def boom() -> None:
+        raise RuntimeError("boom")
+
+    return app
+
+
+def latency_count(labels: tuple[str, ...]) -> float:
+    series = REQUEST_LATENCY.snapshot().get(labels)
+    return sum(series[:-1]) if series else 0.0
+
+
+class TestMetricsMiddleware:
+    @pytest.mark.unit
+    def test_init_metrics_wraps_wsgi_app(self, metrics_app: Flask) -> None:
+        assert isinstance(metrics_app.wsgi_app, MetricsMiddleware)
+
+    @pytest.mark.unit
+    def test_records_latency_by_endpoint_and_status(self, metrics_app: Flask) -> None:
+        metrics_app.test_client().get("/items", buffered=True)
+        metrics_app.test_client().get("/items", buffered=True)
+        assert latency_count(("GET", "list_items", "200")) == 2
+
+    @pytest.mark.unit
+    def test_records_response_size(self, metrics_app: Flask) -> None:
+        response = metrics_app.test_client().get("/items", buffered=True)
+        series = RESPONSE_SIZE.snapshot()[("GET", "list_items")]
+        assert series[-1] == len(response.data)
+
+    @pytest.mark.unit
+    def test_unknown_routes_share_one_label(self, metrics_app: Flask) -> None:
+        metrics_app.test_client().get("/missing/1", buffered=True)
+        metrics_app.test_client().get("/missing/2", buffered=True)
+        assert latency_count(("GET", "unmatched", "404")) == 2
+
+    @pytest.mark.unit
+    def test_unknown_methods_share_one_label(self, metrics_app: Flask) -> None:
+        metrics_app.test_client().open("/items", method="BREW", buffered=True)
+        metrics_app.test_client().open("/items", method="PROPFIND", buffered=True)
+        assert latency_count(("other", "unmatched", "405")) == 2
+
+    @pytest.mark.unit
+    def test_records_errors_and_releases_in_flight(self, metrics_app: Flask) -> None:
+        metrics_app.test_client().get("/boom", buffered=True)
+        assert latency_count(("GET", "boom", "500")) == 1
+        assert REQUESTS_IN_FLIGHT.snapshot() == {(): 0.0}
+
+    @pytest.mark.unit
+    def test_counts_in_flight_while_handling(self) -> None:
+        metrics.clear()
+        seen: list[dict] = []
+
+        def app(environ: dict, start_response: MagicMock) -> list[bytes]:
+            seen.append(REQUESTS_IN_FLIGHT.snapshot())
+            start_response("200 OK", [])
+            return [b""]
+
+        body = MetricsMiddleware(app)({"REQUEST_METHOD": "GET"}, MagicMock())
+        list(body)
+        assert REQUESTS_IN_FLIGHT.snapshot() == {(): 1.0}
+        body.close()  # type: ignore[attr-defined]
+        assert seen == [{(): 1.0}]
+        assert REQUESTS_IN_FLIGHT.snapshot() == {(): 0.0}
+
+    @pytest.mark.unit
+    def test_times_and_sizes_streamed_body_until_close(self) -> None:
+        metrics.clear()
+        clock = iter([0.0, 3.0])
+
+        def app(environ: dict, start_response: MagicMock) -> Iterator[bytes]:
+            start_response("200 OK", [])
+            yield b"abc"
+            yield b"de"
+
+        with patch("src.configs.metrics_config.time.perf_counter", side_effect=lambda: next(clock)):
+            body = MetricsMiddleware(app)({"REQUEST_METHOD": "GET"}, MagicMock())
+            assert b"".join(body) == b"abcde"
+            assert REQUESTS_IN_FLIGHT.snapshot() == {(): 1.0}
+            body.close()  # type: ignore[attr-defined]
+            body.close()  # type: ignore[attr-defined]
+
+        assert REQUESTS_IN_FLIGHT.snapshot() == {(): 0.0}
+        assert RESPONSE_SIZE.snapshot()[("GET", "unmatched")][-1] == 5
+        assert REQUEST_LATENCY.snapshot()[("GET", "unmatched", "200")][-1] == 3.0
+
+
+class TestMetricsExporter:
+    @pytest.mark.unit
+    def test_collects_own_process_without_directory(self) -> None:
+        metrics.clear()
+        REQUESTS_IN_FLIGHT.inc()
+        exporter = MetricsExporter()
+        assert exporter.collect()["http_requests_in_flight"] == {(): 1.0}
+        REQUESTS_IN_FLIGHT.dec()
+
+    @pytest.mark.unit
+    def test_merges_other_workers_snapshots(self, tmp_path) -> None:
+        metrics.clear()
+        REQUEST_LATENCY.observe(("GET", "list_items", "200"), 0.002)
+        write_snapshot(snapshot_path(str(tmp_path), os.getpid()), {"http_requests_in_flight": {(): 99.0}})
+        write_snapshot(snapshot_path(str(tmp_path), 1), metrics.snapshot())
+
+        exporter = MetricsExporter()
+        exporter.directory = str(tmp_path)
+        collected = exporter.collect()
+
+        assert sum(collected["http_request_duration_seconds"][("GET", "list_items", "200")][:-1]) == 2
+        assert collected["http_requests_in_flight"] == {}
+
+    @pytest.mark.unit
+    def test_stop_flushes_snapshot(self, tmp_path) -> None:
+        metrics.clear()
+        exporter = MetricsExporter()
+        exporter.directory = str(tmp_path)
+        exporter.flush_seconds = 0.01
+        exporter.start()
+        assert exporter.running
+        exporter.stop(timeout=1)
+        assert not exporter.running
+        assert os.path.exists(snapshot_path(str(tmp_path), os.getpid()))
+
+    @pytest.mark.unit
+    def test_start_without_directory_is_a_no_op(self) -> None:
+        exporter = MetricsExporter()
+        exporter.start()
+        assert not exporter.running
+
+    @pytest.mark.unit
+    def test_render_returns_text_format(self) -> None:
+        metrics.clear()
+        assert "# TYPE http_request_duration_seconds histogram" in MetricsExporter().render()
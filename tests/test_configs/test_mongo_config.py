@@ -1,9 +1,12 @@
-from unittest.mock import MagicMock, patch
+import warnings
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from flask import Flask
+from pymongo import compression_support
 
-from src.configs.mongo_config import Mongo, init_mongo, mongo
+from src.configs.mongo_config import WIRE_COMPRESSORS, Mongo, init_mongo, mongo, wire_compressors
+from src.configs.mongo_listeners import CommandMonitor, HeartbeatMonitor, PoolMonitor, ServerMonitor
 
 
 class TestMongoClass:
@@ -54,7 +57,191 @@ class TestMongoClass:
         with patch("src.configs.mongo_config.MongoClient") as mock_client_cls:
             mock_client_cls.return_value = MagicMock()
             instance.init_app(mock_app)
-        mock_client_cls.assert_called_once_with(uri, serverSelectionTimeoutMS=5000)
+        mock_client_cls.assert_called_once_with(uri, serverSelectionTimeoutMS=5000, event_listeners=ANY)
+
+    @pytest.mark.unit
+    def test_init_app_registers_monitoring_listeners(self) -> None:
+        instance: Mongo = Mongo()
+        mock_app: MagicMock = MagicMock(spec=Flask)
+        mock_app.config = {
+            "MONGO_URI": "mongodb://localhost:27017/db",
+            "MONGO_DB_NAME": "db",
+            "MONGO_SLOW_COMMAND_MS": 250,
+        }
+        with patch("src.configs.mongo_config.MongoClient") as mock_client_cls:
+            mock_client_cls.return_value = MagicMock()
+            instance.init_app(mock_app)
+        command, *others = mock_client_cls.call_args.kwargs["event_listeners"]
+        assert isinstance(command, CommandMonitor)
+        assert command.slow_command_seconds == 0.25
+        assert [type(listener) for listener in others] == [PoolMonitor, ServerMonitor, HeartbeatMonitor]
+
+    @pytest.mark.unit
+    def test_init_app_passes_configured_pool_options(self) -> None:
+        instance: Mongo = Mongo()
+        mock_app: MagicMock = MagicMock(spec=Flask)
+        mock_app.config = {
+            "MONGO_URI": "mongodb://localhost:27017/db",
+            "MONGO_DB_NAME": "db",
+            "MONGO_MAX_POOL_SIZE": 4,
+            "MONGO_MIN_POOL_SIZE": 1,
+            "MONGO_MAX_IDLE_TIME_MS": 60000,
+            "MONGO_WAIT_QUEUE_TIMEOUT_MS": 2000,
+            "MONGO_CONNECT_TIMEOUT_MS": 3000,
+            "MONGO_SOCKET_TIMEOUT_MS": 10000,
+            "MONGO_SERVER_SELECTION_TIMEOUT_MS": 1000,
+            "MONGO_COMPRESSORS": "zlib",
+        }
+        with patch("src.configs.mongo_config.MongoClient") as mock_client_cls:
+            mock_client_cls.return_value = MagicMock()
+            instance.init_app(mock_app)
+        mock_client_cls.assert_called_once_with(
+            "mongodb://localhost:27017/db",
+            serverSelectionTimeoutMS=1000,
+            maxPoolSize=4,
+            minPoolSize=1,
+            maxIdleTimeMS=60000,
+            waitQueueTimeoutMS=2000,
+            connectTimeoutMS=3000,
+            socketTimeoutMS=10000,
+            compressors="zlib",
+            event_listeners=ANY,
+        )
+
+    @pytest.mark.unit
+    def test_init_app_pings_server(self) -> None:
+        instance: Mongo = Mongo()
+        mock_app: MagicMock = MagicMock(spec=Flask)
+        mock_app.config = {"MONGO_URI": "mongodb://localhost:27017/db", "MONGO_DB_NAME": "db"}
+        with patch("src.configs.mongo_config.MongoClient") as mock_client_cls:
+            mock_client_instance: MagicMock = MagicMock()
+            mock_client_cls.return_value = mock_client_instance
+            instance.init_app(mock_app)
+        mock_client_instance.admin.command.assert_called_once_with("ping")
+
+
+def _initialized_mongo(mock_client_cls: MagicMock) -> Mongo:
+    instance: Mongo = Mongo()
+    mock_app: MagicMock = MagicMock(spec=Flask)
+    mock_app.config = {"MONGO_URI": "mongodb://localhost:27017/db", "MONGO_DB_NAME": "db"}
+    mock_client_cls.side_effect = lambda *args, **kwargs: MagicMock()
+    instance.init_app(mock_app)
+    return instance
+
+
+class TestLazyClient:
+    @pytest.mark.unit
+    def test_db_raises_when_not_initialized(self) -> None:
+        with pytest.raises(RuntimeError):
+            _ = Mongo().db
+
+    @pytest.mark.unit
+    def test_reuses_client_within_same_process(self) -> None:
+        with patch("src.configs.mongo_config.MongoClient") as mock_client_cls:
+            instance: Mongo = _initialized_mongo(mock_client_cls)
+            first = instance.client
+            second = instance.client
+        assert first is second
+        assert mock_client_cls.call_count == 1
+
+    @pytest.mark.unit
+    def test_reset_recreates_client_on_next_access(self) -> None:
+        with patch("src.configs.mongo_config.MongoClient") as mock_client_cls:
+            instance: Mongo = _initialized_mongo(mock_client_cls)
+            inherited = instance.client
+            instance.reset()
+            fresh = instance.client
+        assert fresh is not inherited
+        assert mock_client_cls.call_count == 2
+
+    @pytest.mark.unit
+    def test_reset_does_not_close_inherited_client(self) -> None:
+        with patch("src.configs.mongo_config.MongoClient") as mock_client_cls:
+            instance: Mongo = _initialized_mongo(mock_client_cls)
+            inherited: MagicMock = instance.client
+            instance.reset()
+        inherited.close.assert_not_called()
+
+    @pytest.mark.unit
+    def test_recreates_client_in_forked_process(self) -> None:
+        with patch("src.configs.mongo_config.MongoClient") as mock_client_cls:
+            instance: Mongo = _initialized_mongo(mock_client_cls)
+            parent = instance.client
+            with patch("src.configs.mongo_config.os.getpid", return_value=-1):
+                child = instance.client
+        assert child is not parent
+        parent.close.assert_not_called()
+
+    @pytest.mark.unit
+    def test_close_closes_client_owned_by_process(self) -> None:
+        with patch("src.configs.mongo_config.MongoClient") as mock_client_cls:
+            instance: Mongo = _initialized_mongo(mock_client_cls)
+            client: MagicMock = instance.client
+            instance.close()
+        client.close.assert_called_once()
+        assert instance._client is None
+
+    @pytest.mark.unit
+    def test_close_is_noop_when_not_connected(self) -> None:
+        Mongo().close()
+
+
+class TestClientOptions:
+    @pytest.mark.unit
+    def test_defaults_server_selection_timeout(self) -> None:
+        assert Mongo.client_options({}) == {"serverSelectionTimeoutMS": 5000}
+
+    @pytest.mark.unit
+    def test_skips_empty_compressors(self) -> None:
+        options: dict = Mongo.client_options({"MONGO_COMPRESSORS": ""})
+        assert "compressors" not in options
+
+    @pytest.mark.unit
+    def test_maps_config_keys_to_client_options(self) -> None:
+        options: dict = Mongo.client_options({"MONGO_MAX_POOL_SIZE": 7, "MONGO_MAX_IDLE_TIME_MS": 1000})
+        assert options["maxPoolSize"] == 7
+        assert options["maxIdleTimeMS"] == 1000
+
+    @pytest.mark.unit
+    def test_passes_zlib_compression_level(self) -> None:
+        options: dict = Mongo.client_options({"MONGO_COMPRESSORS": "zlib", "MONGO_ZLIB_COMPRESSION_LEVEL": 9})
+        assert options["compressors"] == "zlib"
+        assert options["zlibCompressionLevel"] == 9
+
+    @pytest.mark.unit
+    def test_skips_compressors_that_are_all_unavailable(self) -> None:
+        with (
+            patch.dict(WIRE_COMPRESSORS, zstd=(lambda: False, "zstd"), snappy=(lambda: False, "snappy")),
+        ):
+            options: dict = Mongo.client_options({"MONGO_COMPRESSORS": "zstd,snappy"})
+        assert "compressors" not in options
+
+
+class TestWireCompressors:
+    @pytest.mark.unit
+    def test_keeps_preference_order(self) -> None:
+        with patch.dict(WIRE_COMPRESSORS, zstd=(lambda: True, "zstd")):
+            assert wire_compressors(" ZLIB , zstd") == "zlib,zstd"
+
+    @pytest.mark.unit
+    def test_drops_unknown_compressors(self) -> None:
+        assert wire_compressors("lz4,zlib") == "zlib"
+
+    @pytest.mark.unit
+    def test_drops_compressors_without_library(self) -> None:
+        with (
+            patch.dict(WIRE_COMPRESSORS, zstd=(lambda: False, "zstd"), snappy=(lambda: False, "snappy")),
+        ):
+            assert wire_compressors("zstd,snappy,zlib") == "zlib"
+
+    @pytest.mark.unit
+    def test_offers_only_what_the_driver_accepts(self) -> None:
+        offered = wire_compressors("zstd,snappy,zlib")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            accepted = compression_support.validate_compressors(None, offered) if offered else []
+        assert ",".join(accepted) == offered
+        assert not caught
 
 
 class TestMongoSingleton:
@@ -0,0 +1,226 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.configs.metrics_config import metrics
+from src.configs.mongo_listeners import (
+    HEARTBEAT_DURATION,
+    MONGO_COMMAND_DURATION,
+    MONGO_COMMAND_FAILURES,
+    POOL_CHECKED_OUT,
+    POOL_CHECKOUT_FAILURES,
+    SERVER_AVAILABLE,
+    WAIT_BUCKETS,
+    CommandMonitor,
+    HeartbeatMonitor,
+    PoolMonitor,
+    ServerMonitor,
+    command_collection,
+    command_filter,
+    histogram_summary,
+    pool_summary,
+    redact,
+)
+
+
+def started_event(command_name: str, command: dict, request_id: int = 1) -> MagicMock:
+    return MagicMock(
+        command_name=command_name,
+        command=command,
+        database_name="db",
+        connection_id=("localhost", 27017),
+        request_id=request_id,
+    )
+
+
+def finished_event(command_name: str, duration_micros: int, request_id: int = 1) -> MagicMock:
+    return MagicMock(
+        command_name=command_name,
+        duration_micros=duration_micros,
+        connection_id=("localhost", 27017),
+        request_id=request_id,
+    )
+
+
+ADDRESS = ("localhost", 27017)
+
+
+def pool_event(duration: float | None = None, reason: str = "") -> MagicMock:
+    return MagicMock(address=ADDRESS, duration=duration, reason=reason)
+
+
+class TestCommandHelpers:
+    @pytest.mark.unit
+    def test_collection_comes_from_command_value(self) -> None:
+        assert command_collection("find", {"find": "notes", "filter": {}}) == "notes"
+
+    @pytest.mark.unit
+    def test_collection_of_get_more(self) -> None:
+        assert command_collection("getMore", {"getMore": 123, "collection": "notes"}) == "notes"
+
+    @pytest.mark.unit
+    def test_collection_is_empty_for_database_commands(self) -> None:
+        assert command_collection("ping", {"ping": 1}) == ""
+
+    @pytest.mark.unit
+    def test_filter_of_find(self) -> None:
+        assert command_filter("find", {"find": "notes", "filter": {"name": "a"}}) == {"name": "a"}
+
+    @pytest.mark.unit
+    def test_filter_of_write_statements(self) -> None:
+        command = {"delete": "notes", "deletes": [{"q": {"_id": 1}, "limit": 1}]}
+        assert command_filter("delete", command) == [{"_id": 1}]
+
+    @pytest.mark.unit
+    def test_filter_of_other_commands_is_none(self) -> None:
+        assert command_filter("insert", {"insert": "notes", "documents": [{"name": "a"}]}) is None
+
+    @pytest.mark.unit
+    def test_redact_keeps_shape_and_drops_values(self) -> None:
+        query = {"name": {"$regex": "^secret", "$options": "i"}, "_id": {"$in": [1, 2, 3]}, "$or": [{"a": 1}]}
+        assert redact(query) == {"name": {"$regex": "?", "$options": "?"}, "_id": {"$in": "?"}, "$or": [{"a": "?"}]}
+
+
+class TestCommandMonitor:
+    @pytest.mark.unit
+    def test_records_duration_by_command_and_collection(self) -> None:
+        metrics.clear()
+        monitor = CommandMonitor(slow_command_ms=100)
+        monitor.started(started_event("find", {"find": "notes", "filter": {}}))
+        monitor.succeeded(finished_event("find", 2_000))
+
+        series = MONGO_COMMAND_DURATION.snapshot()[("find", "notes")]
+        assert sum(series[:-1]) == 1
+        assert series[-1] == 0.002
+        assert MONGO_COMMAND_FAILURES.snapshot() == {}
+
+    @pytest.mark.unit
+    def test_counts_failures(self) -> None:
+        metrics.clear()
+        monitor = CommandMonitor(slow_command_ms=100)
+        monitor.started(started_event("insert", {"insert": "notes", "documents": []}))
+        monitor.failed(finished_event("insert", 500))
+
+        assert MONGO_COMMAND_FAILURES.snapshot() == {("insert", "notes"): 1.0}
+
+    @pytest.mark.unit
+    def test_ignores_commands_it_did_not_see_start(self) -> None:
+        metrics.clear()
+        CommandMonitor(slow_command_ms=100).succeeded(finished_event("find", 2_000))
+        assert MONGO_COMMAND_DURATION.snapshot() == {}
+
+    @pytest.mark.unit
+    def test_logs_slow_commands_with_redacted_filter(self, caplog: pytest.LogCaptureFixture) -> None:
+        monitor = CommandMonitor(slow_command_ms=100)
+        monitor.started(started_event("find", {"find": "notes", "filter": {"name": {"$regex": "^secret"}}}))
+        with caplog.at_level(logging.WARNING, logger="src.configs.mongo_listeners"):
+            monitor.succeeded(finished_event("find", 150_000))
+
+        assert 'Slow MongoDB command find on db.notes took 150.0 ms: {"name": {"$regex": "?"}}' in caplog.text
+        assert "secret" not in caplog.text
+
+    @pytest.mark.unit
+    def test_does_not_log_fast_commands(self, caplog: pytest.LogCaptureFixture) -> None:
+        monitor = CommandMonitor(slow_command_ms=100)
+        monitor.started(started_event("find", {"find": "notes", "filter": {}}))
+        with caplog.at_level(logging.WARNING, logger="src.configs.mongo_listeners"):
+            monitor.succeeded(finished_event("find", 99_000))
+
+        assert caplog.text == ""
+
+    @pytest.mark.unit
+    def test_skips_awaited_get_more(self, caplog: pytest.LogCaptureFixture) -> None:
+        metrics.clear()
+        monitor = CommandMonitor(slow_command_ms=100)
+        monitor.started(started_event("getMore", {"getMore": 1, "collection": "notes", "maxTimeMS": 1000}))
+        monitor.started(started_event("getMore", {"getMore": 2, "collection": "notes"}, request_id=2))
+        with caplog.at_level(logging.WARNING, logger="src.configs.mongo_listeners"):
+            monitor.succeeded(finished_event("getMore", 1_000_000))
+            monitor.succeeded(finished_event("getMore", 2_000, request_id=2))
+
+        assert sum(MONGO_COMMAND_DURATION.snapshot()[("getMore", "notes")][:-1]) == 1
+        assert caplog.text == ""
+
+
+class TestPoolMonitor:
+    @pytest.mark.unit
+    def test_tracks_checked_out_connections_and_wait(self) -> None:
+        metrics.clear()
+        monitor = PoolMonitor()
+        monitor.connection_checked_out(pool_event(duration=0.002))
+        monitor.connection_checked_out(pool_event(duration=0.0))
+        monitor.connection_checked_in(pool_event())
+
+        summary = pool_summary(metrics.snapshot())["localhost:27017"]
+        assert summary["checked_out"] == 1
+        assert summary["checkout_wait"] == {"count": 2, "avg_ms": 1.0, "p99_ms": 5.0}
+
+    @pytest.mark.unit
+    def test_tracks_created_and_open_connections(self) -> None:
+        metrics.clear()
+        monitor = PoolMonitor()
+        monitor.connection_created(pool_event())
+        monitor.connection_created(pool_event())
+        monitor.connection_closed(pool_event())
+        monitor.pool_cleared(pool_event())
+
+        summary = pool_summary(metrics.snapshot())["localhost:27017"]
+        assert (summary["created"], summary["open"], summary["cleared"]) == (2, 1, 1)
+
+    @pytest.mark.unit
+    def test_counts_check_out_failures_by_reason(self) -> None:
+        metrics.clear()
+        PoolMonitor().connection_check_out_failed(pool_event(duration=5.0, reason="timeout"))
+
+        assert POOL_CHECKOUT_FAILURES.snapshot() == {("localhost:27017", "timeout"): 1.0}
+        assert POOL_CHECKED_OUT.snapshot() == {}
+
+
+class TestServerMonitors:
+    @pytest.mark.unit
+    def test_records_polled_heartbeats_only(self) -> None:
+        metrics.clear()
+        monitor = HeartbeatMonitor()
+        monitor.succeeded(MagicMock(connection_id=ADDRESS, duration=0.003, awaited=False))
+        monitor.succeeded(MagicMock(connection_id=ADDRESS, duration=10.0, awaited=True))
+
+        assert sum(HEARTBEAT_DURATION.snapshot()[("localhost:27017",)][:-1]) == 1
+
+    @pytest.mark.unit
+    def test_marks_server_availability(self) -> None:
+        metrics.clear()
+        monitor = ServerMonitor()
+        event = MagicMock(server_address=ADDRESS)
+        event.previous_description.server_type = 0
+        event.new_description.server_type = 1
+        event.new_description.is_server_type_known = True
+        monitor.description_changed(event)
+        assert SERVER_AVAILABLE.snapshot() == {("localhost:27017",): 1.0}
+
+        monitor.closed(MagicMock(server_address=ADDRESS))
+        assert SERVER_AVAILABLE.snapshot() == {("localhost:27017",): 0.0}
+
+
+class TestHistogramSummary:
+    @pytest.mark.unit
+    def test_empty_histogram(self) -> None:
+        assert histogram_summary(None, WAIT_BUCKETS) == {"count": 0, "avg_ms": None, "p99_ms": None}
+
+    @pytest.mark.unit
+    def test_p99_past_last_bucket_is_none(self) -> None:
+        series = [0.0] * len(WAIT_BUCKETS) + [1.0, 9.0]
+        assert histogram_summary(series, WAIT_BUCKETS) == {"count": 1, "avg_ms": 9000.0, "p99_ms": None}
+
+
+class TestPoolSummaryAvailability:
+    @pytest.mark.unit
+    def test_counts_workers_that_see_the_server(self) -> None:
+        merged = metrics.merge(
+            [
+                {SERVER_AVAILABLE.name: {("localhost:27017",): 1.0}},
+                {SERVER_AVAILABLE.name: {("localhost:27017",): 1.0}},
+                {SERVER_AVAILABLE.name: {("localhost:27017",): 0.0}},
+            ]
+        )
+        assert pool_summary(merged)["localhost:27017"]["available_workers"] == 2
@@ -12,6 +12,14 @@ class TestTestingConfig:
     def test_debug_is_true(self) -> None:
         assert TestingConfig.DEBUG is True
 
+    @pytest.mark.unit
+    def test_notes_cache_is_disabled(self) -> None:
+        assert TestingConfig.NOTES_CACHE_ENABLED is False
+
+    @pytest.mark.unit
+    def test_notes_cache_watcher_is_disabled(self) -> None:
+        assert TestingConfig.NOTES_CACHE_WATCH_ENABLED is False
+
     @pytest.mark.unit
     def test_env_is_testing(self) -> None:
         assert TestingConfig.ENV == "testing"
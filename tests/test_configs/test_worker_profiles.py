@@ -0,0 +1,86 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.configs.worker_profiles import WORKER_PROFILES, available_cpus, cgroup_cpu_limit, worker_profile
+
+
+def write_file(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+class TestCgroupCpuLimit:
+    @pytest.mark.unit
+    def test_returns_none_without_cgroup_files(self, tmp_path: Path) -> None:
+        assert cgroup_cpu_limit(str(tmp_path)) is None
+
+    @pytest.mark.unit
+    def test_reads_cgroup_v2_quota(self, tmp_path: Path) -> None:
+        write_file(tmp_path / "cpu.max", "200000 100000\n")
+        assert cgroup_cpu_limit(str(tmp_path)) == 2.0
+
+    @pytest.mark.unit
+    def test_cgroup_v2_max_is_unlimited(self, tmp_path: Path) -> None:
+        write_file(tmp_path / "cpu.max", "max 100000\n")
+        assert cgroup_cpu_limit(str(tmp_path)) is None
+
+    @pytest.mark.unit
+    def test_reads_cgroup_v1_quota(self, tmp_path: Path) -> None:
+        write_file(tmp_path / "cpu" / "cpu.cfs_quota_us", "150000\n")
+        write_file(tmp_path / "cpu" / "cpu.cfs_period_us", "100000\n")
+        assert cgroup_cpu_limit(str(tmp_path)) == 1.5
+
+    @pytest.mark.unit
+    def test_reads_cgroup_v1_combined_controller(self, tmp_path: Path) -> None:
+        write_file(tmp_path / "cpu,cpuacct" / "cpu.cfs_quota_us", "50000\n")
+        write_file(tmp_path / "cpu,cpuacct" / "cpu.cfs_period_us", "100000\n")
+        assert cgroup_cpu_limit(str(tmp_path)) == 0.5
+
+    @pytest.mark.unit
+    def test_cgroup_v1_negative_quota_is_unlimited(self, tmp_path: Path) -> None:
+        write_file(tmp_path / "cpu" / "cpu.cfs_quota_us", "-1\n")
+        write_file(tmp_path / "cpu" / "cpu.cfs_period_us", "100000\n")
+        assert cgroup_cpu_limit(str(tmp_path)) is None
+
+
+class TestAvailableCpus:
+    @pytest.mark.unit
+    def test_uses_host_cpus_without_limit(self, tmp_path: Path) -> None:
+        with patch("src.configs.worker_profiles.os.sched_getaffinity", return_value={0, 1, 2, 3}, create=True):
+            assert available_cpus(str(tmp_path)) == 4
+
+    @pytest.mark.unit
+    def test_caps_to_cgroup_limit_rounded_up(self, tmp_path: Path) -> None:
+        write_file(tmp_path / "cpu.max", "150000 100000\n")
+        with patch("src.configs.worker_profiles.os.sched_getaffinity", return_value={0, 1, 2, 3}, create=True):
+            assert available_cpus(str(tmp_path)) == 2
+
+    @pytest.mark.unit
+    def test_fractional_limit_keeps_at_least_one_cpu(self, tmp_path: Path) -> None:
+        write_file(tmp_path / "cpu.max", "10000 100000\n")
+        with patch("src.configs.worker_profiles.os.sched_getaffinity", return_value={0, 1}, create=True):
+            assert available_cpus(str(tmp_path)) == 1
+
+    @pytest.mark.unit
+    def test_limit_above_host_cpus_is_ignored(self, tmp_path: Path) -> None:
+        write_file(tmp_path / "cpu.max", "800000 100000\n")
+        with patch("src.configs.worker_profiles.os.sched_getaffinity", return_value={0, 1}, create=True):
+            assert available_cpus(str(tmp_path)) == 2
+
+
+class TestWorkerProfile:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("worker_class", ["sync", "gthread", "gevent"])
+    def test_returns_known_profile(self, worker_class: str) -> None:
+        assert worker_profile(worker_class) == WORKER_PROFILES[worker_class]
+
+    @pytest.mark.unit
+    def test_sync_profile_is_single_threaded(self) -> None:
+        assert worker_profile("sync")["threads"] == 1
+
+    @pytest.mark.unit
+    def test_unknown_worker_class_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid worker class"):
+            worker_profile("eventlet")
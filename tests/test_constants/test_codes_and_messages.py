@@ -8,11 +8,18 @@ from src.constants.codes import (
     CODE_ERROR_INTERNAL_SERVER,
     CODE_ERROR_PYDANTIC,
     CODE_NOT_FOUND_NOTE,
+    CODE_NOT_READY,
+    CODE_NOT_VALID_CURSOR,
+    CODE_NOT_VALID_EXPORT_FORMAT,
+    CODE_NOT_VALID_FIELDS,
     CODE_NOT_VALID_INTEGER,
     CODE_NOT_VALID_OBJECT_ID,
     CODE_SUCCESS_ADD_NOTE,
+    CODE_SUCCESS_ADD_NOTES,
     CODE_SUCCESS_DELETE_NOTE,
+    CODE_SUCCESS_DELETE_NOTES,
     CODE_SUCCESS_GET_NOTES,
+    CODE_SUCCESS_POOL,
 )
 from src.constants.messages import (
     MESSAGE_ALREADY_EXISTS_NOTE,
@@ -22,11 +29,18 @@ from src.constants.messages import (
     MESSAGE_ERROR_INTERNAL_SERVER,
     MESSAGE_ERROR_PYDANTIC,
     MESSAGE_NOT_FOUND_NOTE,
+    MESSAGE_NOT_READY,
+    MESSAGE_NOT_VALID_CURSOR,
+    MESSAGE_NOT_VALID_EXPORT_FORMAT,
+    MESSAGE_NOT_VALID_FIELDS,
     MESSAGE_NOT_VALID_INTEGER,
     MESSAGE_NOT_VALID_OBJECT_ID,
     MESSAGE_SUCCESS_ADD_NOTE,
+    MESSAGE_SUCCESS_ADD_NOTES,
     MESSAGE_SUCCESS_DELETE_NOTE,
+    MESSAGE_SUCCESS_DELETE_NOTES,
     MESSAGE_SUCCESS_GET_NOTES,
+    MESSAGE_SUCCESS_POOL,
 )
 
 
@@ -35,14 +49,26 @@ class TestCodes:
     def test_code_success_add_note(self) -> None:
         assert CODE_SUCCESS_ADD_NOTE == "SUCCESS_ADD_NOTE"
 
+    @pytest.mark.unit
+    def test_code_success_add_notes(self) -> None:
+        assert CODE_SUCCESS_ADD_NOTES == "SUCCESS_ADD_NOTES"
+
     @pytest.mark.unit
     def test_code_success_get_notes(self) -> None:
         assert CODE_SUCCESS_GET_NOTES == "SUCCESS_GET_NOTES"
 
+    @pytest.mark.unit
+    def test_code_success_pool(self) -> None:
+        assert CODE_SUCCESS_POOL == "SUCCESS_POOL"
+
     @pytest.mark.unit
     def test_code_success_delete_note(self) -> None:
         assert CODE_SUCCESS_DELETE_NOTE == "SUCCESS_DELETE_NOTE"
 
+    @pytest.mark.unit
+    def test_code_success_delete_notes(self) -> None:
+        assert CODE_SUCCESS_DELETE_NOTES == "SUCCESS_DELETE_NOTES"
+
     @pytest.mark.unit
     def test_code_error_internal_server(self) -> None:
         assert CODE_ERROR_INTERNAL_SERVER == "ERROR_INTERNAL_SERVER"
@@ -59,10 +85,26 @@ class TestCodes:
     def test_code_not_valid_object_id(self) -> None:
         assert CODE_NOT_VALID_OBJECT_ID == "NOT_VALID_OBJECT_ID"
 
+    @pytest.mark.unit
+    def test_code_not_valid_cursor(self) -> None:
+        assert CODE_NOT_VALID_CURSOR == "NOT_VALID_CURSOR"
+
+    @pytest.mark.unit
+    def test_code_not_valid_export_format(self) -> None:
+        assert CODE_NOT_VALID_EXPORT_FORMAT == "NOT_VALID_EXPORT_FORMAT"
+
+    @pytest.mark.unit
+    def test_code_not_valid_fields(self) -> None:
+        assert CODE_NOT_VALID_FIELDS == "NOT_VALID_FIELDS"
+
     @pytest.mark.unit
     def test_code_already_exists_note(self) -> None:
         assert CODE_ALREADY_EXISTS_NOTE == "ALREADY_EXISTS_NOTE"
 
+    @pytest.mark.unit
+    def test_code_not_ready(self) -> None:
+        assert CODE_NOT_READY == "NOT_READY"
+
     @pytest.mark.unit
     def test_code_not_found_note(self) -> None:
         assert CODE_NOT_FOUND_NOTE == "NOT_FOUND_NOTE"
@@ -71,8 +113,11 @@ class TestCodes:
     def test_all_codes_are_non_empty_strings(self) -> None:
         codes: list[str] = [
             CODE_SUCCESS_ADD_NOTE,
+            CODE_SUCCESS_ADD_NOTES,
             CODE_SUCCESS_GET_NOTES,
+            CODE_SUCCESS_POOL,
             CODE_SUCCESS_DELETE_NOTE,
+            CODE_SUCCESS_DELETE_NOTES,
             CODE_ERROR_INTERNAL_SERVER,
             CODE_ERROR_PYDANTIC,
             CODE_ERROR_DATABASE,
@@ -80,8 +125,12 @@ class TestCodes:
             CODE_ERROR_AUTHENTICATION,
             CODE_NOT_VALID_INTEGER,
             CODE_NOT_VALID_OBJECT_ID,
+            CODE_NOT_VALID_CURSOR,
+            CODE_NOT_VALID_EXPORT_FORMAT,
+            CODE_NOT_VALID_FIELDS,
             CODE_ALREADY_EXISTS_NOTE,
             CODE_NOT_FOUND_NOTE,
+            CODE_NOT_READY,
         ]
         for code in codes:
             assert isinstance(code, str)
@@ -94,14 +143,26 @@ class TestMessages:
         assert isinstance(MESSAGE_SUCCESS_ADD_NOTE, str)
         assert len(MESSAGE_SUCCESS_ADD_NOTE) > 0
 
+    @pytest.mark.unit
+    def test_message_success_add_notes(self) -> None:
+        assert MESSAGE_SUCCESS_ADD_NOTES == "The notes were processed successfully."
+
     @pytest.mark.unit
     def test_message_success_get_notes(self) -> None:
         assert MESSAGE_SUCCESS_GET_NOTES == "Notes retrieved successfully."
 
+    @pytest.mark.unit
+    def test_message_success_pool(self) -> None:
+        assert MESSAGE_SUCCESS_POOL == "MongoDB connection pool statistics retrieved successfully."
+
     @pytest.mark.unit
     def test_message_success_delete_note(self) -> None:
         assert MESSAGE_SUCCESS_DELETE_NOTE == "The note was successfully deleted."
 
+    @pytest.mark.unit
+    def test_message_success_delete_notes(self) -> None:
+        assert MESSAGE_SUCCESS_DELETE_NOTES == "The notes were successfully deleted."
+
     @pytest.mark.unit
     def test_message_error_internal_server_is_non_empty(self) -> None:
         assert isinstance(MESSAGE_ERROR_INTERNAL_SERVER, str)
@@ -111,10 +172,26 @@ class TestMessages:
     def test_message_not_valid_object_id(self) -> None:
         assert MESSAGE_NOT_VALID_OBJECT_ID == "The value entered is not a valid ObjectId."
 
+    @pytest.mark.unit
+    def test_message_not_valid_cursor(self) -> None:
+        assert MESSAGE_NOT_VALID_CURSOR == "The value entered is not a valid pagination cursor."
+
+    @pytest.mark.unit
+    def test_message_not_valid_export_format(self) -> None:
+        assert MESSAGE_NOT_VALID_EXPORT_FORMAT == "The export format entered is not supported."
+
+    @pytest.mark.unit
+    def test_message_not_valid_fields(self) -> None:
+        assert MESSAGE_NOT_VALID_FIELDS == "The fields entered are not valid note fields."
+
     @pytest.mark.unit
     def test_message_already_exists_note(self) -> None:
         assert MESSAGE_ALREADY_EXISTS_NOTE == "Note already exists."
 
+    @pytest.mark.unit
+    def test_message_not_ready(self) -> None:
+        assert MESSAGE_NOT_READY == "The application cannot reach the database."
+
     @pytest.mark.unit
     def test_message_not_found_note(self) -> None:
         assert MESSAGE_NOT_FOUND_NOTE == "No note found."
@@ -123,8 +200,11 @@ class TestMessages:
     def test_all_messages_are_non_empty_strings(self) -> None:
         messages: list[str] = [
             MESSAGE_SUCCESS_ADD_NOTE,
+            MESSAGE_SUCCESS_ADD_NOTES,
             MESSAGE_SUCCESS_GET_NOTES,
+            MESSAGE_SUCCESS_POOL,
             MESSAGE_SUCCESS_DELETE_NOTE,
+            MESSAGE_SUCCESS_DELETE_NOTES,
             MESSAGE_ERROR_INTERNAL_SERVER,
             MESSAGE_ERROR_PYDANTIC,
             MESSAGE_ERROR_DATABASE,
@@ -132,8 +212,12 @@ class TestMessages:
             MESSAGE_ERROR_AUTHENTICATION,
             MESSAGE_NOT_VALID_INTEGER,
             MESSAGE_NOT_VALID_OBJECT_ID,
+            MESSAGE_NOT_VALID_CURSOR,
+            MESSAGE_NOT_VALID_EXPORT_FORMAT,
+            MESSAGE_NOT_VALID_FIELDS,
             MESSAGE_ALREADY_EXISTS_NOTE,
             MESSAGE_NOT_FOUND_NOTE,
+            MESSAGE_NOT_READY,
         ]
         for message in messages:
             assert isinstance(message, str)
@@ -1,11 +1,13 @@
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from flask import Flask
 
-from src.constants.codes import CODE_SUCCESS_HEALTH, CODE_SUCCESS_READY
+from src.constants.codes import CODE_NOT_READY, CODE_SUCCESS_HEALTH, CODE_SUCCESS_POOL, CODE_SUCCESS_READY
 from src.constants.messages import MESSAGE_SUCCESS_HEALTH, MESSAGE_SUCCESS_READY
-from src.controllers.health_controller import health, ready
+from src.controllers.health_controller import health, metrics, pool, ready
+from src.utils.exceptions import ServiceUnavailableAPIError
 
 
 class TestHealthController:
@@ -56,3 +58,39 @@ class TestReadyController:
             data: dict[str, Any] = response.get_json()
 
         assert data["message"] == MESSAGE_SUCCESS_READY
+
+    @pytest.mark.unit
+    def test_raises_503_when_database_is_unreachable(self, app: Flask) -> None:
+        with (
+            app.app_context(),
+            patch("src.controllers.health_controller.readiness_probe.check", return_value=False),
+            pytest.raises(ServiceUnavailableAPIError) as exc_info,
+        ):
+            ready()
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.code == CODE_NOT_READY
+
+
+class TestMetricsController:
+    @pytest.mark.unit
+    def test_returns_prometheus_text(self, app: Flask) -> None:
+        with app.app_context():
+            response, status = metrics()
+
+        assert status == 200
+        assert response.mimetype == "text/plain"
+        assert b"# TYPE http_request_duration_seconds histogram" in response.get_data()
+
+
+class TestPoolController:
+    @pytest.mark.unit
+    def test_returns_pool_settings_and_servers(self, app: Flask) -> None:
+        with app.app_context():
+            response, status = pool()
+            data: dict[str, Any] = response.get_json()
+
+        assert status == 200
+        assert data["code"] == CODE_SUCCESS_POOL
+        assert data["data"]["settings"]["max_pool_size_per_worker"] == app.config["MONGO_MAX_POOL_SIZE"]
+        assert isinstance(data["data"]["servers"], dict)
@@ -1,3 +1,4 @@
+from collections.abc import Generator
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -6,11 +7,38 @@ from bson import ObjectId
 from flask import Flask
 from pymongo.results import InsertOneResult
 
-from src.constants.codes import CODE_SUCCESS_ADD_NOTE, CODE_SUCCESS_DELETE_NOTE, CODE_SUCCESS_GET_NOTES
-from src.constants.messages import MESSAGE_SUCCESS_ADD_NOTE, MESSAGE_SUCCESS_DELETE_NOTE, MESSAGE_SUCCESS_GET_NOTES
-from src.controllers.note_controller import alive, create_note, delete_note, get_notes
+from src.constants.codes import (
+    CODE_NOT_VALID_CURSOR,
+    CODE_NOT_VALID_EXPORT_FORMAT,
+    CODE_NOT_VALID_FIELDS,
+    CODE_NOT_VALID_INTEGER,
+    CODE_SUCCESS_ADD_NOTE,
+    CODE_SUCCESS_ADD_NOTES,
+    CODE_SUCCESS_DELETE_NOTE,
+    CODE_SUCCESS_DELETE_NOTES,
+    CODE_SUCCESS_GET_NOTES,
+)
+from src.constants.messages import (
+    MESSAGE_SUCCESS_ADD_NOTE,
+    MESSAGE_SUCCESS_ADD_NOTES,
+    MESSAGE_SUCCESS_DELETE_NOTE,
+    MESSAGE_SUCCESS_DELETE_NOTES,
+    MESSAGE_SUCCESS_GET_NOTES,
+)
+from src.controllers.note_controller import (
+    NOTE_FIELDS,
+    alive,
+    create_note,
+    create_notes_bulk,
+    delete_note,
+    delete_notes_bulk,
+    export_notes,
+    get_notes,
+)
 from src.controllers.note_controller import test_error as controller_test_error
+from src.services.note_service import NoteService
 from src.utils.exceptions import ConflictAPIError, InternalAPIError, NotFoundAPIError, ValidationAPIError
+from src.utils.helpers import encode_cursor
 
 
 class TestAliveController:
@@ -140,23 +168,78 @@ class TestCreateNoteController:
             create_note()
 
 
+class TestCreateNotesBulkController:
+    @pytest.mark.unit
+    def test_returns_201_with_report(self, app: Flask) -> None:
+        report: dict[str, list[dict[str, Any]]] = {
+            "inserted": [{"index": 0, "_id": str(ObjectId())}],
+            "conflicts": [{"index": 1, "name": "a"}],
+        }
+        with (
+            app.test_request_context("/api/v1/notes/bulk", method="POST", json=[{"name": "a"}, {"name": "A"}]),
+            patch("src.controllers.note_controller.NoteService.add_notes", return_value=report),
+        ):
+            response, status = create_notes_bulk()
+            data: dict[str, Any] = response.get_json()
+        assert status == 201
+        assert data["code"] == CODE_SUCCESS_ADD_NOTES
+        assert data["message"] == MESSAGE_SUCCESS_ADD_NOTES
+        assert data["data"] == report
+
+    @pytest.mark.unit
+    def test_passes_validated_models_to_service(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/bulk", method="POST", json=[{"name": " a "}, {"name": "b"}]),
+            patch(
+                "src.controllers.note_controller.NoteService.add_notes",
+                return_value={"inserted": [], "conflicts": []},
+            ) as mock_add,
+        ):
+            create_notes_bulk()
+        assert [note.name for note in mock_add.call_args.args[0]] == ["a", "b"]
+
+    @pytest.mark.unit
+    def test_raises_validation_error_when_any_item_is_invalid(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/bulk", method="POST", json=[{"name": "ok"}, {"name": ""}]),
+            patch("src.controllers.note_controller.NoteService.add_notes") as mock_add,
+            pytest.raises(ValidationAPIError),
+        ):
+            create_notes_bulk()
+        mock_add.assert_not_called()
+
+
 class TestGetNotesController:
+    @pytest.fixture(autouse=True)
+    def notes_version(self) -> Generator[MagicMock, None, None]:
+        with patch("src.controllers.note_controller.NoteService.get_notes_version", return_value="v1") as mock_version:
+            yield mock_version
+
     @pytest.mark.unit
     def test_returns_200(self, app: Flask) -> None:
-        with app.app_context(), patch("src.controllers.note_controller.NoteService.get_all_notes", return_value=[]):
+        with (
+            app.test_request_context("/api/v1/notes/"),
+            patch("src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")),
+        ):
             response, status = get_notes()
         assert status == 200
 
     @pytest.mark.unit
     def test_response_contains_code(self, app: Flask) -> None:
-        with app.app_context(), patch("src.controllers.note_controller.NoteService.get_all_notes", return_value=[]):
+        with (
+            app.test_request_context("/api/v1/notes/"),
+            patch("src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")),
+        ):
             response, status = get_notes()
             data: dict[str, Any] = response.get_json()
         assert data["code"] == CODE_SUCCESS_GET_NOTES
 
     @pytest.mark.unit
     def test_response_contains_message(self, app: Flask) -> None:
-        with app.app_context(), patch("src.controllers.note_controller.NoteService.get_all_notes", return_value=[]):
+        with (
+            app.test_request_context("/api/v1/notes/"),
+            patch("src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")),
+        ):
             response, status = get_notes()
             data: dict[str, Any] = response.get_json()
         assert data["message"] == MESSAGE_SUCCESS_GET_NOTES
@@ -164,7 +247,10 @@ class TestGetNotesController:
     @pytest.mark.unit
     def test_response_data_is_list(self, app: Flask) -> None:
         notes: list[dict[str, Any]] = [{"_id": str(ObjectId()), "name": "a"}]
-        with app.app_context(), patch("src.controllers.note_controller.NoteService.get_all_notes", return_value=notes):
+        with (
+            app.test_request_context("/api/v1/notes/"),
+            patch("src.controllers.note_controller.NoteService.get_notes_page", return_value=(notes, None, "v1")),
+        ):
             response, status = get_notes()
             data: dict[str, Any] = response.get_json()
         assert isinstance(data["data"], list)
@@ -172,7 +258,10 @@ class TestGetNotesController:
 
     @pytest.mark.unit
     def test_response_data_is_empty_when_no_notes(self, app: Flask) -> None:
-        with app.app_context(), patch("src.controllers.note_controller.NoteService.get_all_notes", return_value=[]):
+        with (
+            app.test_request_context("/api/v1/notes/"),
+            patch("src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")),
+        ):
             response, status = get_notes()
             data: dict[str, Any] = response.get_json()
         assert data["data"] == []
@@ -180,12 +269,214 @@ class TestGetNotesController:
     @pytest.mark.unit
     def test_service_is_called_once(self, app: Flask) -> None:
         with (
-            app.app_context(),
-            patch("src.controllers.note_controller.NoteService.get_all_notes", return_value=[]) as mock_get,
+            app.test_request_context("/api/v1/notes/"),
+            patch(
+                "src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")
+            ) as mock_get,
         ):
             get_notes()
         mock_get.assert_called_once()
 
+    @pytest.mark.unit
+    def test_uses_default_limit_when_not_provided(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/"),
+            patch(
+                "src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")
+            ) as mock_get,
+        ):
+            get_notes()
+        mock_get.assert_called_once_with(app.config["NOTES_PAGE_DEFAULT_LIMIT"], None, None, "v1")
+
+    @pytest.mark.unit
+    def test_clamps_limit_to_max(self, app: Flask) -> None:
+        limit: int = app.config["NOTES_PAGE_MAX_LIMIT"] + 1
+        with (
+            app.test_request_context(f"/api/v1/notes/?limit={limit}"),
+            patch(
+                "src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")
+            ) as mock_get,
+        ):
+            get_notes()
+        mock_get.assert_called_once_with(app.config["NOTES_PAGE_MAX_LIMIT"], None, None, "v1")
+
+    @pytest.mark.unit
+    def test_passes_decoded_cursor_to_service(self, app: Flask) -> None:
+        _id: ObjectId = ObjectId()
+        with (
+            app.test_request_context(f"/api/v1/notes/?limit=5&after={encode_cursor(_id)}"),
+            patch(
+                "src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")
+            ) as mock_get,
+        ):
+            get_notes()
+        mock_get.assert_called_once_with(5, _id, None, "v1")
+
+    @pytest.mark.unit
+    def test_response_contains_encoded_next_cursor(self, app: Flask) -> None:
+        _id: ObjectId = ObjectId()
+        with (
+            app.test_request_context("/api/v1/notes/"),
+            patch("src.controllers.note_controller.NoteService.get_notes_page", return_value=([], _id, "v1")),
+        ):
+            response, status = get_notes()
+            data: dict[str, Any] = response.get_json()
+        assert data["next_cursor"] == encode_cursor(_id)
+
+    @pytest.mark.unit
+    def test_next_cursor_is_none_on_last_page(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/"),
+            patch("src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")),
+        ):
+            response, status = get_notes()
+            data: dict[str, Any] = response.get_json()
+        assert data["next_cursor"] is None
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("limit", ["0", "-1", "abc", "1.5"])
+    def test_raises_validation_error_for_invalid_limit(self, app: Flask, limit: str) -> None:
+        with app.test_request_context(f"/api/v1/notes/?limit={limit}"), pytest.raises(ValidationAPIError) as exc_info:
+            get_notes()
+        assert exc_info.value.code == CODE_NOT_VALID_INTEGER
+
+    @pytest.mark.unit
+    def test_raises_validation_error_for_invalid_cursor(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/?after=not_a_cursor"),
+            pytest.raises(ValidationAPIError) as exc_info,
+        ):
+            get_notes()
+        assert exc_info.value.code == CODE_NOT_VALID_CURSOR
+
+    @pytest.mark.unit
+    def test_passes_requested_fields_to_service(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/?fields=name,%20name,_id"),
+            patch(
+                "src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")
+            ) as mock_get,
+        ):
+            get_notes()
+        mock_get.assert_called_once_with(app.config["NOTES_PAGE_DEFAULT_LIMIT"], None, ["name", "_id"], "v1")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("fields", ["", ",", "password", "name,password"])
+    def test_raises_validation_error_for_invalid_fields(self, app: Flask, fields: str) -> None:
+        with (
+            app.test_request_context(f"/api/v1/notes/?fields={fields}"),
+            pytest.raises(ValidationAPIError) as exc_info,
+        ):
+            get_notes()
+        assert exc_info.value.code == CODE_NOT_VALID_FIELDS
+        assert exc_info.value.payload == {"allowed": sorted(NOTE_FIELDS)}
+
+    @pytest.mark.unit
+    def test_response_has_etag_and_no_cache(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/?limit=5"),
+            patch("src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")),
+        ):
+            response, status = get_notes()
+        assert response.get_etag() == (NoteService.get_notes_etag("v1", 5, None, None), False)
+        assert response.cache_control.no_cache is True
+
+    @pytest.mark.unit
+    def test_returns_304_without_reading_notes_when_etag_matches(self, app: Flask) -> None:
+        etag: str = NoteService.get_notes_etag("v1", app.config["NOTES_PAGE_DEFAULT_LIMIT"], None, None)
+        with (
+            app.test_request_context("/api/v1/notes/", headers={"If-None-Match": f'"{etag}"'}),
+            patch("src.controllers.note_controller.NoteService.get_notes_page") as mock_get,
+        ):
+            response, status = get_notes()
+        mock_get.assert_not_called()
+        assert status == 304
+        assert response.get_data() == b""
+        assert response.get_etag() == (etag, False)
+
+    @pytest.mark.unit
+    def test_returns_200_when_etag_is_stale(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/", headers={"If-None-Match": '"stale"'}),
+            patch("src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")),
+        ):
+            response, status = get_notes()
+        assert status == 200
+
+    @pytest.mark.unit
+    def test_reads_version_once_and_passes_it_to_page(self, app: Flask, notes_version: MagicMock) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/?limit=5"),
+            patch(
+                "src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v1")
+            ) as mock_get,
+        ):
+            get_notes()
+        notes_version.assert_called_once()
+        mock_get.assert_called_once_with(5, None, None, "v1")
+
+    @pytest.mark.unit
+    def test_etag_uses_version_the_page_was_read_at(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/?limit=5"),
+            patch("src.controllers.note_controller.NoteService.get_notes_page", return_value=([], None, "v0")),
+        ):
+            response, status = get_notes()
+        assert response.get_etag() == (NoteService.get_notes_etag("v0", 5, None, None), False)
+
+
+class TestExportNotesController:
+    @pytest.mark.unit
+    def test_returns_streamed_ndjson_response(self, app: Flask) -> None:
+        notes: list[dict[str, Any]] = [{"_id": "1", "name": "a"}, {"_id": "2", "name": "b"}]
+        with (
+            app.test_request_context("/api/v1/notes/export?format=ndjson"),
+            patch("src.controllers.note_controller.NoteService.export_notes", return_value=iter(notes)),
+        ):
+            response = export_notes()
+            is_streamed: bool = response.is_streamed
+            body: str = response.get_data(as_text=True)
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert is_streamed
+        assert body == '{"_id":"1","name":"a"}\n{"_id":"2","name":"b"}\n'
+
+    @pytest.mark.unit
+    def test_uses_default_batch_size_when_not_provided(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/export"),
+            patch("src.controllers.note_controller.NoteService.export_notes", return_value=iter([])) as mock_export,
+        ):
+            export_notes()
+        mock_export.assert_called_once_with(app.config["NOTES_EXPORT_BATCH_SIZE"])
+
+    @pytest.mark.unit
+    def test_passes_batch_size_to_service(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/export?batch_size=25"),
+            patch("src.controllers.note_controller.NoteService.export_notes", return_value=iter([])) as mock_export,
+        ):
+            export_notes()
+        mock_export.assert_called_once_with(25)
+
+    @pytest.mark.unit
+    def test_raises_validation_error_for_unknown_format(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/export?format=xml"),
+            pytest.raises(ValidationAPIError) as exc_info,
+        ):
+            export_notes()
+        assert exc_info.value.code == CODE_NOT_VALID_EXPORT_FORMAT
+
+    @pytest.mark.unit
+    def test_raises_validation_error_for_invalid_batch_size(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/export?batch_size=0"),
+            pytest.raises(ValidationAPIError) as exc_info,
+        ):
+            export_notes()
+        assert exc_info.value.code == CODE_NOT_VALID_INTEGER
+
 
 class TestDeleteNoteController:
     @pytest.mark.unit
@@ -236,3 +527,67 @@ class TestDeleteNoteController:
         with app.app_context(), patch("src.controllers.note_controller.NoteService.delete_note_by_id") as mock_delete:
             delete_note(id=str(_id))
         mock_delete.assert_called_once_with(_id)
+
+
+class TestDeleteNotesBulkController:
+    @pytest.mark.unit
+    def test_returns_200_with_counts(self, app: Flask) -> None:
+        ids: list[str] = [str(ObjectId()), str(ObjectId())]
+        with (
+            app.test_request_context("/api/v1/notes/bulk-delete", method="POST", json={"ids": ids}),
+            patch(
+                "src.controllers.note_controller.NoteService.delete_notes_by_ids",
+                return_value={"deleted": 1, "missing": 1},
+            ),
+        ):
+            response, status = delete_notes_bulk()
+            data: dict[str, Any] = response.get_json()
+        assert status == 200
+        assert data["code"] == CODE_SUCCESS_DELETE_NOTES
+        assert data["message"] == MESSAGE_SUCCESS_DELETE_NOTES
+        assert data["data"] == {"deleted": 1, "missing": 1}
+
+    @pytest.mark.unit
+    def test_passes_object_ids_and_chunk_size_to_service(self, app: Flask) -> None:
+        ids: list[ObjectId] = [ObjectId(), ObjectId()]
+        with (
+            app.test_request_context(
+                "/api/v1/notes/bulk-delete", method="POST", json={"ids": [str(_id) for _id in ids]}
+            ),
+            patch(
+                "src.controllers.note_controller.NoteService.delete_notes_by_ids",
+                return_value={"deleted": 2, "missing": 0},
+            ) as mock_delete,
+        ):
+            delete_notes_bulk()
+        mock_delete.assert_called_once_with(ids, app.config["NOTES_BULK_DELETE_CHUNK_SIZE"])
+
+    @pytest.mark.unit
+    def test_raises_validation_error_for_invalid_id(self, app: Flask) -> None:
+        with (
+            app.test_request_context(
+                "/api/v1/notes/bulk-delete", method="POST", json={"ids": [str(ObjectId()), "not_a_valid_id"]}
+            ),
+            patch("src.controllers.note_controller.NoteService.delete_notes_by_ids") as mock_delete,
+            pytest.raises(ValidationAPIError) as exc_info,
+        ):
+            delete_notes_bulk()
+        mock_delete.assert_not_called()
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.unit
+    def test_raises_validation_error_for_empty_ids(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/bulk-delete", method="POST", json={"ids": []}),
+            pytest.raises(ValidationAPIError),
+        ):
+            delete_notes_bulk()
+
+    @pytest.mark.unit
+    def test_raises_validation_error_for_array_body(self, app: Flask) -> None:
+        with (
+            app.test_request_context("/api/v1/notes/bulk-delete", method="POST", json=["abc"]),
+            pytest.raises(ValidationAPIError) as exc_info,
+        ):
+            delete_notes_bulk()
+        assert exc_info.value.status_code == 400
@@ -1,11 +1,37 @@
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from bson import ObjectId
 from pymongo.database import Database
-from pymongo.results import DeleteResult, InsertOneResult
+from pymongo.errors import BulkWriteError
+from pymongo.results import DeleteResult, InsertManyResult, InsertOneResult
 
-from src.data_access.note_dao import NoteDAO
+from src.data_access.note_dao import NAME_COLLATION, WATCHED_OPERATIONS, NoteDAO
+
+
+class TestCreateIndexes:
+    @pytest.mark.unit
+    def test_creates_unique_case_insensitive_name_index(self) -> None:
+        with patch("src.data_access.note_dao.mongo") as mock_mongo:
+            NoteDAO.create_indexes()
+        mock_mongo.db.notes.create_index.assert_called_once_with(
+            [("name", 1)], name="name_ci_unique", unique=True, collation=NAME_COLLATION
+        )
+
+    @pytest.mark.integration
+    def test_index_exists_after_creation(self, app, mongo_db: Database) -> None:
+        NoteDAO.create_indexes()
+        index_names: list[str] = [index["name"] for index in mongo_db.notes.list_indexes()]
+        assert "name_ci_unique" in index_names
+
+
+class TestFindDuplicateNames:
+    @pytest.mark.integration
+    def test_groups_names_that_differ_only_by_case(self, app, mongo_db: Database) -> None:
+        mongo_db.notes.drop_indexes()
+        mongo_db.notes.insert_many([{"name": "Note"}, {"name": "note"}, {"name": "other"}])
+        assert NoteDAO.find_duplicate_names() == [["Note", "note"]]
 
 
 class TestInsertOne:
@@ -18,11 +44,25 @@ class TestInsertOne:
     @pytest.mark.integration
     def test_inserted_document_is_findable(self, app, mongo_db: Database) -> None:
         NoteDAO.insert_one({"name": "findable_note"})
-        found: dict[str, Any] | None = NoteDAO.find_one_by_name("findable_note")
+        found: dict[str, Any] | None = mongo_db.notes.find_one({"name": "findable_note"})
         assert found is not None
         assert found["name"] == "findable_note"
 
 
+class TestInsertMany:
+    @pytest.mark.integration
+    def test_inserts_all_documents(self, app, mongo_db: Database) -> None:
+        result: InsertManyResult = NoteDAO.insert_many([{"name": "many_a"}, {"name": "many_b"}])
+        assert len(result.inserted_ids) == 2
+
+    @pytest.mark.integration
+    def test_continues_past_duplicates(self, app, mongo_db: Database) -> None:
+        NoteDAO.insert_one({"name": "taken"})
+        with pytest.raises(BulkWriteError):
+            NoteDAO.insert_many([{"name": "taken"}, {"name": "free"}])
+        assert mongo_db.notes.find_one({"name": "free"}) is not None
+
+
 class TestFind:
     @pytest.mark.integration
     def test_returns_empty_list_when_no_documents(self, app, mongo_db: Database) -> None:
@@ -37,51 +77,99 @@ class TestFind:
         assert len(result) == 2
 
     @pytest.mark.integration
-    def test_documents_have_string_id(self, app, mongo_db: Database) -> None:
+    def test_documents_have_objectid(self, app, mongo_db: Database) -> None:
         NoteDAO.insert_one({"name": "typed_id"})
         result: list[dict[str, Any]] = NoteDAO.find()
-        assert isinstance(result[0]["_id"], str)
+        assert isinstance(result[0]["_id"], ObjectId)
 
+    @pytest.mark.unit
+    def test_returns_driver_documents_without_copying(self) -> None:
+        docs: list[dict[str, Any]] = [{"_id": ObjectId(), "name": "a"}, {"_id": ObjectId(), "name": "b"}]
+        with patch("src.data_access.note_dao.mongo") as mock_mongo:
+            mock_mongo.db.notes.find.return_value = iter(docs)
+            result: list[dict[str, Any]] = NoteDAO.find()
+        assert all(returned is doc for returned, doc in zip(result, docs, strict=True))
 
-class TestFindOneById:
     @pytest.mark.integration
-    def test_returns_document_when_found(self, app, mongo_db: Database) -> None:
-        insert_result: InsertOneResult = NoteDAO.insert_one({"name": "by_id"})
-        _id: ObjectId = insert_result.inserted_id
-        found: dict[str, Any] | None = NoteDAO.find_one_by_id(_id)
-        assert found is not None
-        assert found["name"] == "by_id"
+    def test_projects_requested_fields(self, app, mongo_db: Database) -> None:
+        NoteDAO.insert_one({"name": "projected", "body": "not requested"})
+        result: list[dict[str, Any]] = NoteDAO.find(["name"])
+        assert set(result[0]) == {"_id", "name"}
+
+
+class TestProjection:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("fields", [None, []])
+    def test_returns_none_without_fields(self, fields: list[str] | None) -> None:
+        assert NoteDAO.projection(fields) is None
+
+    @pytest.mark.unit
+    def test_includes_requested_fields(self) -> None:
+        assert NoteDAO.projection(["name"]) == {"name": 1}
 
+
+class TestFindPage:
     @pytest.mark.integration
-    def test_returns_none_when_not_found(self, app, mongo_db: Database) -> None:
-        result: dict[str, Any] | None = NoteDAO.find_one_by_id(ObjectId())
-        assert result is None
+    def test_returns_at_most_limit_documents(self, app, mongo_db: Database) -> None:
+        for name in ("a", "b", "c"):
+            NoteDAO.insert_one({"name": name})
+        result: list[dict[str, Any]] = NoteDAO.find_page(2)
+        assert [doc["name"] for doc in result] == ["a", "b"]
 
     @pytest.mark.integration
-    def test_returned_document_has_string_id(self, app, mongo_db: Database) -> None:
-        insert_result: InsertOneResult = NoteDAO.insert_one({"name": "str_id"})
-        found: dict[str, Any] | None = NoteDAO.find_one_by_id(insert_result.inserted_id)
-        assert isinstance(found["_id"], str)
+    def test_returns_documents_after_given_id(self, app, mongo_db: Database) -> None:
+        first: InsertOneResult = NoteDAO.insert_one({"name": "first"})
+        NoteDAO.insert_one({"name": "second"})
+        result: list[dict[str, Any]] = NoteDAO.find_page(10, first.inserted_id)
+        assert [doc["name"] for doc in result] == ["second"]
 
+    @pytest.mark.integration
+    def test_documents_have_objectid(self, app, mongo_db: Database) -> None:
+        NoteDAO.insert_one({"name": "typed_id"})
+        result: list[dict[str, Any]] = NoteDAO.find_page(1)
+        assert isinstance(result[0]["_id"], ObjectId)
 
-class TestFindOneByName:
     @pytest.mark.integration
-    def test_returns_document_when_name_matches(self, app, mongo_db: Database) -> None:
-        NoteDAO.insert_one({"name": "exact_name"})
-        found: dict[str, Any] | None = NoteDAO.find_one_by_name("exact_name")
-        assert found is not None
-        assert found["name"] == "exact_name"
+    def test_projection_keeps_id_for_cursor(self, app, mongo_db: Database) -> None:
+        NoteDAO.insert_one({"name": "projected", "body": "not requested"})
+        result: list[dict[str, Any]] = NoteDAO.find_page(1, fields=["name"])
+        assert set(result[0]) == {"_id", "name"}
+
 
+class TestIterAll:
     @pytest.mark.integration
-    def test_matches_case_insensitively(self, app, mongo_db: Database) -> None:
-        NoteDAO.insert_one({"name": "CaseName"})
-        found: dict[str, Any] | None = NoteDAO.find_one_by_name("casename")
-        assert found is not None
+    def test_yields_all_documents(self, app, mongo_db: Database) -> None:
+        for name in ("a", "b", "c"):
+            NoteDAO.insert_one({"name": name})
+        result: list[dict[str, Any]] = list(NoteDAO.iter_all(batch_size=2))
+        assert sorted(doc["name"] for doc in result) == ["a", "b", "c"]
+
+    @pytest.mark.integration
+    def test_yields_documents_with_objectid(self, app, mongo_db: Database) -> None:
+        NoteDAO.insert_one({"name": "typed_id"})
+        result: list[dict[str, Any]] = list(NoteDAO.iter_all(batch_size=10))
+        assert isinstance(result[0]["_id"], ObjectId)
 
+    @pytest.mark.unit
+    def test_returns_lazy_iterator(self) -> None:
+        result = NoteDAO.iter_all(batch_size=10)
+        assert iter(result) is result
+
+
+class TestVersion:
     @pytest.mark.integration
-    def test_returns_none_when_not_found(self, app, mongo_db: Database) -> None:
-        result: dict[str, Any] | None = NoteDAO.find_one_by_name("nonexistent")
-        assert result is None
+    def test_empty_collection_version(self, app, mongo_db: Database) -> None:
+        assert NoteDAO.version() == ":0"
+
+    @pytest.mark.integration
+    def test_version_changes_on_insert_and_delete(self, app, mongo_db: Database) -> None:
+        first: InsertOneResult = NoteDAO.insert_one({"name": "v_a"})
+        after_first: str = NoteDAO.version()
+        NoteDAO.insert_one({"name": "v_b"})
+        after_second: str = NoteDAO.version()
+        NoteDAO.delete_one_by_id(first.inserted_id)
+        after_delete: str = NoteDAO.version()
+        assert len({after_first, after_second, after_delete}) == 3
 
 
 class TestDeleteOneById:
@@ -97,7 +185,7 @@ class TestDeleteOneById:
         insert_result: InsertOneResult = NoteDAO.insert_one({"name": "gone"})
         _id: ObjectId = insert_result.inserted_id
         NoteDAO.delete_one_by_id(_id)
-        found: dict[str, Any] | None = NoteDAO.find_one_by_id(_id)
+        found: dict[str, Any] | None = mongo_db.notes.find_one({"_id": _id})
         assert found is None
 
     @pytest.mark.integration
@@ -106,46 +194,25 @@ class TestDeleteOneById:
         assert result.deleted_count == 0
 
 
-class TestParseNote:
-    @pytest.mark.unit
-    def test_returns_none_for_falsy_input(self) -> None:
-        result: dict[str, Any] | None = NoteDAO.parse_note(None)
-        assert result is None
-
-    @pytest.mark.unit
-    def test_converts_objectid_to_string(self) -> None:
-        _id: ObjectId = ObjectId()
-        raw: dict[str, Any] = {"_id": _id, "name": "note"}
-        result: dict[str, Any] = NoteDAO.parse_note(raw)
-        assert result["_id"] == str(_id)
-        assert isinstance(result["_id"], str)
-
-    @pytest.mark.unit
-    def test_preserves_other_fields(self) -> None:
-        raw: dict[str, Any] = {"_id": ObjectId(), "name": "preserved"}
-        result: dict[str, Any] = NoteDAO.parse_note(raw)
-        assert result["name"] == "preserved"
-
-    @pytest.mark.unit
-    def test_does_not_include_raw_objectid_in_result(self) -> None:
-        _id: ObjectId = ObjectId()
-        raw: dict[str, Any] = {"_id": _id, "name": "no_raw"}
-        result: dict[str, Any] = NoteDAO.parse_note(raw)
-        assert not isinstance(result["_id"], ObjectId)
+class TestDeleteManyByIds:
+    @pytest.mark.integration
+    def test_deletes_matching_documents(self, app, mongo_db: Database) -> None:
+        first: InsertOneResult = NoteDAO.insert_one({"name": "many_gone_a"})
+        second: InsertOneResult = NoteDAO.insert_one({"name": "many_gone_b"})
+        NoteDAO.insert_one({"name": "many_kept"})
+        result: DeleteResult = NoteDAO.delete_many_by_ids([first.inserted_id, second.inserted_id, ObjectId()])
+        assert result.deleted_count == 2
+        assert mongo_db.notes.find_one({"name": "many_kept"}) is not None
 
 
-class TestParseNotes:
+class TestWatch:
     @pytest.mark.unit
-    def test_returns_empty_list_for_empty_input(self) -> None:
-        result: list[dict[str, Any]] = NoteDAO.parse_notes([])
-        assert result == []
-
-    @pytest.mark.unit
-    def test_parses_all_documents(self) -> None:
-        docs: list[dict[str, Any]] = [
-            {"_id": ObjectId(), "name": "a"},
-            {"_id": ObjectId(), "name": "b"},
-        ]
-        result: list[dict[str, Any]] = NoteDAO.parse_notes(docs)
-        assert len(result) == 2
-        assert all(isinstance(doc["_id"], str) for doc in result)
+    def test_opens_filtered_change_stream(self) -> None:
+        token: dict[str, Any] = {"_data": "token"}
+        with patch("src.data_access.note_dao.mongo") as mock_mongo:
+            NoteDAO.watch(token, 1000)
+        mock_mongo.db.notes.watch.assert_called_once_with(
+            [{"$match": {"operationType": {"$in": WATCHED_OPERATIONS}}}],
+            resume_after=token,
+            max_await_time_ms=1000,
+        )
@@ -1,7 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
-from src.models.note_model import NoteModel
+from src.models.note_model import NoteBulkDeleteModel, NoteBulkModel, NoteModel
 
 
 class TestNoteModel:
@@ -40,3 +40,55 @@ class TestNoteModel:
     def test_name_is_string(self) -> None:
         model: NoteModel = NoteModel(name="string_check")
         assert isinstance(model.name, str)
+
+
+class TestNoteBulkModel:
+    @pytest.mark.unit
+    def test_creates_model_from_list_of_notes(self) -> None:
+        model: NoteBulkModel = NoteBulkModel.model_validate([{"name": "a"}, {"name": "b"}])
+        assert [note.name for note in model.root] == ["a", "b"]
+
+    @pytest.mark.unit
+    def test_items_are_note_models(self) -> None:
+        model: NoteBulkModel = NoteBulkModel.model_validate([{"name": "a"}])
+        assert isinstance(model.root[0], NoteModel)
+
+    @pytest.mark.unit
+    def test_raises_validation_error_for_empty_list(self) -> None:
+        with pytest.raises(ValidationError):
+            NoteBulkModel.model_validate([])
+
+    @pytest.mark.unit
+    def test_raises_validation_error_for_non_list(self) -> None:
+        with pytest.raises(ValidationError):
+            NoteBulkModel.model_validate({"name": "a"})
+
+    @pytest.mark.unit
+    def test_reports_every_invalid_item(self) -> None:
+        with pytest.raises(ValidationError) as exc_info:
+            NoteBulkModel.model_validate([{"name": ""}, {"name": "ok"}, {}])
+        locations: list[tuple] = [error["loc"][:1] for error in exc_info.value.errors()]
+        assert (0,) in locations
+        assert (2,) in locations
+
+
+class TestNoteBulkDeleteModel:
+    @pytest.mark.unit
+    def test_creates_model_with_ids(self) -> None:
+        model: NoteBulkDeleteModel = NoteBulkDeleteModel(ids=["a", "b"])
+        assert model.ids == ["a", "b"]
+
+    @pytest.mark.unit
+    def test_raises_validation_error_for_empty_ids(self) -> None:
+        with pytest.raises(ValidationError):
+            NoteBulkDeleteModel(ids=[])
+
+    @pytest.mark.unit
+    def test_raises_validation_error_when_ids_missing(self) -> None:
+        with pytest.raises(ValidationError):
+            NoteBulkDeleteModel()
+
+    @pytest.mark.unit
+    def test_raises_validation_error_for_extra_fields(self) -> None:
+        with pytest.raises(ValidationError):
+            NoteBulkDeleteModel(ids=["a"], force=True)
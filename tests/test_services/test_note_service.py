@@ -1,36 +1,43 @@
+from collections.abc import Generator
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from bson import ObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from pymongo.results import DeleteResult, InsertOneResult
 
+from src.configs.cache_config import bson_size
 from src.constants.codes import CODE_ALREADY_EXISTS_NOTE, CODE_NOT_FOUND_NOTE
 from src.models.note_model import NoteModel
 from src.services.note_service import NoteService
+from src.utils.cache import TTLCache
 from src.utils.exceptions import ConflictAPIError, NotFoundAPIError
 
 
+@pytest.fixture
+def enabled_cache() -> Generator[TTLCache, None, None]:
+    cache = TTLCache(sizeof=bson_size)
+    cache.configure(enabled=True, ttl_seconds=60, max_entries=16, max_bytes=1024 * 1024)
+    with patch("src.services.note_service.notes_cache", cache):
+        yield cache
+
+
 class TestAddNote:
     @pytest.mark.unit
     def test_adds_note_when_name_does_not_exist(self) -> None:
         model: NoteModel = NoteModel(name="new_note")
         mock_result: MagicMock = MagicMock(spec=InsertOneResult)
-        with (
-            patch("src.services.note_service.NoteDAO.find_one_by_name", return_value=None) as mock_find,
-            patch("src.services.note_service.NoteDAO.insert_one", return_value=mock_result) as mock_insert,
-        ):
+        with patch("src.services.note_service.NoteDAO.insert_one", return_value=mock_result) as mock_insert:
             result = NoteService.add_note(model)
-        mock_find.assert_called_once_with("new_note")
         mock_insert.assert_called_once_with(model.model_dump())
         assert result == mock_result
 
     @pytest.mark.unit
     def test_raises_conflict_when_name_already_exists(self) -> None:
         model: NoteModel = NoteModel(name="existing")
-        existing: dict[str, Any] = {"_id": str(ObjectId()), "name": "existing"}
         with (
-            patch("src.services.note_service.NoteDAO.find_one_by_name", return_value=existing),
+            patch("src.services.note_service.NoteDAO.insert_one", side_effect=DuplicateKeyError("dup")),
             pytest.raises(ConflictAPIError) as exc_info,
         ):
             NoteService.add_note(model)
@@ -39,25 +46,86 @@ class TestAddNote:
     @pytest.mark.unit
     def test_conflict_error_has_409_status(self) -> None:
         model: NoteModel = NoteModel(name="existing")
-        existing: dict[str, Any] = {"_id": str(ObjectId()), "name": "existing"}
         with (
-            patch("src.services.note_service.NoteDAO.find_one_by_name", return_value=existing),
+            patch("src.services.note_service.NoteDAO.insert_one", side_effect=DuplicateKeyError("dup")),
             pytest.raises(ConflictAPIError) as exc_info,
         ):
             NoteService.add_note(model)
         assert exc_info.value.status_code == 409
 
+
+def _fake_insert_many(documents: list[dict[str, Any]]) -> None:
+    for document in documents:
+        document["_id"] = ObjectId()
+
+
+class TestAddNotes:
+    @pytest.mark.unit
+    def test_inserts_all_notes_in_one_call(self) -> None:
+        models: list[NoteModel] = [NoteModel(name="a"), NoteModel(name="b")]
+        with patch("src.services.note_service.NoteDAO.insert_many", side_effect=_fake_insert_many) as mock_insert_many:
+            NoteService.add_notes(models)
+        mock_insert_many.assert_called_once()
+        assert [doc["name"] for doc in mock_insert_many.call_args.args[0]] == ["a", "b"]
+
     @pytest.mark.unit
-    def test_does_not_call_insert_when_conflict(self) -> None:
-        model: NoteModel = NoteModel(name="dup")
-        existing: dict[str, Any] = {"_id": str(ObjectId()), "name": "dup"}
+    def test_reports_inserted_ids_by_index(self) -> None:
+        models: list[NoteModel] = [NoteModel(name="a"), NoteModel(name="b")]
+        with patch("src.services.note_service.NoteDAO.insert_many", side_effect=_fake_insert_many):
+            result: dict[str, list[dict[str, Any]]] = NoteService.add_notes(models)
+        assert [item["index"] for item in result["inserted"]] == [0, 1]
+        assert all(isinstance(item["_id"], str) for item in result["inserted"])
+        assert result["conflicts"] == []
+
+    @pytest.mark.unit
+    def test_dedupes_names_case_insensitively_within_batch(self) -> None:
+        models: list[NoteModel] = [NoteModel(name="Dup"), NoteModel(name="other"), NoteModel(name="dUP")]
+        with patch("src.services.note_service.NoteDAO.insert_many", side_effect=_fake_insert_many) as mock_insert_many:
+            result: dict[str, list[dict[str, Any]]] = NoteService.add_notes(models)
+        assert [doc["name"] for doc in mock_insert_many.call_args.args[0]] == ["Dup", "other"]
+        assert result["conflicts"] == [{"index": 2, "name": "dUP"}]
+
+    @pytest.mark.unit
+    def test_reports_duplicate_key_errors_as_conflicts(self) -> None:
+        models: list[NoteModel] = [NoteModel(name="existing"), NoteModel(name="new")]
+
+        def insert_many(documents: list[dict[str, Any]]) -> None:
+            _fake_insert_many(documents)
+            raise BulkWriteError({"writeErrors": [{"index": 0, "code": 11000, "errmsg": "dup"}]})
+
+        with patch("src.services.note_service.NoteDAO.insert_many", side_effect=insert_many):
+            result: dict[str, list[dict[str, Any]]] = NoteService.add_notes(models)
+        assert [item["index"] for item in result["inserted"]] == [1]
+        assert result["conflicts"] == [{"index": 0, "name": "existing"}]
+
+    @pytest.mark.unit
+    def test_conflicts_are_sorted_by_index(self) -> None:
+        models: list[NoteModel] = [NoteModel(name="a"), NoteModel(name="b"), NoteModel(name="A")]
+
+        def insert_many(documents: list[dict[str, Any]]) -> None:
+            _fake_insert_many(documents)
+            raise BulkWriteError({"writeErrors": [{"index": 1, "code": 11000, "errmsg": "dup"}]})
+
+        with patch("src.services.note_service.NoteDAO.insert_many", side_effect=insert_many):
+            result: dict[str, list[dict[str, Any]]] = NoteService.add_notes(models)
+        assert [item["index"] for item in result["conflicts"]] == [1, 2]
+
+    @pytest.mark.unit
+    def test_reraises_non_duplicate_write_errors(self) -> None:
+        models: list[NoteModel] = [NoteModel(name="a")]
+        error: BulkWriteError = BulkWriteError({"writeErrors": [{"index": 0, "code": 121, "errmsg": "invalid"}]})
         with (
-            patch("src.services.note_service.NoteDAO.find_one_by_name", return_value=existing),
-            patch("src.services.note_service.NoteDAO.insert_one") as mock_insert,
-            pytest.raises(ConflictAPIError),
+            patch("src.services.note_service.NoteDAO.insert_many", side_effect=error),
+            pytest.raises(BulkWriteError),
         ):
-            NoteService.add_note(model)
-        mock_insert.assert_not_called()
+            NoteService.add_notes(models)
+
+    @pytest.mark.unit
+    def test_does_not_call_insert_for_empty_input(self) -> None:
+        with patch("src.services.note_service.NoteDAO.insert_many") as mock_insert_many:
+            result: dict[str, list[dict[str, Any]]] = NoteService.add_notes([])
+        mock_insert_many.assert_not_called()
+        assert result == {"inserted": [], "conflicts": []}
 
 
 class TestGetAllNotes:
@@ -69,6 +137,12 @@ class TestGetAllNotes:
         mock_find.assert_called_once()
         assert result == expected
 
+    @pytest.mark.unit
+    def test_passes_fields_to_dao(self) -> None:
+        with patch("src.services.note_service.NoteDAO.find", return_value=[]) as mock_find:
+            NoteService.get_all_notes(["name"])
+        mock_find.assert_called_once_with(["name"])
+
     @pytest.mark.unit
     def test_returns_empty_list_when_no_notes(self) -> None:
         with patch("src.services.note_service.NoteDAO.find", return_value=[]):
@@ -86,16 +160,114 @@ class TestGetAllNotes:
         assert len(result) == 2
 
 
+class TestGetNotesPage:
+    @pytest.fixture(autouse=True)
+    def notes_version(self) -> Generator[MagicMock, None, None]:
+        with patch("src.services.note_service.NoteDAO.version", return_value="v1") as mock_version:
+            yield mock_version
+
+    @pytest.mark.unit
+    def test_reads_version_before_page(self, notes_version: MagicMock) -> None:
+        calls: list[str] = []
+        notes_version.side_effect = lambda: calls.append("version") or "v1"
+        with patch("src.services.note_service.NoteDAO.find_page", side_effect=lambda *args: calls.append("page") or []):
+            NoteService.get_notes_page(10)
+        assert calls == ["version", "page"]
+
+    @pytest.mark.unit
+    def test_uses_given_version_without_reading_it_again(self, notes_version: MagicMock) -> None:
+        with patch("src.services.note_service.NoteDAO.find_page", return_value=[]):
+            result, last_id, version = NoteService.get_notes_page(10, None, None, "v0")
+        notes_version.assert_not_called()
+        assert version == "v0"
+
+    @pytest.mark.unit
+    def test_passes_fields_to_dao(self) -> None:
+        with patch("src.services.note_service.NoteDAO.find_page", return_value=[]) as mock_find:
+            NoteService.get_notes_page(10, None, ["name"])
+        mock_find.assert_called_once_with(11, None, ["name"])
+
+    @pytest.mark.unit
+    def test_requests_one_extra_document_from_dao(self) -> None:
+        after: ObjectId = ObjectId()
+        with patch("src.services.note_service.NoteDAO.find_page", return_value=[]) as mock_find:
+            NoteService.get_notes_page(10, after)
+        mock_find.assert_called_once_with(11, after, None)
+
+    @pytest.mark.unit
+    def test_returns_no_cursor_when_page_is_not_full(self) -> None:
+        notes: list[dict[str, Any]] = [{"_id": str(ObjectId()), "name": "a"}]
+        with patch("src.services.note_service.NoteDAO.find_page", return_value=notes):
+            result, last_id, version = NoteService.get_notes_page(2)
+        assert result == notes
+        assert last_id is None
+        assert version == "v1"
+
+    @pytest.mark.unit
+    def test_returns_no_cursor_when_page_is_exactly_full(self) -> None:
+        notes: list[dict[str, Any]] = [{"_id": str(ObjectId()), "name": "a"}, {"_id": str(ObjectId()), "name": "b"}]
+        with patch("src.services.note_service.NoteDAO.find_page", return_value=notes):
+            result, last_id, version = NoteService.get_notes_page(2)
+        assert len(result) == 2
+        assert last_id is None
+
+    @pytest.mark.unit
+    def test_trims_extra_document_and_returns_last_id(self) -> None:
+        notes: list[dict[str, Any]] = [{"_id": str(ObjectId()), "name": name} for name in ("a", "b", "c")]
+        with patch("src.services.note_service.NoteDAO.find_page", return_value=notes):
+            result, last_id, version = NoteService.get_notes_page(2)
+        assert result == notes[:2]
+        assert last_id == ObjectId(notes[1]["_id"])
+
+
+class TestGetNotesVersion:
+    @pytest.mark.unit
+    def test_returns_version_from_dao(self) -> None:
+        with patch("src.services.note_service.NoteDAO.version", return_value="abc:2") as mock_version:
+            assert NoteService.get_notes_version() == "abc:2"
+        mock_version.assert_called_once()
+
+    @pytest.mark.unit
+    def test_version_is_cached(self, enabled_cache: TTLCache) -> None:
+        with patch("src.services.note_service.NoteDAO.version", return_value="abc:2") as mock_version:
+            NoteService.get_notes_version()
+            NoteService.get_notes_version()
+        mock_version.assert_called_once()
+
+
+class TestGetNotesEtag:
+    @pytest.mark.unit
+    def test_is_stable_for_same_inputs(self) -> None:
+        after: ObjectId = ObjectId()
+        assert NoteService.get_notes_etag("v1", 10, after, ["name"]) == NoteService.get_notes_etag(
+            "v1", 10, after, ["name"]
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "args",
+        [("v2", 10, None, None), ("v1", 11, None, None), ("v1", 10, ObjectId(), None), ("v1", 10, None, ["name"])],
+    )
+    def test_changes_with_version_and_request(self, args: tuple[Any, ...]) -> None:
+        assert NoteService.get_notes_etag(*args) != NoteService.get_notes_etag("v1", 10, None, None)
+
+
+class TestExportNotes:
+    @pytest.mark.unit
+    def test_returns_iterator_from_dao(self) -> None:
+        notes: list[dict[str, Any]] = [{"_id": str(ObjectId()), "name": "a"}]
+        with patch("src.services.note_service.NoteDAO.iter_all", return_value=iter(notes)) as mock_iter:
+            result = NoteService.export_notes(50)
+        mock_iter.assert_called_once_with(50)
+        assert list(result) == notes
+
+
 class TestDeleteNoteById:
     @pytest.mark.unit
     def test_deletes_note_when_exists(self) -> None:
         _id: ObjectId = ObjectId()
-        existing: dict[str, Any] = {"_id": str(_id), "name": "to_delete"}
-        mock_result: MagicMock = MagicMock(spec=DeleteResult)
-        with (
-            patch("src.services.note_service.NoteDAO.find_one_by_id", return_value=existing),
-            patch("src.services.note_service.NoteDAO.delete_one_by_id", return_value=mock_result) as mock_delete,
-        ):
+        mock_result: MagicMock = MagicMock(spec=DeleteResult, deleted_count=1)
+        with patch("src.services.note_service.NoteDAO.delete_one_by_id", return_value=mock_result) as mock_delete:
             result = NoteService.delete_note_by_id(_id)
         mock_delete.assert_called_once_with(_id)
         assert result == mock_result
@@ -103,8 +275,9 @@ class TestDeleteNoteById:
     @pytest.mark.unit
     def test_raises_not_found_when_note_does_not_exist(self) -> None:
         _id: ObjectId = ObjectId()
+        mock_result: MagicMock = MagicMock(spec=DeleteResult, deleted_count=0)
         with (
-            patch("src.services.note_service.NoteDAO.find_one_by_id", return_value=None),
+            patch("src.services.note_service.NoteDAO.delete_one_by_id", return_value=mock_result),
             pytest.raises(NotFoundAPIError) as exc_info,
         ):
             NoteService.delete_note_by_id(_id)
@@ -113,20 +286,122 @@ class TestDeleteNoteById:
     @pytest.mark.unit
     def test_not_found_error_has_404_status(self) -> None:
         _id: ObjectId = ObjectId()
+        mock_result: MagicMock = MagicMock(spec=DeleteResult, deleted_count=0)
         with (
-            patch("src.services.note_service.NoteDAO.find_one_by_id", return_value=None),
+            patch("src.services.note_service.NoteDAO.delete_one_by_id", return_value=mock_result),
             pytest.raises(NotFoundAPIError) as exc_info,
         ):
             NoteService.delete_note_by_id(_id)
         assert exc_info.value.status_code == 404
 
+
+class TestDeleteNotesByIds:
+    @pytest.mark.unit
+    def test_deletes_ids_in_chunks(self) -> None:
+        ids: list[ObjectId] = [ObjectId() for _ in range(5)]
+        mock_result: MagicMock = MagicMock(spec=DeleteResult, deleted_count=2)
+        with patch(
+            "src.services.note_service.NoteDAO.delete_many_by_ids", return_value=mock_result
+        ) as mock_delete_many:
+            NoteService.delete_notes_by_ids(ids, chunk_size=2)
+        assert [call.args[0] for call in mock_delete_many.call_args_list] == [ids[0:2], ids[2:4], ids[4:5]]
+
+    @pytest.mark.unit
+    def test_reports_deleted_and_missing_counts(self) -> None:
+        ids: list[ObjectId] = [ObjectId() for _ in range(3)]
+        mock_result: MagicMock = MagicMock(spec=DeleteResult, deleted_count=2)
+        with patch("src.services.note_service.NoteDAO.delete_many_by_ids", return_value=mock_result):
+            result: dict[str, int] = NoteService.delete_notes_by_ids(ids, chunk_size=10)
+        assert result == {"deleted": 2, "missing": 1}
+
     @pytest.mark.unit
-    def test_does_not_call_delete_when_not_found(self) -> None:
+    def test_ignores_repeated_ids(self) -> None:
         _id: ObjectId = ObjectId()
+        mock_result: MagicMock = MagicMock(spec=DeleteResult, deleted_count=1)
+        with patch(
+            "src.services.note_service.NoteDAO.delete_many_by_ids", return_value=mock_result
+        ) as mock_delete_many:
+            result: dict[str, int] = NoteService.delete_notes_by_ids([_id, _id], chunk_size=10)
+        mock_delete_many.assert_called_once_with([_id])
+        assert result == {"deleted": 1, "missing": 0}
+
+
+class TestNotesCache:
+    @pytest.mark.unit
+    def test_repeated_page_reads_hit_cache(self, enabled_cache: TTLCache) -> None:
+        notes: list[dict[str, Any]] = [{"_id": ObjectId(), "name": "a"}]
         with (
-            patch("src.services.note_service.NoteDAO.find_one_by_id", return_value=None),
-            patch("src.services.note_service.NoteDAO.delete_one_by_id") as mock_delete,
-            pytest.raises(NotFoundAPIError),
+            patch("src.services.note_service.NoteDAO.version", return_value="v1"),
+            patch("src.services.note_service.NoteDAO.find_page", return_value=notes) as mock_find,
         ):
-            NoteService.delete_note_by_id(_id)
-        mock_delete.assert_not_called()
+            first = NoteService.get_notes_page(10)
+            second = NoteService.get_notes_page(10)
+        mock_find.assert_called_once()
+        assert first == second == (notes, None, "v1")
+        assert enabled_cache.stats()["hits"] == 1
+
+    @pytest.mark.unit
+    def test_page_cache_key_includes_cursor_and_fields(self, enabled_cache: TTLCache) -> None:
+        with (
+            patch("src.services.note_service.NoteDAO.version", return_value="v1"),
+            patch("src.services.note_service.NoteDAO.find_page", return_value=[]) as mock_find,
+        ):
+            NoteService.get_notes_page(10)
+            NoteService.get_notes_page(10, ObjectId())
+            NoteService.get_notes_page(10, None, ["name"])
+        assert mock_find.call_count == 3
+
+    @pytest.mark.unit
+    def test_repeated_full_reads_hit_cache(self, enabled_cache: TTLCache) -> None:
+        with patch("src.services.note_service.NoteDAO.find", return_value=[]) as mock_find:
+            NoteService.get_all_notes()
+            NoteService.get_all_notes()
+        mock_find.assert_called_once()
+
+    @pytest.mark.unit
+    def test_add_note_invalidates_cache(self, enabled_cache: TTLCache) -> None:
+        enabled_cache.set("key", [])
+        with patch("src.services.note_service.NoteDAO.insert_one"):
+            NoteService.add_note(NoteModel(name="new"))
+        assert enabled_cache.stats()["entries"] == 0
+
+    @pytest.mark.unit
+    def test_failed_add_note_keeps_cache(self, enabled_cache: TTLCache) -> None:
+        enabled_cache.set("key", [])
+        with (
+            patch("src.services.note_service.NoteDAO.insert_one", side_effect=DuplicateKeyError("dup")),
+            pytest.raises(ConflictAPIError),
+        ):
+            NoteService.add_note(NoteModel(name="dup"))
+        assert enabled_cache.stats()["entries"] == 1
+
+    @pytest.mark.unit
+    def test_add_notes_invalidates_cache(self, enabled_cache: TTLCache) -> None:
+        enabled_cache.set("key", [])
+        with patch(
+            "src.services.note_service.NoteDAO.insert_many",
+            side_effect=lambda documents: [document.setdefault("_id", ObjectId()) for document in documents],
+        ):
+            NoteService.add_notes([NoteModel(name="a")])
+        assert enabled_cache.stats()["entries"] == 0
+
+    @pytest.mark.unit
+    def test_delete_note_invalidates_cache(self, enabled_cache: TTLCache) -> None:
+        enabled_cache.set("key", [])
+        with patch("src.services.note_service.NoteDAO.delete_one_by_id", return_value=MagicMock(deleted_count=1)):
+            NoteService.delete_note_by_id(ObjectId())
+        assert enabled_cache.stats()["entries"] == 0
+
+    @pytest.mark.unit
+    def test_delete_notes_invalidates_cache_when_something_was_deleted(self, enabled_cache: TTLCache) -> None:
+        enabled_cache.set("key", [])
+        with patch("src.services.note_service.NoteDAO.delete_many_by_ids", return_value=MagicMock(deleted_count=1)):
+            NoteService.delete_notes_by_ids([ObjectId()], chunk_size=10)
+        assert enabled_cache.stats()["entries"] == 0
+
+    @pytest.mark.unit
+    def test_delete_notes_keeps_cache_when_nothing_was_deleted(self, enabled_cache: TTLCache) -> None:
+        enabled_cache.set("key", [])
+        with patch("src.services.note_service.NoteDAO.delete_many_by_ids", return_value=MagicMock(deleted_count=0)):
+            NoteService.delete_notes_by_ids([ObjectId()], chunk_size=10)
+        assert enabled_cache.stats()["entries"] == 1
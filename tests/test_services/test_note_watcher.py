@@ -0,0 +1,174 @@
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
+
+from src.services.note_watcher import (
+    CHANGE_STREAM_HISTORY_LOST_CODE,
+    CHANGE_STREAM_NOT_SUPPORTED_CODE,
+    NoteWatcher,
+    init_note_watcher,
+    note_watcher,
+)
+
+
+class FakeChangeStream:
+    def __init__(self, changes: list[dict[str, Any] | None]) -> None:
+        self._changes: Iterator[dict[str, Any] | None] = iter(changes)
+        self._remaining = len(changes)
+        self.resume_token: dict[str, Any] | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self._remaining > 0
+
+    def try_next(self) -> dict[str, Any] | None:
+        self._remaining -= 1
+        self.resume_token = {"_data": f"token-{self._remaining}"}
+        return next(self._changes)
+
+    def __enter__(self) -> "FakeChangeStream":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+def make_app_config(**overrides: Any) -> MagicMock:
+    mock_app: MagicMock = MagicMock(spec=Flask)
+    mock_app.config = {
+        "NOTES_CACHE_ENABLED": True,
+        "NOTES_CACHE_WATCH_ENABLED": True,
+        "NOTES_CACHE_WATCH_RETRY_SECONDS": 0.5,
+        **overrides,
+    }
+    return mock_app
+
+
+class TestInitApp:
+    @pytest.mark.unit
+    def test_enables_watcher_from_config(self) -> None:
+        watcher = NoteWatcher()
+        watcher.init_app(make_app_config())
+        assert watcher.enabled is True
+        assert watcher.retry_seconds == 0.5
+
+    @pytest.mark.unit
+    def test_stays_disabled_without_cache(self) -> None:
+        watcher = NoteWatcher()
+        watcher.init_app(make_app_config(NOTES_CACHE_ENABLED=False))
+        assert watcher.enabled is False
+
+    @pytest.mark.unit
+    def test_init_note_watcher_configures_singleton(self) -> None:
+        with patch.object(note_watcher, "init_app") as mock_init:
+            init_note_watcher(make_app_config())
+        mock_init.assert_called_once()
+
+
+class TestConsume:
+    @pytest.mark.unit
+    def test_clears_cache_when_stream_opens_and_on_each_change(self) -> None:
+        stream = FakeChangeStream([None, {"operationType": "insert"}, {"operationType": "delete"}])
+        watcher = NoteWatcher()
+        with (
+            patch("src.services.note_watcher.NoteDAO.watch", return_value=stream),
+            patch("src.services.note_watcher.notes_cache") as mock_cache,
+        ):
+            watcher.consume()
+        assert mock_cache.clear.call_count == 3
+
+    @pytest.mark.unit
+    def test_resumes_from_last_token(self) -> None:
+        watcher = NoteWatcher()
+        watcher.resume_token = {"_data": "previous"}
+        with (
+            patch("src.services.note_watcher.NoteDAO.watch", return_value=FakeChangeStream([None])) as mock_watch,
+            patch("src.services.note_watcher.notes_cache"),
+        ):
+            watcher.consume()
+        mock_watch.assert_called_once_with({"_data": "previous"}, watcher.max_await_time_ms)
+        assert watcher.resume_token == {"_data": "token-0"}
+
+    @pytest.mark.unit
+    def test_invalidate_drops_resume_token(self) -> None:
+        watcher = NoteWatcher()
+        with (
+            patch(
+                "src.services.note_watcher.NoteDAO.watch",
+                return_value=FakeChangeStream([{"operationType": "invalidate"}]),
+            ),
+            patch("src.services.note_watcher.notes_cache"),
+        ):
+            watcher.consume()
+        assert watcher.resume_token is None
+
+
+class TestRun:
+    @pytest.mark.unit
+    def test_stops_when_change_streams_are_not_supported(self) -> None:
+        watcher = NoteWatcher()
+        error = OperationFailure("not a replica set", code=CHANGE_STREAM_NOT_SUPPORTED_CODE)
+        with patch.object(watcher, "consume", side_effect=error) as mock_consume:
+            watcher.run()
+        mock_consume.assert_called_once()
+
+    @pytest.mark.unit
+    def test_retries_after_connection_errors(self) -> None:
+        watcher = NoteWatcher()
+        watcher.retry_seconds = 0
+
+        def fail_then_stop() -> None:
+            if mock_consume.call_count == 2:
+                watcher._stop.set()
+            raise ServerSelectionTimeoutError("down")
+
+        with patch.object(watcher, "consume", side_effect=fail_then_stop) as mock_consume:
+            watcher.run()
+        assert mock_consume.call_count == 2
+
+    @pytest.mark.unit
+    def test_drops_resume_token_when_history_is_lost(self) -> None:
+        watcher = NoteWatcher()
+        watcher.retry_seconds = 0
+        watcher.resume_token = {"_data": "expired"}
+
+        def history_lost() -> None:
+            watcher._stop.set()
+            raise OperationFailure("history lost", code=CHANGE_STREAM_HISTORY_LOST_CODE)
+
+        with patch.object(watcher, "consume", side_effect=history_lost):
+            watcher.run()
+        assert watcher.resume_token is None
+
+
+class TestStartStop:
+    @pytest.mark.unit
+    def test_start_is_noop_when_disabled(self) -> None:
+        watcher = NoteWatcher()
+        watcher.start()
+        assert watcher.running is False
+
+    @pytest.mark.unit
+    def test_start_runs_background_thread_until_stopped(self) -> None:
+        watcher = NoteWatcher()
+        watcher.enabled = True
+        with patch.object(watcher, "consume", side_effect=lambda: watcher._stop.wait()):
+            watcher.start()
+            assert watcher.running is True
+            watcher.stop(timeout=5)
+        assert watcher.running is False
+
+    @pytest.mark.unit
+    def test_start_twice_keeps_single_thread(self) -> None:
+        watcher = NoteWatcher()
+        watcher.enabled = True
+        with patch.object(watcher, "consume", side_effect=lambda: watcher._stop.wait()):
+            watcher.start()
+            thread = watcher._thread
+            watcher.start()
+            assert watcher._thread is thread
+            watcher.stop(timeout=5)
@@ -0,0 +1,107 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+from pymongo.errors import ServerSelectionTimeoutError
+
+from src.services.readiness_probe import ReadinessProbe, init_readiness_probe, readiness_probe
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_probe(clock: FakeClock, cache_seconds: float = 2.0) -> ReadinessProbe:
+    probe = ReadinessProbe(clock=clock)
+    probe.cache_seconds = cache_seconds
+    return probe
+
+
+class TestReadinessProbe:
+    @pytest.mark.unit
+    def test_init_app_reads_config_and_forgets_result(self) -> None:
+        probe = ReadinessProbe()
+        probe.ready = True
+        mock_app: MagicMock = MagicMock(spec=Flask)
+        mock_app.config = {"READINESS_CACHE_SECONDS": 3, "READINESS_PING_TIMEOUT_MS": 250}
+        probe.init_app(mock_app)
+        assert (probe.cache_seconds, probe.timeout_seconds, probe.ready) == (3, 0.25, None)
+
+    @pytest.mark.unit
+    def test_pings_once_per_cache_window(self) -> None:
+        clock = FakeClock()
+        probe = make_probe(clock)
+        with patch("src.services.readiness_probe.mongo") as mock_mongo:
+            assert all(probe.check() for _ in range(100))
+            assert mock_mongo.db.command.call_count == 1
+
+            clock.now += 2.0
+            assert probe.check() is True
+            assert mock_mongo.db.command.call_count == 2
+
+    @pytest.mark.unit
+    def test_caches_failures_too(self) -> None:
+        clock = FakeClock()
+        probe = make_probe(clock)
+        with patch("src.services.readiness_probe.mongo") as mock_mongo:
+            mock_mongo.db.command.side_effect = ServerSelectionTimeoutError("down")
+            assert probe.check() is False
+            assert probe.check() is False
+            assert mock_mongo.db.command.call_count == 1
+
+            mock_mongo.db.command.side_effect = None
+            clock.now += 2.0
+            assert probe.check() is True
+
+    @pytest.mark.unit
+    def test_bounds_ping_with_timeout(self) -> None:
+        probe = make_probe(FakeClock())
+        probe.timeout_seconds = 0.5
+        with (
+            patch("src.services.readiness_probe.mongo"),
+            patch("src.services.readiness_probe.pymongo.timeout") as mock_timeout,
+        ):
+            probe.check()
+        mock_timeout.assert_called_once_with(0.5)
+
+    @pytest.mark.unit
+    def test_serves_last_result_while_another_caller_pings(self) -> None:
+        clock = FakeClock()
+        probe = make_probe(clock)
+        probe.ready, probe.checked_at = True, clock.now
+        clock.now += 5.0
+
+        ping_started, release_ping = threading.Event(), threading.Event()
+
+        def slow_ping(*args: object) -> None:
+            ping_started.set()
+            release_ping.wait(5)
+            raise ServerSelectionTimeoutError("down")
+
+        with patch("src.services.readiness_probe.mongo") as mock_mongo:
+            mock_mongo.db.command.side_effect = slow_ping
+            pinger = threading.Thread(target=probe.check)
+            pinger.start()
+            assert ping_started.wait(5)
+
+            assert [probe.check() for _ in range(50)] == [True] * 50
+
+            release_ping.set()
+            pinger.join(5)
+            assert mock_mongo.db.command.call_count == 1
+        assert probe.check() is False
+
+
+class TestInitReadinessProbe:
+    @pytest.mark.unit
+    def test_configures_singleton(self) -> None:
+        mock_app: MagicMock = MagicMock(spec=Flask)
+        mock_app.config = {"READINESS_CACHE_SECONDS": 7, "READINESS_PING_TIMEOUT_MS": 1000}
+        with patch.object(readiness_probe, "init_app") as mock_init:
+            init_readiness_probe(mock_app)
+        mock_init.assert_called_once_with(mock_app)
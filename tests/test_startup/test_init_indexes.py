@@ -0,0 +1,34 @@
+import logging
+from unittest.mock import patch
+
+import pytest
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+from src.startup.init_indexes import create_indexes
+
+
+class TestCreateIndexes:
+    @pytest.mark.unit
+    def test_creates_note_indexes(self) -> None:
+        with patch("src.startup.init_indexes.NoteDAO.create_indexes") as mock_create:
+            assert create_indexes() is True
+        mock_create.assert_called_once()
+
+    @pytest.mark.unit
+    def test_logs_duplicate_names_instead_of_failing(self, caplog: pytest.LogCaptureFixture) -> None:
+        with (
+            patch("src.startup.init_indexes.NoteDAO.create_indexes", side_effect=DuplicateKeyError("dup", 11000)),
+            patch("src.startup.init_indexes.NoteDAO.find_duplicate_names", return_value=[["Note", "note"]]),
+            caplog.at_level(logging.ERROR, logger="src.startup.init_indexes"),
+        ):
+            assert create_indexes() is False
+
+        assert "[['Note', 'note']]" in caplog.text
+
+    @pytest.mark.unit
+    def test_raises_other_failures(self) -> None:
+        with (
+            patch("src.startup.init_indexes.NoteDAO.create_indexes", side_effect=OperationFailure("denied", 13)),
+            pytest.raises(OperationFailure),
+        ):
+            create_indexes()
@@ -0,0 +1,153 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils.cache import MISSING, TTLCache
+from src.utils.metrics import Counter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(
+    clock: FakeClock | None = None, ttl_seconds: float = 10.0, max_entries: int = 10, max_bytes: int = 100
+) -> TTLCache:
+    cache = TTLCache(sizeof=len, clock=clock or FakeClock())
+    cache.configure(enabled=True, ttl_seconds=ttl_seconds, max_entries=max_entries, max_bytes=max_bytes)
+    return cache
+
+
+class TestTTLCache:
+    @pytest.mark.unit
+    def test_disabled_cache_always_misses(self) -> None:
+        cache = TTLCache(sizeof=len)
+        cache.set("key", "value")
+        assert cache.get("key") is MISSING
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.unit
+    def test_returns_stored_value_and_counts_hit(self) -> None:
+        cache = make_cache()
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.unit
+    def test_counts_miss_for_unknown_key(self) -> None:
+        cache = make_cache()
+        assert cache.get("unknown") is MISSING
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.unit
+    def test_entry_expires_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache = make_cache(clock, ttl_seconds=5)
+        cache.set("key", "value")
+        clock.now = 5.0
+        assert cache.get("key") is MISSING
+        assert cache.stats()["bytes"] == 0
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used_entry_over_max_entries(self) -> None:
+        cache = make_cache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == "1"
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.unit
+    def test_evicts_until_under_max_bytes(self) -> None:
+        cache = make_cache(max_bytes=10)
+        cache.set("a", "xxxx")
+        cache.set("b", "xxxx")
+        cache.set("c", "xxxx")
+        assert cache.get("a") is MISSING
+        assert cache.stats()["bytes"] == 8
+
+    @pytest.mark.unit
+    def test_skips_values_larger_than_max_bytes(self) -> None:
+        cache = make_cache(max_bytes=3)
+        cache.set("key", "xxxx")
+        assert cache.get("key") is MISSING
+
+    @pytest.mark.unit
+    def test_replacing_key_updates_byte_count(self) -> None:
+        cache = make_cache()
+        cache.set("key", "xxxx")
+        cache.set("key", "xx")
+        assert cache.stats()["bytes"] == 2
+        assert cache.stats()["entries"] == 1
+
+    @pytest.mark.unit
+    def test_get_or_load_calls_loader_once(self) -> None:
+        cache = make_cache()
+        loader: MagicMock = MagicMock(return_value="value")
+        first: Any = cache.get_or_load("key", loader)
+        second: Any = cache.get_or_load("key", loader)
+        assert first == second == "value"
+        loader.assert_called_once()
+
+    @pytest.mark.unit
+    def test_clear_drops_entries_and_keeps_counters(self) -> None:
+        cache = make_cache()
+        cache.set("key", "value")
+        cache.get("key")
+        cache.clear()
+        assert cache.get("key") is MISSING
+        assert cache.stats() == {
+            "enabled": True,
+            "entries": 0,
+            "bytes": 0,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+        }
+
+    @pytest.mark.unit
+    def test_configure_clears_entries(self) -> None:
+        cache = make_cache()
+        cache.set("key", "value")
+        cache.configure(enabled=True, ttl_seconds=1, max_entries=1, max_bytes=10)
+        assert cache.get("key") is MISSING
+
+    @pytest.mark.unit
+    def test_get_or_load_discards_result_loaded_across_clear(self) -> None:
+        cache = make_cache()
+
+        def loader() -> str:
+            cache.clear()
+            return "stale"
+
+        assert cache.get_or_load("key", loader) == "stale"
+        assert cache.get("key") is MISSING
+
+    @pytest.mark.unit
+    def test_get_or_load_discards_result_loaded_across_configure(self) -> None:
+        cache = make_cache()
+
+        def loader() -> str:
+            cache.configure(enabled=True, ttl_seconds=10, max_entries=10, max_bytes=100)
+            return "stale"
+
+        cache.get_or_load("key", loader)
+        assert cache.get("key") is MISSING
+
+    @pytest.mark.unit
+    def test_records_events_on_given_counter(self) -> None:
+        events = Counter("events_total", "Events.", ("event",))
+        cache = TTLCache(sizeof=len, clock=FakeClock(), events=events)
+        cache.configure(enabled=True, ttl_seconds=10, max_entries=1, max_bytes=100)
+        cache.get("a")
+        cache.set("a", "1")
+        cache.get("a")
+        cache.set("b", "2")
+        assert events.snapshot() == {("miss",): 1.0, ("hit",): 1.0, ("eviction",): 1.0}
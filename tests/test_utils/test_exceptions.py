@@ -12,6 +12,7 @@ from src.utils.exceptions import (
     ConflictAPIError,
     InternalAPIError,
     NotFoundAPIError,
+    ServiceUnavailableAPIError,
     ValidationAPIError,
 )
 
@@ -224,6 +225,22 @@ class TestBusinessAPIError:
         assert error.status_code == 422
 
 
+class TestServiceUnavailableAPIError:
+    @pytest.mark.unit
+    def test_has_503_status_code(self) -> None:
+        assert ServiceUnavailableAPIError.status_code == 503
+
+    @pytest.mark.unit
+    def test_is_subclass_of_base_api_error(self) -> None:
+        assert issubclass(ServiceUnavailableAPIError, BaseAPIError)
+
+    @pytest.mark.unit
+    def test_instance_has_503_status(self) -> None:
+        error: ServiceUnavailableAPIError = ServiceUnavailableAPIError(code="C", message="m")
+
+        assert error.status_code == 503
+
+
 class TestInternalAPIError:
     @pytest.mark.unit
     def test_has_500_status_code(self) -> None:
@@ -1,8 +1,9 @@
 from typing import Any
 
 import pytest
+from bson import ObjectId
 
-from src.utils.helpers import is_positive_integer
+from src.utils.helpers import decode_cursor, encode_cursor, is_positive_integer
 
 
 class TestIsPositiveInteger:
@@ -50,3 +51,26 @@ class TestIsPositiveInteger:
     )
     def test_returns_expected(self, value: Any, expected: bool) -> None:
         assert is_positive_integer(value) is expected
+
+
+class TestCursor:
+    @pytest.mark.unit
+    def test_round_trips_object_id(self) -> None:
+        _id: ObjectId = ObjectId()
+        assert decode_cursor(encode_cursor(_id)) == _id
+
+    @pytest.mark.unit
+    def test_encoded_cursor_is_url_safe(self) -> None:
+        cursor: str = encode_cursor(ObjectId())
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    @pytest.mark.unit
+    def test_encoded_cursor_is_not_plain_hex_id(self) -> None:
+        _id: ObjectId = ObjectId()
+        assert encode_cursor(_id) != str(_id)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("cursor", ["abc", "not_a_cursor", "!!!!"])
+    def test_decode_raises_for_invalid_cursor(self, cursor: str) -> None:
+        with pytest.raises(Exception):  # noqa: B017
+            decode_cursor(cursor)
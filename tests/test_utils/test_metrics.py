@@ -0,0 +1,162 @@
+import os
+
+import pytest
+
+from src.utils.metrics import (
+    ARCHIVE_FILE,
+    MetricsRegistry,
+    decode_snapshot,
+    encode_snapshot,
+    read_snapshot,
+    read_snapshots,
+    remove_snapshots,
+    snapshot_path,
+    write_snapshot,
+)
+
+
+def make_registry() -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.counter("commands_total", "Commands.", ("name",))
+    registry.gauge("in_flight", "In flight.")
+    registry.histogram("latency_seconds", "Latency.", ("route",), (0.1, 1.0))
+    return registry
+
+
+class TestMetrics:
+    @pytest.mark.unit
+    def test_counter_accumulates_per_label(self) -> None:
+        registry = MetricsRegistry()
+        counter = registry.counter("commands_total", "Commands.", ("name",))
+        counter.inc(("find",))
+        counter.inc(("find",), 2)
+        counter.inc(("insert",))
+        assert counter.snapshot() == {("find",): 3.0, ("insert",): 1.0}
+
+    @pytest.mark.unit
+    def test_gauge_moves_both_ways(self) -> None:
+        gauge = MetricsRegistry().gauge("in_flight", "In flight.")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        assert gauge.snapshot() == {(): 1.0}
+        gauge.set((), 7)
+        assert gauge.snapshot() == {(): 7}
+
+    @pytest.mark.unit
+    def test_histogram_counts_each_bucket_and_sum(self) -> None:
+        histogram = MetricsRegistry().histogram("latency_seconds", "Latency.", ("route",), (1.0, 0.1))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(("a",), value)
+        assert histogram.snapshot() == {("a",): [2.0, 1.0, 1.0, 3.65]}
+
+    @pytest.mark.unit
+    def test_duplicate_names_are_rejected(self) -> None:
+        registry = MetricsRegistry()
+        registry.gauge("in_flight", "In flight.")
+        with pytest.raises(ValueError):
+            registry.counter("in_flight", "Again.")
+
+    @pytest.mark.unit
+    def test_clear_drops_all_series(self) -> None:
+        registry = make_registry()
+        registry.get("in_flight").inc()  # type: ignore[attr-defined]
+        registry.clear()
+        assert registry.snapshot() == {"commands_total": {}, "in_flight": {}, "latency_seconds": {}}
+
+
+class TestRender:
+    @pytest.mark.unit
+    def test_renders_prometheus_text_format(self) -> None:
+        registry = make_registry()
+        registry.get("commands_total").inc(('fi"nd',))  # type: ignore[attr-defined]
+        registry.get("in_flight").inc()  # type: ignore[attr-defined]
+        registry.get("latency_seconds").observe(("/notes",), 0.5)  # type: ignore[attr-defined]
+
+        assert registry.render(registry.snapshot()).splitlines() == [
+            "# HELP commands_total Commands.",
+            "# TYPE commands_total counter",
+            'commands_total{name="fi\\"nd"} 1.0',
+            "# HELP in_flight In flight.",
+            "# TYPE in_flight gauge",
+            "in_flight 1.0",
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{route="/notes",le="0.1"} 0.0',
+            'latency_seconds_bucket{route="/notes",le="1.0"} 1.0',
+            'latency_seconds_bucket{route="/notes",le="+Inf"} 1.0',
+            'latency_seconds_sum{route="/notes"} 0.5',
+            'latency_seconds_count{route="/notes"} 1.0',
+        ]
+
+
+class TestSnapshots:
+    @pytest.mark.unit
+    def test_merge_adds_series_from_every_snapshot(self) -> None:
+        registry = make_registry()
+        merged = registry.merge(
+            [
+                {"commands_total": {("find",): 1.0}, "latency_seconds": {("a",): [1.0, 0.0, 0.0, 0.05]}},
+                {"commands_total": {("find",): 2.0}, "latency_seconds": {("a",): [0.0, 1.0, 0.0, 0.5]}},
+                {"unknown": {(): 1.0}},
+            ]
+        )
+        assert merged == {
+            "commands_total": {("find",): 3.0},
+            "in_flight": {},
+            "latency_seconds": {("a",): [1.0, 1.0, 0.0, 0.55]},
+        }
+
+    @pytest.mark.unit
+    def test_encode_round_trip(self) -> None:
+        snapshot = {"commands_total": {("find",): 3.0}, "latency_seconds": {("a",): [1.0, 0.0, 0.0, 0.05]}}
+        assert decode_snapshot(encode_snapshot(snapshot)) == snapshot
+
+    @pytest.mark.unit
+    def test_read_snapshots_skips_excluded_pid(self, tmp_path) -> None:
+        write_snapshot(snapshot_path(str(tmp_path), 1), {"in_flight": {(): 1.0}})
+        write_snapshot(snapshot_path(str(tmp_path), 2), {"in_flight": {(): 2.0}})
+        assert read_snapshots(str(tmp_path), exclude_pid=2) == [{"in_flight": {(): 1.0}}]
+
+    @pytest.mark.unit
+    def test_read_snapshots_of_missing_directory_is_empty(self, tmp_path) -> None:
+        assert read_snapshots(str(tmp_path / "missing")) == []
+
+    @pytest.mark.unit
+    def test_read_snapshot_ignores_unreadable_files(self, tmp_path) -> None:
+        path = tmp_path / "metrics_1.json"
+        path.write_text("{not json")
+        assert read_snapshot(str(path)) == {}
+        assert read_snapshot(str(tmp_path / "missing.json")) == {}
+
+    @pytest.mark.unit
+    def test_archive_keeps_totals_and_drops_gauges_of_dead_process(self, tmp_path) -> None:
+        registry = make_registry()
+        directory = str(tmp_path)
+        write_snapshot(snapshot_path(directory, 1), {"commands_total": {("find",): 2.0}, "in_flight": {(): 1.0}})
+        write_snapshot(snapshot_path(directory, 2), {"commands_total": {("find",): 3.0}})
+
+        registry.archive(directory, 1)
+        registry.archive(directory, 2)
+        registry.archive(directory, 3)
+
+        assert os.listdir(directory) == [ARCHIVE_FILE]
+        merged = registry.merge(read_snapshots(directory))
+        assert merged["commands_total"] == {("find",): 5.0}
+        assert merged["in_flight"] == {}
+
+    @pytest.mark.unit
+    def test_remove_snapshots_keeps_unrelated_files(self, tmp_path) -> None:
+        write_snapshot(snapshot_path(str(tmp_path), 1), {})
+        write_snapshot(os.path.join(str(tmp_path), ARCHIVE_FILE), {})
+        (tmp_path / "metrics_2.json.tmp").write_text("{}")
+        (tmp_path / "other.json").write_text("{}")
+        (tmp_path / "nested").mkdir()
+        remove_snapshots(str(tmp_path))
+        assert sorted(os.listdir(tmp_path)) == ["nested", "other.json"]
+
+    @pytest.mark.unit
+    def test_remove_snapshots_creates_missing_directory(self, tmp_path) -> None:
+        directory = tmp_path / "metrics"
+        remove_snapshots(str(directory))
+        assert directory.is_dir()